@@ -253,6 +253,7 @@ SOURCES = meanfield/c_main.c \
           meanfield/direct_synapses.c \
           meanfield/meanfield.c \
           meanfield/meanfield_recording.c \
+          meanfield/rate_coupling.c \
           meanfield/spike_processing.c \
           meanfield/population_table/population_table_$(POPULATION_TABLE_IMPL)_impl.c \
           $(MEANFIELD_MODEL) $(SYNAPSE_DYNAMICS) $(WEIGHT_DEPENDENCE) \
@@ -376,4 +377,9 @@ $(BUILD_DIR)meanfield/meanfield_recording.o: $(MODIFIED_DIR)meanfield/meanfield_
 	-@mkdir -p $(dir $@)
 	$(CC) -DLOG_LEVEL=$(NEURON_DEBUG) $(CFLAGS) $(MEANFIELD_INCLUDES) -o $@ $<
 
+$(BUILD_DIR)meanfield/rate_coupling.o: $(MODIFIED_DIR)meanfield/rate_coupling.c
+	# rate_coupling.o
+	-@mkdir -p $(dir $@)
+	$(CC) -DLOG_LEVEL=$(NEURON_DEBUG) $(CFLAGS) -o $@ $<
+
 .PRECIOUS: $(MODIFIED_DIR)%.c $(MODIFIED_DIR)%.h $(LOG_DICT_FILE) $(EXTRA_PRECIOUS)
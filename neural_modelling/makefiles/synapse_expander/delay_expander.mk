@@ -16,6 +16,7 @@
 APP = delay_expander
 SOURCES = synapse_expander/rng.c \
           synapse_expander/common_kernel.c \
+          synapse_expander/common_distance.c \
           synapse_expander/param_generator.c \
           synapse_expander/connection_generator.c \
           synapse_expander/delay_expander.c
@@ -17,6 +17,7 @@ APP = synapse_expander
 BUILD_DIR = build/
 SOURCES = synapse_expander/rng.c \
           synapse_expander/common_kernel.c \
+          synapse_expander/common_distance.c \
           synapse_expander/param_generator.c \
           synapse_expander/connection_generator.c \
           synapse_expander/matrix_generator.c \
@@ -74,7 +74,8 @@ const struct common_priorities COMMON_PRIORITIES = {
 //! From the regions, extract those that are neuron-specific
 const struct neuron_regions NEURON_REGIONS = {
     .neuron_params = NEURON_PARAMS_REGION,
-    .neuron_recording = NEURON_RECORDING_REGION
+    .neuron_recording = NEURON_RECORDING_REGION,
+    .rate_coupling = RATE_COUPLING_REGION
 };
 
 //! From the regions, extract those that are synapse-specific
@@ -40,6 +40,8 @@ struct neuron_regions {
     uint32_t neuron_params;
     //! The neuron recording details
     uint32_t neuron_recording;
+    //! The rates sent and received by meanfields
+    uint32_t rate_coupling;
 };
 
 //! Declare that time exists
@@ -73,6 +75,7 @@ static inline bool initialise_neuron_regions(
     if (!neuron_initialise(
             data_specification_get_region(regions.neuron_params, ds_regions),
             data_specification_get_region(regions.neuron_recording, ds_regions),
+            data_specification_get_region(regions.rate_coupling, ds_regions),
             n_rec_regions_used)) {
         return false;
     }
@@ -53,7 +53,8 @@ enum regions {
     RECORDING_REGION,
     NEURON_PARAMS_REGION,
     NEURON_RECORDING_REGION,
-    SDRAM_PARAMS_REGION
+    SDRAM_PARAMS_REGION,
+    RATE_COUPLING_REGION
 };
 
 //! From the regions, select those that are common
@@ -76,7 +77,8 @@ const struct common_priorities COMMON_PRIORITIES = {
  */
 const struct neuron_regions NEURON_REGIONS = {
     .neuron_params = NEURON_PARAMS_REGION,
-    .neuron_recording = NEURON_RECORDING_REGION
+    .neuron_recording = NEURON_RECORDING_REGION,
+    .rate_coupling = RATE_COUPLING_REGION
 };
 
 //! A region of SDRAM used to transfer synapses
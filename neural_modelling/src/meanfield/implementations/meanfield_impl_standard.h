@@ -32,6 +32,7 @@
 #include <meanfield/additional_inputs/additional_input.h>
 #include <meanfield/threshold_types/threshold_type.h>
 #include <meanfield/synapse_types/synapse_types.h>
+#include <meanfield/rate_coupling.h>
 
 // Further includes
 #include <debug.h>
@@ -333,7 +334,8 @@ static void neuron_impl_load_neuron_parameters(
         next += n_words_needed(n_meanfields * sizeof(additional_input_t));
     }
 
-    meanfield_model_set_global_neuron_params(global_parameters);
+    meanfield_model_set_global_neuron_params(
+            global_parameters, n_steps_per_timestep);
 
 #if LOG_LEVEL >= LOG_DEBUG
     log_debug("-------------------------------------\n");
@@ -431,12 +433,14 @@ static void neuron_impl_do_timestep_update(
 //            input_t external_bias += additional_input_get_input_value_as_current(
 //                    additional_inputs, firing_rate);
 
-            // update neuron parameters
+            // update neuron parameters, driven by the coupled rates too
             state_t result = meanfield_model_state_update(this_meanfield,
                                                           pNetwork_types,
                                                           Pfit_exc_types,
                                                           Pfit_inh_types,
-                                                          mathsbox_types);
+                                                          mathsbox_types,
+                                                          rate_coupling_exc[meanfield_index],
+                                                          rate_coupling_inh[meanfield_index]);
 
             // determine if a spike should occur
             bool spike_now =
@@ -454,8 +458,10 @@ static void neuron_impl_do_timestep_update(
                 // Record the spike
                 neuron_recording_record_bit(SPIKE_RECORDING_BITFIELD, meanfield_index);
 
-                // Send the spike
-                send_spike(timer_count, time, meanfield_index);
+                // Send the spike, unless the rates are sent instead
+                if (!rate_coupling_sends_rates()) {
+                    send_spike(timer_count, time, meanfield_index);
+                }
             }
 
             // Shape the existing input according to the included rule
@@ -469,6 +475,11 @@ static void neuron_impl_do_timestep_update(
             neuron_recording_record_bit(SPIKE_RECORDING_BITFIELD, meanfield_index);
         }
 
+        // Send the updated rates to any coupled meanfields
+        rate_coupling_send(meanfield_index,
+                meanfield_model_get_firing_rate_Ve(this_meanfield),
+                meanfield_model_get_firing_rate_Vi(this_meanfield));
+
 #if LOG_LEVEL >= LOG_DEBUG
         meanfield_model_print_state_variables(this_meanfield);
 #endif // LOG_LEVEL >= LOG_DEBUG
@@ -501,15 +512,63 @@ static void neuron_impl_store_neuron_parameters(
         next += n_words_needed(n_meanfields * sizeof(meanfield_t));
     }
 
-    /*
+    // The rest is written back in the order it was read, so that the host
+    // can read the complete state of every component
     if (sizeof(ParamsFromNetwork_t)) {
-        log_debug("writing input type parameters");
+        log_debug("writing config parameters");
         spin1_memcpy(&address[next], pNetwork_array,
                 n_meanfields * sizeof(ParamsFromNetwork_t));
         next += n_words_needed(n_meanfields * sizeof(ParamsFromNetwork_t));
     }
-    */
 
+    if (sizeof(pFitPolynomial_t)) {
+        log_debug("writing pFitPolynomial exc parameters");
+        spin1_memcpy(&address[next], Pfit_exc_array,
+                n_meanfields * sizeof(pFitPolynomial_t));
+        next += n_words_needed(n_meanfields * sizeof(pFitPolynomial_t));
+    }
+
+    if (sizeof(pFitPolynomial_t)) {
+        log_debug("writing pFitPolynomial inh parameters");
+        spin1_memcpy(&address[next], Pfit_inh_array,
+                n_meanfields * sizeof(pFitPolynomial_t));
+        next += n_words_needed(n_meanfields * sizeof(pFitPolynomial_t));
+    }
+
+    if (sizeof(mathsbox_t)) {
+        log_debug("writing mathsbox parameters");
+        spin1_memcpy(&address[next], mathsbox_array,
+                n_meanfields * sizeof(mathsbox_t));
+        next += n_words_needed(n_meanfields * sizeof(mathsbox_t));
+    }
+
+    if (sizeof(input_type_t)) {
+        log_debug("writing input type parameters");
+        spin1_memcpy(&address[next], input_type_array,
+                n_meanfields * sizeof(input_type_t));
+        next += n_words_needed(n_meanfields * sizeof(input_type_t));
+    }
+
+    if (sizeof(threshold_type_t)) {
+        log_debug("writing threshold type parameters");
+        spin1_memcpy(&address[next], threshold_type_array,
+                n_meanfields * sizeof(threshold_type_t));
+        next += n_words_needed(n_meanfields * sizeof(threshold_type_t));
+    }
+
+    if (sizeof(synapse_param_t)) {
+        log_debug("writing synapse parameters");
+        spin1_memcpy(&address[next], neuron_synapse_shaping_params,
+                n_meanfields * sizeof(synapse_param_t));
+        next += n_words_needed(n_meanfields * sizeof(synapse_param_t));
+    }
+
+    if (sizeof(additional_input_t)) {
+        log_debug("writing additional input type parameters");
+        spin1_memcpy(&address[next], additional_input_array,
+                n_meanfields * sizeof(additional_input_t));
+        next += n_words_needed(n_meanfields * sizeof(additional_input_t));
+    }
 }
 
 /*
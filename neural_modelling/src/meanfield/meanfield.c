@@ -30,6 +30,7 @@
 #include <debug.h>
 #include "../meanfield/implementations/meanfield_impl.h"
 #include "../meanfield/meanfield_recording.h"
+#include "../meanfield/rate_coupling.h"
 #include "../meanfield/plasticity/synapse_dynamics.h"
 
 //! The key to be used for this core (will be ORed with neuron ID)
@@ -96,7 +97,7 @@ bool neuron_resume(void) { // EXPORTED
 
 bool neuron_initialise(
         address_t address, address_t recording_address, // EXPORTED
-        uint32_t *n_rec_regions_used) {
+        address_t rate_coupling_address, uint32_t *n_rec_regions_used) {
     log_debug("neuron_initialise: starting");
 
     /*static inline void test(uint32_t time) {
@@ -160,6 +161,11 @@ bool neuron_initialise(
         return false;
     }
 
+    // set up the rates sent and received
+    if (!rate_coupling_initialise(rate_coupling_address, n_neurons)) {
+        return false;
+    }
+
     // setup recording region
     if (!neuron_recording_initialise(
             recording_address, n_neurons, n_rec_regions_used)) {
@@ -183,6 +189,9 @@ void neuron_do_timestep_update(timer_t time, uint timer_count) { // EXPORTED
     // Prepare recording for the next timestep
     neuron_recording_setup_for_next_recording();
 
+    // Take the rates received up to now as the input for this timestep
+    rate_coupling_update_inputs();
+
     neuron_impl_do_timestep_update(timer_count, time, n_neurons);
 
     log_debug("time left of the timer after tdma is %d", tc[T1_COUNT]);
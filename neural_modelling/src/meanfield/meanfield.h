@@ -48,11 +48,12 @@
 //!             the model
 //! \param[out] incoming_spike_buffer_size: The number of spikes to
 //!             support in the incoming spike circular buffer
+//! \param[in] rate_coupling_address: the rates sent and received, in SDRAM
 //! \param[out] n_rec_regions_used: The number of regions used by neuron recording
 //! \return True if the translation was successful, otherwise False
 bool neuron_initialise(
         address_t address, address_t recording_address,
-        uint32_t *n_rec_regions_used);
+        address_t rate_coupling_address, uint32_t *n_rec_regions_used);
 
 //! \brief executes all the updates to neural parameters when a given timer
 //!        period has occurred.
@@ -68,6 +68,7 @@ static void reset_record_counter(void) {
             // Using rate here so that the zero time is recorded
             recording_info[i].count = recording_info[i].rate;
         }
+        neuron_recording_start_interval(&recording_info[i]);
     }
 
     // clear the bitfields
@@ -97,6 +98,40 @@ static inline uint32_t bitfield_data_size(uint32_t n_neurons) {
     return sizeof(bitfield_values_t) + (get_bit_field_size(n_neurons) * sizeof(uint32_t));
 }
 
+//! \brief sets up how the values of a recording are combined
+//! \param[in] rec_info: the recording to set up
+//! \param[in] mode: the mode word, a ::recording_mode_e and flags
+//! \param[in] n_neurons_rec: the number of recorded columns
+//! \param[in] indexes: the column that each neuron records to
+//! \param[in] n_neurons: the number of neurons on this core
+//! \return Whether the sums could be allocated if needed
+static bool read_recording_mode(
+        recording_info_t *rec_info, uint32_t mode, uint32_t n_neurons_rec,
+        uint8_t *indexes, uint32_t n_neurons) {
+    rec_info->mode = mode & RECORDING_MODE_MASK;
+    rec_info->n_recording = n_neurons_rec;
+    rec_info->n_ticks = 0;
+    rec_info->n_per_index = 1;
+    if (mode & RECORDING_MODE_POPULATION) {
+        // Every recording unit writes to the single column 0
+        rec_info->n_per_index = 0;
+        for (uint32_t n = 0; n < n_neurons; n++) {
+            if (indexes[n] == 0) {
+                rec_info->n_per_index += 1;
+            }
+        }
+    }
+    bool population = (mode & RECORDING_MODE_POPULATION) != 0;
+    rec_info->summed = (rec_info->mode == RECORDING_MODE_MEAN) ||
+            (population && rec_info->mode == RECORDING_MODE_SAMPLE);
+    rec_info->windowed = (rec_info->mode != RECORDING_MODE_SAMPLE);
+    if (!rec_info->summed || rec_info->sums != NULL) {
+        return true;
+    }
+    rec_info->sums = spin1_malloc((n_neurons_rec + 1) * sizeof(int64_t));
+    return rec_info->sums != NULL;
+}
+
 //! \brief reads recording data from SDRAM
 //! \param[in] recording_address: SDRAM location for the recording data
 //! \param[in] n_neurons: the number of neurons to setup for
@@ -112,6 +147,7 @@ static bool neuron_recording_read_in_elements(
         uint32_t rate;
         uint32_t n_neurons_recording;
         uint32_t element_size;
+        uint32_t mode;
         uint8_t indices[ceil_n_entries];
     } neuron_recording_data_t;
 
@@ -141,6 +177,12 @@ static bool neuron_recording_read_in_elements(
         // copy over the indexes
         spin1_memcpy(neuron_recording_indexes[i], data[i].indices,
             n_neurons * sizeof(uint8_t));
+
+        if (!read_recording_mode(&recording_info[i], data[i].mode,
+                n_neurons_rec, neuron_recording_indexes[i], n_neurons)) {
+            log_error("couldn't set up the recording mode for %d", i);
+            return false;
+        }
     }
 
     typedef struct bitfield_recording_data {
@@ -214,8 +256,9 @@ static inline bool allocate_word_dtcm(uint32_t n_neurons) {
     }
 
     for (uint32_t i = 0; i < N_RECORDED_VARS; i++) {
-        // clear recorded values pointer
+        // clear recorded values and sums pointers
         recording_info[i].values = NULL;
+        recording_info[i].sums = NULL;
 
         // allocate dtcm for indexes for each recording region
         neuron_recording_indexes[i] = spin1_malloc(n_neurons * sizeof(uint8_t));
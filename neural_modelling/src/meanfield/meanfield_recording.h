@@ -42,6 +42,24 @@ typedef struct bitfield_values_t {
     uint32_t bits[];
 } bitfield_values_t;
 
+//! How the values seen during a sampling interval are combined
+typedef enum recording_mode_e {
+    //! Record the value seen on the tick the record is made
+    RECORDING_MODE_SAMPLE = 0,
+    //! Record the mean of the values seen during the interval
+    RECORDING_MODE_MEAN = 1,
+    //! Record the minimum of the values seen during the interval
+    RECORDING_MODE_MIN = 2,
+    //! Record the maximum of the values seen during the interval
+    RECORDING_MODE_MAX = 3
+} recording_mode_e;
+
+//! Flag in the mode word marking that all recorded units share one column
+#define RECORDING_MODE_POPULATION 0x100
+
+//! Mask to get the ::recording_mode_e from the mode word
+#define RECORDING_MODE_MASK 0xFF
+
 //! A struct for information for a non-bitfield recording
 typedef struct recording_info_t {
     uint32_t element_size;
@@ -49,6 +67,20 @@ typedef struct recording_info_t {
     uint32_t count;
     uint32_t increment;
     uint32_t size;
+    //! The ::recording_mode_e used to combine values
+    uint32_t mode;
+    //! True if values are summed, either over time or over the population
+    uint32_t summed;
+    //! True if the sums are kept across the ticks of the interval
+    uint32_t windowed;
+    //! The number of units that write to each recorded column
+    uint32_t n_per_index;
+    //! The number of ticks summed so far in this interval
+    uint32_t n_ticks;
+    //! The number of recorded columns
+    uint32_t n_recording;
+    //! The running sums, one per recorded column (plus the spare one)
+    int64_t *sums;
     recording_values_t *values;
 } recording_info_t;
 
@@ -101,8 +133,26 @@ static inline void neuron_recording_record_value(
 static inline void neuron_recording_record_accum(
         uint32_t var_index, uint32_t neuron_index, accum value) {
     uint8_t index = neuron_recording_indexes[var_index][neuron_index];
+    recording_info_t *rec_info = &recording_info[var_index];
     accum *data = (accum *) recording_values[var_index];
-    data[index] = value;
+    if (rec_info->summed) {
+        rec_info->sums[index] += bitsk(value);
+        return;
+    }
+    switch (rec_info->mode) {
+    case RECORDING_MODE_MIN:
+        if (value < data[index]) {
+            data[index] = value;
+        }
+        break;
+    case RECORDING_MODE_MAX:
+        if (value > data[index]) {
+            data[index] = value;
+        }
+        break;
+    default:
+        data[index] = value;
+    }
 }
 
 //! \brief stores a recording of a double variable only; this is faster than
@@ -153,16 +203,36 @@ static inline void neuron_recording_record_bit(
     bit_field_set(bitfield_values[var_index], index);
 }
 
+//! \brief turns the sums of a summed recording into the recorded values
+//! \param[in] rec_info: the recording to finish
+static inline void neuron_recording_finish_sums(recording_info_t *rec_info) {
+    accum *data = (accum *) rec_info->values->data;
+    int64_t n_summed = rec_info->n_per_index;
+    if (rec_info->windowed) {
+        n_summed *= rec_info->n_ticks;
+    }
+    if (n_summed == 0) {
+        return;
+    }
+    for (uint32_t j = 0; j < rec_info->n_recording; j++) {
+        data[j] = kbits((int32_t) (rec_info->sums[j] / n_summed));
+    }
+}
+
 //! \brief does the recording process of handing over to basic recording
 //! \param[in] time: the time to put into the recording stamps.
 static inline void neuron_recording_record(uint32_t time) {
     // go through all recordings
     for (uint32_t i = N_RECORDED_VARS; i > 0; i--) {
         recording_info_t *rec_info = &recording_info[i - 1];
+        rec_info->n_ticks += 1;
         // if the rate says record, record now
         if (rec_info->count == rec_info->rate) {
             // Reset the count
             rec_info->count = 1;
+            if (rec_info->summed) {
+                neuron_recording_finish_sums(rec_info);
+            }
             // Set the time and record the data
             rec_info->values->time = time;
             recording_record(i - 1, rec_info->values, rec_info->size);
@@ -194,8 +264,41 @@ static inline void neuron_recording_record(uint32_t time) {
     }
 }
 
+//! \brief starts a new interval of a recording that combines values
+//! \param[in] rec_info: the recording to start again
+static inline void neuron_recording_start_interval(recording_info_t *rec_info) {
+    rec_info->n_ticks = 0;
+    // Include the spare column used by units that are not recording
+    uint32_t n_columns = rec_info->n_recording + 1;
+    if (rec_info->summed) {
+        for (uint32_t j = 0; j < n_columns; j++) {
+            rec_info->sums[j] = 0;
+        }
+    } else if (rec_info->mode == RECORDING_MODE_MIN
+            || rec_info->mode == RECORDING_MODE_MAX) {
+        accum start = (rec_info->mode == RECORDING_MODE_MIN) ?
+                kbits(INT32_MAX) : kbits(INT32_MIN);
+        accum *data = (accum *) rec_info->values->data;
+        for (uint32_t j = 0; j < n_columns; j++) {
+            data[j] = start;
+        }
+    }
+}
+
 //! \brief sets up state for next recording.
 static inline void neuron_recording_setup_for_next_recording(void) {
+    // Start the combined recordings again at the start of each interval;
+    // population samples only combine the units of a single tick
+    for (uint32_t i = N_RECORDED_VARS; i > 0; i--) {
+        recording_info_t *rec_info = &recording_info[i - 1];
+        if (rec_info->mode == RECORDING_MODE_SAMPLE && !rec_info->summed) {
+            continue;
+        }
+        if (rec_info->count == 1 || !rec_info->windowed) {
+            neuron_recording_start_interval(rec_info);
+        }
+    }
+
     // Reset the bitfields before starting if a beginning of recording
     for (uint32_t i = N_BITFIELD_VARS; i > 0; i--) {
         bitfield_info_t *b_info = &bitfield_info[i - 1];
@@ -53,8 +53,9 @@ typedef global_neuron_params_t* global_neuron_params_pointer_t;
 
 //! \brief set the global neuron parameters
 //! \param[in] params: The parameters to set
+//! \param[in] n_steps_per_timestep: The number of updates done each timestep
 void meanfield_model_set_global_neuron_params(
-        const global_neuron_params_t *params);
+        const global_neuron_params_t *params, uint32_t n_steps_per_timestep);
 
 //! \brief primary function called in timer loop after synaptic updates
 //! \param[in] num_excitatory_inputs: Number of excitatory receptor types.
@@ -81,12 +82,23 @@ state_t meanfield_model_state_update(
 
 
 
+//! \brief Update the state of a meanfield over one of the updates of a
+//!     timestep, i.e. over the timestep divided by the number of updates
+//! \param[in,out] meanfield: The meanfield to update
+//! \param[in] params_from_network: The network parameters
+//! \param[in] Pfit_exc: The excitatory threshold fit
+//! \param[in] Pfit_inh: The inhibitory threshold fit
+//! \param[in] mathsbox: Working space for the error function
+//! \param[in] exc_rate: The excitatory rate coupled in from other meanfields
+//! \param[in] inh_rate: The inhibitory rate coupled in from other meanfields
+//! \return The excitatory rate of the meanfield
 state_t meanfield_model_state_update(
     meanfield_t *restrict meanfield,
     ParamsFromNetwork_t *restrict params_from_network,
     pFitPolynomial_t *restrict Pfit_exc,
     pFitPolynomial_t *restrict Pfit_inh,
-    mathsbox_t *restrict mathsbox);
+    mathsbox_t *restrict mathsbox,
+    REAL exc_rate, REAL inh_rate);
 
 //! \brief Indicates that the neuron has spiked
 //! \param[in, out] neuron pointer to a neuron parameter struct which contains
@@ -28,6 +28,10 @@
 //! The global parameters of the Izhekevich neuron model
 static const global_neuron_params_t *global_params;
 
+//! The time covered by each update, i.e. the machine timestep divided by the
+//! number of updates done each timestep
+static REAL update_h;
+
 /*! \brief For linear membrane voltages, 1.5 is the correct value. However
  * with actual membrane voltage behaviour and tested over an wide range of
  * use cases 1.85 gives slightly better spike timings.
@@ -312,11 +316,85 @@ void TF(REAL Ve, REAL Vi, REAL W,
 }
 
 
+//! The change in the state of a meanfield over one integration step
+typedef struct rk2_step_t {
+    REAL dVe;
+    REAL dVi;
+    REAL dw;
+} rk2_step_t;
+
+//! \brief The absolute value of a ::REAL, without pulling in absfx
+static inline REAL abs_real(REAL x) {
+    return (x < ZERO) ? -x : x;
+}
+
+//! \brief Work out one RK2 midpoint step, with the transfer functions held
+//!     at their values at the start of the step
+//! \param[in] h: The size of the step
+//! \param[in] meanfield: The meanfield at the start of the step
+//! \param[in] lastTF_exc: The excitatory transfer function
+//! \param[in] lastTF_inh: The inhibitory transfer function
+//! \param[out] step: The change in the state over the step
+//! \return The largest difference between the step and an Euler step over
+//!     the same interval, which estimates the local error of the step
+static inline REAL rk2_step(
+        REAL h, const meanfield_t *meanfield, REAL lastTF_exc,
+        REAL lastTF_inh, rk2_step_t *step) {
+    REAL lastVe = meanfield->Ve;
+    REAL lastVi = meanfield->Vi;
+    REAL lastW = meanfield->w;
+
+    REAL tauw = meanfield->tauw;
+    REAL T_inv = meanfield->Timescale_inv;
+    REAL b = meanfield->b;
+
+/***********************************
+ *  RUNGE-KUTTA 2nd order Midpoint *
+ ***********************************/
+
+    REAL k1_exc = (lastTF_exc - lastVe)*T_inv;
+    REAL alpha_exc = lastVe + h*k1_exc;
+    REAL k2_exc = (lastTF_exc - alpha_exc )*T_inv;
+    step->dVe = REAL_HALF(h*(k1_exc + k2_exc));
+
+    REAL k1_inh = (lastTF_inh - lastVi)*T_inv;
+    REAL alpha_inh = lastVi + h*k1_inh;
+    REAL k2_inh = (lastTF_inh - alpha_inh)*T_inv;
+    step->dVi = REAL_HALF(h*(k1_inh + k2_inh));
+
+    REAL k1_W = -lastW/tauw + b * lastVe;
+    REAL alpha_w = lastW + h*k1_W;
+    REAL k2_W = -alpha_w/tauw + b * lastVe;
+    step->dw = REAL_HALF(h*(k1_W+k2_W));
+
+    // An Euler step would move by h*k1, so the two differ by h*(k2-k1)/2
+    REAL error = abs_real(REAL_HALF(h*(k2_exc - k1_exc)));
+    REAL error_inh = abs_real(REAL_HALF(h*(k2_inh - k1_inh)));
+    REAL error_w = abs_real(REAL_HALF(h*(k2_W - k1_W)));
+    if (error_inh > error) {
+        error = error_inh;
+    }
+    if (error_w > error) {
+        error = error_w;
+    }
+    return error;
+}
+
+//! \brief Apply a step to a meanfield
+//! \param[in,out] meanfield: The meanfield to update
+//! \param[in] step: The change to make
+static inline void apply_step(meanfield_t *meanfield, const rk2_step_t *step) {
+    meanfield->Ve += step->dVe;
+    meanfield->Vi += step->dVi;
+    meanfield->w += step->dw;
+}
+
 void RK2_midpoint_MF(REAL h, meanfield_t *meanfield,
                      ParamsFromNetwork_t *restrict pNetwork,
                      pFitPolynomial_t *restrict Pfit_exc,
                      pFitPolynomial_t *restrict Pfit_inh,
-                     mathsbox_t *restrict mathsbox) {
+                     mathsbox_t *restrict mathsbox,
+                     REAL exc_rate, REAL inh_rate) {
     
     /* Propose for now a=0
     *
@@ -326,16 +404,14 @@ void RK2_midpoint_MF(REAL h, meanfield_t *meanfield,
     REAL lastVi = meanfield->Vi;
     REAL lastW = meanfield->w;
     
-    REAL tauw = meanfield->tauw;
-    REAL T_inv = meanfield->Timescale_inv;
-    REAL b = meanfield->b;
-               
-    
-    TF(lastVe, lastVi, lastW, pNetwork, Pfit_exc, mathsbox);    
+    // The coupled rates add to the rates of the meanfield itself
+    TF(lastVe + exc_rate, lastVi + inh_rate, lastW, pNetwork, Pfit_exc,
+       mathsbox);
     REAL lastTF_exc = pNetwork->Fout_th;
     
     
-    TF(lastVe, lastVi, lastW, pNetwork, Pfit_inh, mathsbox);
+    TF(lastVe + exc_rate, lastVi + inh_rate, lastW, pNetwork, Pfit_inh,
+       mathsbox);
     REAL lastTF_inh = pNetwork->Fout_th;
     
 /******************************************************
@@ -344,49 +420,97 @@ void RK2_midpoint_MF(REAL h, meanfield_t *meanfield,
  *   
  *   NEED to give also the error of the method here :
  *   0.5*h^2*u''(t_n) + o(h^2)
+ *   -> this is what rk2_step returns, see Heun_Euler_MF
  *******************************************************/
-    
-    /*
-    
-    REAL k1_exc = (lastTF_exc - lastVe)*T_inv;
-    meanfield->Ve += h * k1_exc ;
-    
-    REAL k1_inh = (lastTF_inh - lastVi)*T_inv;
-    meanfield->Vi += h * k1_inh ;
-    
-    REAL k1_W = -lastW/tauw + meanfield->b * lastVe;
-    meanfield->w += h * k1_W;
-    
-    */
-    
-/***********************************
- *  RUNGE-KUTTA 2nd order Midpoint *
- ***********************************/
-    
-    REAL k1_exc = (lastTF_exc - lastVe)*T_inv;
-    REAL alpha_exc = lastVe + h*k1_exc;
-    REAL k2_exc = (lastTF_exc - alpha_exc )*T_inv;
-    
-    meanfield->Ve += REAL_HALF(h*(k1_exc + k2_exc));
-        
-    REAL k1_inh = (lastTF_inh - lastVi)*T_inv;
-    REAL alpha_inh = lastVi + h*k1_inh;
-    REAL k2_inh = (lastTF_inh - alpha_inh)*T_inv;
-    
-    meanfield->Vi += REAL_HALF(h*(k1_inh + k2_inh));
-    
-    REAL k1_W = -lastW/tauw + b * lastVe;
-    REAL alpha_w = lastW + h*k1_W;
-    REAL k2_W = -alpha_w/tauw + b * lastVe;
- 
-    meanfield->w += REAL_HALF(h*(k1_W+k2_W));
 
+    rk2_step_t step;
+    rk2_step(h, meanfield, lastTF_exc, lastTF_inh, &step);
+    apply_step(meanfield, &step);
+}
 
+//! \brief Integrate over an interval with the embedded Heun-Euler pair,
+//!     adapting the step size of the meanfield to keep the local error
+//!     estimate within the tolerance.
+//!
+//! The step size is halved when a step is rejected and doubled when the
+//! error is well below the tolerance (the local error of the pair goes as
+//! the square of the step), so no square root or division is needed.  The
+//! step that the meanfield ends on is kept for the next interval.  Once the
+//! step size reaches h_min, or max_steps tries have been made, the step is
+//! accepted anyway so that the time taken per tick stays bounded.
+//!
+//! \param[in] interval: The time to integrate over
+//! \param[in,out] meanfield: The meanfield to update
+//! \param[in] pNetwork: The network parameters
+//! \param[in] Pfit_exc: The excitatory threshold fit
+//! \param[in] Pfit_inh: The inhibitory threshold fit
+//! \param[in] mathsbox: Working space for the error function
+//! \param[in] exc_rate: The excitatory rate coupled in from other meanfields
+//! \param[in] inh_rate: The inhibitory rate coupled in from other meanfields
+void Heun_Euler_MF(REAL interval, meanfield_t *meanfield,
+                   ParamsFromNetwork_t *restrict pNetwork,
+                   pFitPolynomial_t *restrict Pfit_exc,
+                   pFitPolynomial_t *restrict Pfit_inh,
+                   mathsbox_t *restrict mathsbox,
+                   REAL exc_rate, REAL inh_rate) {
+    REAL tolerance = global_params->tolerance;
+    REAL h_min = global_params->h_min;
+    REAL h = meanfield->this_h;
+    if (h < h_min) {
+        h = h_min;
+    }
+    REAL remaining = interval;
+    uint32_t n_tries = 0;
+    bool state_changed = true;
+    REAL lastTF_exc = ZERO;
+    REAL lastTF_inh = ZERO;
+    rk2_step_t step;
+
+    while (remaining > ZERO) {
+        n_tries++;
+        if (h > remaining || n_tries >= global_params->max_steps) {
+            // Out of tries means finishing the interval in one go
+            h = remaining;
+        }
+
+        // The transfer functions only change when a step is accepted
+        if (state_changed) {
+            TF(meanfield->Ve + exc_rate, meanfield->Vi + inh_rate,
+                    meanfield->w, pNetwork, Pfit_exc, mathsbox);
+            lastTF_exc = pNetwork->Fout_th;
+            TF(meanfield->Ve + exc_rate, meanfield->Vi + inh_rate,
+                    meanfield->w, pNetwork, Pfit_inh, mathsbox);
+            lastTF_inh = pNetwork->Fout_th;
+            state_changed = false;
+        }
+
+        REAL error = rk2_step(h, meanfield, lastTF_exc, lastTF_inh, &step);
+        if (error > tolerance && h > h_min
+                && n_tries < global_params->max_steps) {
+            // Reject and try again with a smaller step
+            h = REAL_HALF(h);
+            if (h < h_min) {
+                h = h_min;
+            }
+            continue;
+        }
+
+        apply_step(meanfield, &step);
+        state_changed = true;
+        remaining -= h;
+        if (REAL_TWICE(REAL_TWICE(error)) < tolerance
+                && REAL_TWICE(h) <= interval) {
+            h = REAL_TWICE(h);
+        }
+    }
+    meanfield->this_h = h;
 }
 
 void meanfield_model_set_global_neuron_params(
-        const global_neuron_params_t *params) {
+        const global_neuron_params_t *params, uint32_t n_steps_per_timestep) {
     global_params = params;
+    // Each update covers only its share of the timestep
+    update_h = params->machine_timestep_ms / (REAL) n_steps_per_timestep;
 }
 
 /*perhaps when we will do more than one MF we could uses "num_excitatory_inputs" like the number of ex MF and in MF?
@@ -397,7 +521,8 @@ state_t meanfield_model_state_update(
     ParamsFromNetwork_t *restrict pNetwork,
     pFitPolynomial_t *restrict Pfit_exc,
     pFitPolynomial_t *restrict Pfit_inh,
-    mathsbox_t *restrict mathsbox){
+    mathsbox_t *restrict mathsbox,
+    REAL exc_rate, REAL inh_rate){
     /*
         uint16_t num_excitatory_inputs, const input_t *exc_input,
 		uint16_t num_inhibitory_inputs, const input_t *inh_input,
@@ -417,14 +542,26 @@ state_t meanfield_model_state_update(
     //        + external_bias + neuron->I_offset;
     */
 
-    // the best AR update so far
-    RK2_midpoint_MF(meanfield->this_h,
-                    meanfield,
-                    pNetwork,
-                    Pfit_exc,
-                    Pfit_inh,
-                    mathsbox);
-    meanfield->this_h = global_params->machine_timestep_ms;
+    if (global_params->integrator == INTEGRATOR_HEUN_EULER) {
+        // this_h holds the step size the meanfield has adapted to
+        Heun_Euler_MF(update_h,
+                      meanfield,
+                      pNetwork,
+                      Pfit_exc,
+                      Pfit_inh,
+                      mathsbox,
+                      exc_rate, inh_rate);
+    } else {
+        // the best AR update so far
+        RK2_midpoint_MF(update_h,
+                        meanfield,
+                        pNetwork,
+                        Pfit_exc,
+                        Pfit_inh,
+                        mathsbox,
+                        exc_rate, inh_rate);
+        meanfield->this_h = update_h;
+    }
 
     return meanfield->Ve;
 }
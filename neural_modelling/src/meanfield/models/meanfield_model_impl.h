@@ -47,6 +47,14 @@ typedef struct meanfield_t {
     
 } meanfield_t;
 
+//! The integrators that can be used to update the meanfields
+typedef enum integrator_e {
+    //! Fixed steps of the RK2 midpoint method
+    INTEGRATOR_RK2 = 0,
+    //! Embedded Heun-Euler pair with per-meanfield step size control
+    INTEGRATOR_HEUN_EULER = 1
+} integrator_e;
+
 typedef struct global_neuron_params_t {
     // TODO: Add any parameters that apply to the whole model here (i.e. not
     // just to a single neuron)
@@ -55,6 +63,15 @@ typedef struct global_neuron_params_t {
 
     //uint32_t machine_time_step;
     REAL machine_timestep_ms;
+    //! The integrator to use (one of ::integrator_e)
+    uint32_t integrator;
+    //! The largest local error accepted by the adaptive integrator
+    REAL tolerance;
+    //! The smallest step the adaptive integrator will take
+    REAL h_min;
+    //! The most steps the adaptive integrator will try per update, which
+    //! bounds the time taken per timer tick
+    uint32_t max_steps;
 } global_neuron_params_t;
 
 #endif // _NEURON_MODEL_MY_IMPL_H_
@@ -0,0 +1,200 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Implementation of rate_coupling.h
+#include "../meanfield/rate_coupling.h"
+
+#include <debug.h>
+#include <spin1_api.h>
+
+//! Key from meanfield.c
+extern uint32_t key;
+
+//! Whether to use key from meanfield.c
+extern bool use_key;
+
+//! The receptor that a source adds its rates to
+typedef enum rate_receptor_e {
+    RATE_RECEPTOR_EXCITATORY = 0,
+    RATE_RECEPTOR_INHIBITORY = 1
+} rate_receptor_e;
+
+//! A slice of a population whose rates are received, as held in SDRAM
+typedef struct rate_source_t {
+    //! The key of the slice
+    uint32_t key;
+    //! The mask of the slice
+    uint32_t mask;
+    //! The number of meanfields in the slice
+    uint32_t n_pre;
+    //! What to add to the index of a meanfield for its inhibitory rate key
+    uint32_t vi_offset;
+    //! Whether the inhibitory rather than the excitatory rate is used
+    uint32_t source_is_vi;
+    //! The ::rate_receptor_e to add the weighted rates to
+    uint32_t receptor;
+    //! The weights, n_pre rows of one per meanfield on this core
+    REAL weights[];
+} rate_source_t;
+
+//! The rate coupling region
+typedef struct rate_coupling_params_t {
+    //! Whether this core sends rates instead of spikes
+    uint32_t send_rates;
+    //! What to add to the index of a meanfield for its inhibitory rate key
+    uint32_t vi_offset;
+    //! The number of sources that follow
+    uint32_t n_sources;
+    //! The sources, one after the other
+    uint32_t data[];
+} rate_coupling_params_t;
+
+REAL *rate_coupling_exc;
+
+REAL *rate_coupling_inh;
+
+//! Whether this core sends rates instead of spikes
+static bool send_rates;
+
+//! What to add to the index of a meanfield for its inhibitory rate key
+static uint32_t send_vi_offset;
+
+//! The number of meanfields on this core
+static uint32_t n_post;
+
+//! The number of sources
+static uint32_t n_sources;
+
+//! \brief The sources, in the region in SDRAM
+//! \details The weights of a source are a whole matrix, so they are not
+//!     copied into DTCM, where they might not fit
+static rate_source_t **sources;
+
+//! The latest rate received from each meanfield of each source
+static REAL **source_rates;
+
+bool rate_coupling_initialise(void *address, uint32_t n_neurons) {
+    rate_coupling_params_t *params = address;
+    send_rates = params->send_rates;
+    send_vi_offset = params->vi_offset;
+    n_sources = params->n_sources;
+    n_post = n_neurons;
+
+    rate_coupling_exc = spin1_malloc(n_neurons * sizeof(REAL));
+    rate_coupling_inh = spin1_malloc(n_neurons * sizeof(REAL));
+    if (rate_coupling_exc == NULL || rate_coupling_inh == NULL) {
+        log_error("Unable to allocate rate coupling inputs - Out of DTCM");
+        return false;
+    }
+    for (uint32_t j = 0; j < n_neurons; j++) {
+        rate_coupling_exc[j] = ZERO;
+        rate_coupling_inh[j] = ZERO;
+    }
+    if (n_sources == 0) {
+        return true;
+    }
+
+    sources = spin1_malloc(n_sources * sizeof(rate_source_t *));
+    source_rates = spin1_malloc(n_sources * sizeof(REAL *));
+    if (sources == NULL || source_rates == NULL) {
+        log_error("Unable to allocate rate sources - Out of DTCM");
+        return false;
+    }
+    uint32_t *data = params->data;
+    for (uint32_t s = 0; s < n_sources; s++) {
+        sources[s] = (rate_source_t *) data;
+        uint32_t n_pre = sources[s]->n_pre;
+        uint32_t size = sizeof(rate_source_t) + n_pre * n_neurons * sizeof(REAL);
+        source_rates[s] = spin1_malloc(n_pre * sizeof(REAL));
+        if (source_rates[s] == NULL) {
+            log_error("Unable to allocate rate source %u - Out of DTCM", s);
+            return false;
+        }
+        for (uint32_t i = 0; i < n_pre; i++) {
+            source_rates[s][i] = ZERO;
+        }
+        data += size / sizeof(uint32_t);
+        log_debug("Rate source %u: key 0x%08x, mask 0x%08x, %u meanfields",
+                s, sources[s]->key, sources[s]->mask, n_pre);
+    }
+    return true;
+}
+
+bool rate_coupling_receive(uint32_t key, uint32_t payload) {
+    bool found = false;
+    // A key can be the source of more than one projection, so check all
+    for (uint32_t s = 0; s < n_sources; s++) {
+        rate_source_t *source = sources[s];
+        if ((key & source->mask) != source->key) {
+            continue;
+        }
+        found = true;
+        uint32_t index = key & ~source->mask;
+        uint32_t is_vi = index >= source->vi_offset;
+        if (is_vi) {
+            index -= source->vi_offset;
+        }
+        if (is_vi == source->source_is_vi && index < source->n_pre) {
+            source_rates[s][index] = kbits((int32_t) payload);
+        }
+    }
+    return found;
+}
+
+void rate_coupling_update_inputs(void) {
+    for (uint32_t j = 0; j < n_post; j++) {
+        rate_coupling_exc[j] = ZERO;
+        rate_coupling_inh[j] = ZERO;
+    }
+    for (uint32_t s = 0; s < n_sources; s++) {
+        rate_source_t *source = sources[s];
+        REAL *inputs = (source->receptor == RATE_RECEPTOR_INHIBITORY) ?
+                rate_coupling_inh : rate_coupling_exc;
+        REAL *weights = source->weights;
+        for (uint32_t i = 0; i < source->n_pre; i++) {
+            REAL rate = source_rates[s][i];
+            if (rate == ZERO) {
+                weights += n_post;
+                continue;
+            }
+            for (uint32_t j = 0; j < n_post; j++) {
+                inputs[j] += weights[j] * rate;
+            }
+            weights += n_post;
+        }
+    }
+}
+
+void rate_coupling_send(uint32_t neuron_index, REAL Ve, REAL Vi) {
+    if (!send_rates || !use_key) {
+        return;
+    }
+    while (!spin1_send_mc_packet(
+            key | neuron_index, (uint32_t) bitsk(Ve), WITH_PAYLOAD)) {
+        spin1_delay_us(1);
+    }
+    while (!spin1_send_mc_packet(
+            key | (send_vi_offset + neuron_index), (uint32_t) bitsk(Vi),
+            WITH_PAYLOAD)) {
+        spin1_delay_us(1);
+    }
+}
+
+bool rate_coupling_sends_rates(void) {
+    return send_rates;
+}
@@ -0,0 +1,66 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Coupling of meanfields by their rates, sent as payloads of
+//!     multicast packets rather than encoded as spikes.
+//!
+//! A meanfield population that sends rates sends two packets per meanfield
+//! each timestep after it is updated: the excitatory rate with its key and
+//! the inhibitory rate with its key plus an offset.  A population receiving
+//! rates keeps the latest rate of each of its sources, and at the start of
+//! each timestep works out the weighted sum of the rates into each
+//! meanfield, which is added to the rates driving its transfer functions.
+#ifndef _RATE_COUPLING_H_
+#define _RATE_COUPLING_H_
+
+#include <common/neuron-typedefs.h>
+
+//! The weighted excitatory rate into each meanfield this timestep
+extern REAL *rate_coupling_exc;
+
+//! The weighted inhibitory rate into each meanfield this timestep
+extern REAL *rate_coupling_inh;
+
+//! \brief Read the rate coupling region
+//! \param[in] address: The address of the rate coupling region in SDRAM
+//! \param[in] n_neurons: The number of meanfields on this core
+//! \return Whether the region was read successfully
+bool rate_coupling_initialise(void *address, uint32_t n_neurons);
+
+//! \brief Store a rate received from a source
+//! \param[in] key: The key of the packet
+//! \param[in] payload: The payload of the packet, the rate as an accum
+//! \return Whether the packet was from a rate source of this core, in which
+//!     case it must not be treated as a spike
+bool rate_coupling_receive(uint32_t key, uint32_t payload);
+
+//! \brief Work out the rates into each meanfield from the latest received
+//!     rates of the sources; called at the start of each timestep
+void rate_coupling_update_inputs(void);
+
+//! \brief Send the rates of a meanfield if this core sends rates
+//! \param[in] neuron_index: The index of the meanfield on this core
+//! \param[in] Ve: The excitatory rate of the meanfield
+//! \param[in] Vi: The inhibitory rate of the meanfield
+void rate_coupling_send(uint32_t neuron_index, REAL Ve, REAL Vi);
+
+//! \brief Whether this core sends rates instead of spikes
+//! \return True if rates are sent
+bool rate_coupling_sends_rates(void);
+
+#endif // _RATE_COUPLING_H_
@@ -39,5 +39,6 @@ typedef enum neuron_regions_e {
     BIT_FIELD_FILTER_REGION,    //!< bitfield filter; 12
     BIT_FIELD_BUILDER,          //!< bitfield builder parameters; 13
     BIT_FIELD_KEY_MAP,          //!< bitfield key map; 14
-    RECORDING_REGION            //!< general recording data; 15
+    RECORDING_REGION,           //!< general recording data; 15
+    RATE_COUPLING_REGION        //!< meanfield rate coupling; 16
 } regions_e;
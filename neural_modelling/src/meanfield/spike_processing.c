@@ -25,6 +25,7 @@
 #include <recording.h>
 #include "../meanfield/direct_synapses.h"
 #include "../meanfield/population_table/population_table.h"
+#include "../meanfield/rate_coupling.h"
 #include "../meanfield/structural_plasticity/synaptogenesis_dynamics.h"
 #include "../meanfield/synapse_row.h"
 #include "../meanfield/synapses.h"
@@ -326,6 +327,11 @@ static void multicast_packet_pl_received_callback(uint key, uint payload) {
     log_debug("Received spike %x with payload %d at %d, DMA Busy = %d",
         key, payload, time, dma_busy);
 
+    // The payload of a rate is the rate, not a count of spikes
+    if (rate_coupling_receive(key, payload)) {
+        return;
+    }
+
     // cycle through the packet insertion
     bool added = false;
     for (uint count = payload; count > 0; count--) {
@@ -0,0 +1,114 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/**
+ * \file
+ * \brief Common functions for distance-dependent generation
+ */
+#include "common_distance.h"
+#include <stdlib.h>
+#include <stdfix-exp.h>
+
+//! \brief The distance in any direction beyond which the non-linear kernels
+//!     are taken to be 0; this also keeps the squares in range
+#define FAR_DISTANCE 64.0k
+
+//! \brief Beyond this, the exponential of the negative is taken to be 0
+#define MAX_EXPONENT 32.0k
+
+//! \brief Integer square root
+//! \param[in] x: The value to get the square root of
+//! \return The largest integer whose square is no more than \p x
+static uint32_t isqrt(uint64_t x) {
+    uint64_t result = 0;
+    uint64_t bit = 1ull << 62;
+    while (bit > x) {
+        bit >>= 2;
+    }
+    while (bit != 0) {
+        if (x >= result + bit) {
+            x -= result + bit;
+            result = (result >> 1) + bit;
+        } else {
+            result >>= 1;
+        }
+        bit >>= 2;
+    }
+    return (uint32_t) result;
+}
+
+//! \brief The exponential of the negative of a value
+//! \param[in] x: The value, which must not be negative
+//! \return `exp(-x)`
+static inline accum exp_negative(accum x) {
+    if (x > MAX_EXPONENT) {
+        return 0.0k;
+    }
+    return expk(-x);
+}
+
+void grid_position(const position_grid *grid, uint32_t index,
+        accum position[3]) {
+    // Assumes that the index is less than 1<<31
+    div_t yz = div((int) index, (int) grid->n_z);
+    div_t xy = div(yz.quot, (int) grid->n_y);
+    int grid_index[3] = {xy.quot, xy.rem, yz.rem};
+    for (uint32_t i = 0; i < 3; i++) {
+        position[i] = grid->origin[i];
+        for (uint32_t j = 0; j < 3; j++) {
+            position[i] += grid->step[j][i] * grid_index[j];
+        }
+    }
+}
+
+accum distance_dependence_value(const distance_dependence *dependence,
+        const accum pre_position[3], const accum post_position[3]) {
+    // Sum the squares of the differences, with 30 fractional bits
+    bool far = false;
+    uint64_t sum_squares = 0;
+    for (uint32_t i = 0; i < 3; i++) {
+        accum diff = absk(post_position[i] - pre_position[i]);
+        if (diff > FAR_DISTANCE) {
+            far = true;
+        }
+        int64_t diff_bits = bitsk(diff);
+        sum_squares += (uint64_t) (diff_bits * diff_bits);
+    }
+
+    accum kernel;
+    switch (dependence->kernel) {
+    case DISTANCE_GAUSSIAN:
+        kernel = far ? 0.0k : exp_negative(
+                kbits((int32_t) (sum_squares >> 16)));
+        break;
+    case DISTANCE_EXPONENTIAL:
+        kernel = far ? 0.0k : exp_negative(kbits(isqrt(sum_squares)));
+        break;
+    case DISTANCE_BOXCAR:
+        kernel = (!far && (sum_squares < (1ull << 30))) ? 1.0k : 0.0k;
+        break;
+    case DISTANCE_LINEAR: {
+        uint32_t distance = isqrt(sum_squares);
+        kernel = (distance > INT32_MAX) ?
+                kbits(INT32_MAX) : kbits((int32_t) distance);
+        break;
+    }
+    default:
+        kernel = 0.0k;
+    }
+    return dependence->offset + dependence->amplitude * kernel;
+}
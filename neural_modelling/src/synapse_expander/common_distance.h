@@ -0,0 +1,89 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/**
+ * \file
+ * \brief Common functions for distance-dependent generation
+ */
+#ifndef __COMMON_DISTANCE_H__
+#define __COMMON_DISTANCE_H__
+
+#include <common-typedefs.h>
+#include <stdfix.h>
+
+//! \brief A regular grid of neuron positions, in units of the distance scale.
+//!
+//! Neuron \p i is at `origin + ix * step[0] + iy * step[1] + iz * step[2]`,
+//! where `i = (ix * n_y + iy) * n_z + iz`.
+typedef struct position_grid {
+    //! The position of the first neuron
+    accum origin[3];
+    //! The change in position for a step in each index of the grid
+    accum step[3][3];
+    //! The number of neurons along the y-axis
+    uint32_t n_y;
+    //! The number of neurons along the z-axis
+    uint32_t n_z;
+} position_grid;
+
+//! The shapes of distance dependence that are supported
+enum distance_kernels {
+    //! `exp(-d^2 / 2)`
+    DISTANCE_GAUSSIAN,
+    //! `exp(-d)`
+    DISTANCE_EXPONENTIAL,
+    //! 1 if `d < 1`, otherwise 0
+    DISTANCE_BOXCAR,
+    //! `d`
+    DISTANCE_LINEAR
+};
+
+//! \brief A value that depends on the distance between two neurons, as
+//!     `offset + amplitude * kernel(d)`
+typedef struct distance_dependence {
+    //! The shape of the dependence (one of ::distance_kernels)
+    uint32_t kernel;
+    //! The value added to the scaled kernel
+    accum offset;
+    //! The scale of the kernel
+    accum amplitude;
+    //! The positions of the pre-neurons
+    position_grid pre_grid;
+    //! The positions of the post-neurons
+    position_grid post_grid;
+} distance_dependence;
+
+/**
+ * \brief Get the position of a neuron on a grid
+ * \param[in] grid: The grid the neuron is on
+ * \param[in] index: The index of the neuron
+ * \param[out] position: The position of the neuron
+ */
+void grid_position(const position_grid *grid, uint32_t index,
+        accum position[3]);
+
+/**
+ * \brief Get the value of a distance dependence between two neurons
+ * \param[in] dependence: The distance dependence to evaluate
+ * \param[in] pre_position: The position of the pre-neuron
+ * \param[in] post_position: The position of the post-neuron
+ * \return The value for the pair of neurons
+ */
+accum distance_dependence_value(const distance_dependence *dependence,
+        const accum pre_position[3], const accum post_position[3]);
+
+#endif // __COMMON_DISTANCE_H__
@@ -0,0 +1,188 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/**
+ * \file
+ * \brief Distance-Dependent-Probability Connection generator implementation
+ */
+
+#include <synapse_expander/rng.h>
+#include <synapse_expander/generator_types.h>
+#include <synapse_expander/common_distance.h>
+
+//! The parameters that can be copied in from SDRAM
+struct distance_dependent_params {
+    uint32_t pre_lo;
+    uint32_t pre_hi;
+    uint32_t post_lo;
+    uint32_t post_hi;
+    uint32_t allow_self_connections;
+    //! The probability of connection as a function of distance
+    distance_dependence probability;
+};
+
+/**
+ * \brief The data structure to be passed around for this connector.
+ *
+ * This includes the parameters and an RNG.
+ */
+struct distance_dependent {
+    struct distance_dependent_params params;
+    rng_t rng;
+};
+
+/**
+ * \brief Initialise the distance-dependent-probability connection generator
+ * \param[in,out] region: Region to read parameters from.  Should be updated
+ *                        to position just after parameters after calling.
+ * \return A data item to be passed in to other functions later on
+ */
+static void *connection_generator_distance_dependent_initialise(
+        address_t *region) {
+    // Allocate memory for the data
+    struct distance_dependent *obj =
+            spin1_malloc(sizeof(struct distance_dependent));
+
+    // Copy the parameters in
+    struct distance_dependent_params *params_sdram = (void *) *region;
+    obj->params = *params_sdram++;
+    *region = (void *) params_sdram;
+
+    // Initialise the RNG for the connector
+    obj->rng = rng_init(region);
+    log_debug("Distance Dependent Probability Connector, pre_lo = %u, "
+            "pre_hi = %u, post_lo = %u, post_hi = %u, "
+            "allow self connections = %u, kernel = %u, offset = %k, "
+            "amplitude = %k",
+            obj->params.pre_lo, obj->params.pre_hi, obj->params.post_lo,
+            obj->params.post_hi, obj->params.allow_self_connections,
+            obj->params.probability.kernel, obj->params.probability.offset,
+            obj->params.probability.amplitude);
+    return obj;
+}
+
+/**
+ * \brief Free the distance-dependent-probability connection generator
+ * \param[in] generator: The generator to free
+ */
+static void connection_generator_distance_dependent_free(void *generator) {
+    struct distance_dependent *params = generator;
+    rng_free(params->rng);
+    sark_free(generator);
+}
+
+/**
+ * \brief Convert a probability into a value to compare with a random number
+ * \param[in] probability: The probability to convert
+ * \param[out] never: Whether the connection should never be made
+ * \return The largest random number that gives a connection
+ */
+static inline uint32_t probability_threshold(accum probability, bool *never) {
+    *never = (probability <= 0.0k);
+    if (probability >= 1.0k) {
+        return UINT32_MAX;
+    }
+    return ((uint32_t) bitsk(probability)) << 17;
+}
+
+/**
+ * \brief Generate connections with the distance-dependent-probability
+ *        connection generator
+ * \param[in] generator: The generator to use to generate connections
+ * \param[in] pre_slice_start: The start of the slice of the pre-population
+ *                             being generated
+ * \param[in] pre_slice_count: The number of neurons in the slice of the
+ *                             pre-population being generated
+ * \param[in] pre_neuron_index: The index of the neuron in the pre-population
+ *                              being generated
+ * \param[in] post_slice_start: The start of the slice of the post-population
+ *                              being generated
+ * \param[in] post_slice_count: The number of neurons in the slice of the
+ *                              post-population being generated
+ * \param[in] max_row_length: The maximum number of connections to generate
+ * \param[in,out] indices: An array into which the core-relative post-indices
+ *                         should be placed.  This will be initialised to be
+ *                         \p max_row_length in size
+ * \return The number of connections generated
+ */
+static uint32_t connection_generator_distance_dependent_generate(
+        void *generator, UNUSED uint32_t pre_slice_start,
+        UNUSED uint32_t pre_slice_count,
+        uint32_t pre_neuron_index, uint32_t post_slice_start,
+        uint32_t post_slice_count, uint32_t max_row_length, uint16_t *indices) {
+    struct distance_dependent *obj = generator;
+    distance_dependence *probability = &obj->params.probability;
+
+    // If no space, generate nothing
+    if (max_row_length < 1) {
+        return 0;
+    }
+
+    // If not in the pre-population view range, then don't generate
+    if ((pre_neuron_index < obj->params.pre_lo) ||
+            (pre_neuron_index > obj->params.pre_hi)) {
+        return 0;
+    }
+
+    accum pre_position[3];
+    grid_position(&probability->pre_grid, pre_neuron_index, pre_position);
+
+    // Randomly select connections to each post-neuron
+    uint32_t n_conns = 0;
+    for (uint32_t i = 0; i < post_slice_count; i++) {
+        uint32_t post_neuron_index = post_slice_start + i;
+
+        // Disallow self connections if configured
+        if (!obj->params.allow_self_connections &&
+                (pre_neuron_index == post_neuron_index)) {
+            continue;
+        }
+
+        // Don't generate if the value is not in the range of the
+        // post-population view
+        if ((post_neuron_index < obj->params.post_lo) ||
+                (post_neuron_index > obj->params.post_hi)) {
+            continue;
+        }
+
+        // Work out the probability of this connection
+        accum post_position[3];
+        grid_position(&probability->post_grid, post_neuron_index,
+                post_position);
+        bool never;
+        uint32_t threshold = probability_threshold(
+                distance_dependence_value(
+                        probability, pre_position, post_position),
+                &never);
+
+        // Generate a random number, so the sequence doesn't depend on the
+        // probabilities
+        uint32_t value = rng_generator(obj->rng);
+
+        // If less than our probability, generate a connection if possible
+        if (never || (value > threshold)) {
+            continue;
+        }
+        if (n_conns < max_row_length) {
+            indices[n_conns++] = i;
+        } else {
+            log_warning("Row overflow");
+        }
+    }
+
+    return n_conns;
+}
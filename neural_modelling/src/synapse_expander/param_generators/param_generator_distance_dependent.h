@@ -0,0 +1,87 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/**
+ * \file
+ * \brief Parameter generator implementation for distance-dependent values
+ */
+#include <stdfix.h>
+#include <spin1_api.h>
+#include <synapse_expander/common_distance.h>
+#include <synapse_expander/generator_types.h>
+
+//! Distance-dependent parameter generator configuration
+struct param_generator_distance_dependent_params {
+    //! Offset into the postpopulation that the current core's slice starts at
+    uint32_t post_slice_start;
+    //! The value as a function of distance
+    distance_dependence value;
+};
+
+/**
+ * \brief How to initialise the distance-dependent parameter generator
+ * \param[in,out] region: Region to read setup from.  Should be updated
+ *                        to position just after parameters after calling.
+ * \return A data item to be passed in to other functions later on
+ */
+static void *param_generator_distance_dependent_initialize(address_t *region) {
+    struct param_generator_distance_dependent_params *obj =
+            spin1_malloc(sizeof(*obj));
+    struct param_generator_distance_dependent_params *params_sdram =
+            (void *) *region;
+    *obj = *params_sdram++;
+    *region = (void *) params_sdram;
+
+    log_debug("Distance dependent param generator; kernel = %u, "
+            "offset = %k, amplitude = %k", obj->value.kernel,
+            obj->value.offset, obj->value.amplitude);
+    return obj;
+}
+
+/**
+ * \brief How to free any data for the distance-dependent parameter generator
+ * \param[in] generator: The generator to free
+ */
+static void param_generator_distance_dependent_free(void *generator) {
+    sark_free(generator);
+}
+
+/**
+ * \brief How to generate values with the distance-dependent parameter
+ *        generator
+ * \param[in] generator: The generator to use to generate values
+ * \param[in] n_indices: The number of values to generate
+ * \param[in] pre_neuron_index: The index of the neuron in the pre-population
+ *                              being generated
+ * \param[in] indices: The \p n_indices post-neuron indices for each connection
+ * \param[out] values: An array into which to place the values; will be
+ *                     \p n_indices in size
+ */
+static void param_generator_distance_dependent_generate(
+        void *generator, uint32_t n_indices, uint32_t pre_neuron_index,
+        uint16_t *indices, accum *values) {
+    struct param_generator_distance_dependent_params *obj = generator;
+    accum pre_position[3];
+    grid_position(&obj->value.pre_grid, pre_neuron_index, pre_position);
+    for (uint32_t i = 0; i < n_indices; i++) {
+        accum post_position[3];
+        grid_position(&obj->value.post_grid,
+                obj->post_slice_start + indices[i], post_position);
+        values[i] = distance_dependence_value(
+                &obj->value, pre_position, post_position);
+    }
+}
@@ -0,0 +1,143 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.eieio.data_messages import EIEIODataHeader
+
+
+class PackedEIEIODataMessage(object):
+    """ An EIEIO data message whose elements have already been packed into\
+        bytes, which can be sent wherever an EIEIO message can be
+    """
+
+    __slots__ = ["__bytestring", "__n_elements"]
+
+    def __init__(self, bytestring, n_elements):
+        """
+        :param bytes bytestring: The header and elements of the message
+        :param int n_elements: The number of elements in the message
+        """
+        self.__bytestring = bytestring
+        self.__n_elements = n_elements
+
+    @property
+    def bytestring(self):
+        """
+        :rtype: bytes
+        """
+        return self.__bytestring
+
+    @property
+    def n_elements(self):
+        """ The number of elements in the message
+
+        :rtype: int
+        """
+        return self.__n_elements
+
+
+def pack_eieio_data_messages(eieio_type, elements, max_elements):
+    """ Pack elements into as few EIEIO data messages as possible, without\
+        any prefix or payload base
+
+    :param ~spinnman.messages.eieio.EIEIOType eieio_type:
+        The type of the messages
+    :param ~numpy.ndarray elements:
+        The keys to send, or for types with a payload, an array of rows of
+        key and payload
+    :param int max_elements: The maximum number of elements in a message
+    :rtype: list(PackedEIEIODataMessage)
+    :raises ~spinnman.exceptions.SpinnmanInvalidParameterException:
+        If a key or payload doesn't fit in the type
+    """
+    elements = numpy.asarray(elements, dtype="int64")
+    if elements.size and (
+            elements.min() < 0 or elements.max() > eieio_type.max_value):
+        raise SpinnmanInvalidParameterException(
+            "elements", elements,
+            "Not all between 0 and the maximum allowed of {}".format(
+                eieio_type.max_value))
+    data = elements.astype(
+        "<u2" if eieio_type.key_bytes == 2 else "<u4").tobytes()
+    n_elements = len(elements)
+    element_bytes = eieio_type.key_bytes + eieio_type.payload_bytes
+
+    messages = list()
+    full_header = EIEIODataHeader(eieio_type, count=max_elements).bytestring
+    for start in range(0, n_elements, max_elements):
+        count = min(max_elements, n_elements - start)
+        header = full_header
+        if count < max_elements:
+            header = EIEIODataHeader(eieio_type, count=count).bytestring
+        messages.append(PackedEIEIODataMessage(
+            header + data[start * element_bytes:
+                          (start + count) * element_bytes], count))
+    return messages
+
+
+def has_send_target(connection, label):
+    """ Determine if a live event connection has somewhere to send the\
+        events of a vertex; if it doesn't, its messages are dropped
+
+    :param ~spinn_front_end_common.utilities.connections.LiveEventConnection \
+            connection:
+        The connection to send with
+    :param str label: The label of the vertex
+    :rtype: bool
+    """
+    # pylint: disable=protected-access
+    return connection._LiveEventConnection__send_address_details[
+        label] is not None
+
+
+class KeyTables(object):
+    """ The key of each atom of a number of vertices as arrays, so that the\
+        keys of many atoms can be found at once
+    """
+
+    __slots__ = ["__tables"]
+
+    def __init__(self):
+        self.__tables = dict()
+
+    def get_keys(self, label, atom_id_to_key, atom_ids):
+        """ Get the keys of some atoms of a vertex, building the array of\
+            keys of the vertex only when its mapping has changed, e.g.\
+            because the database has been read again
+
+        :param str label: The label of the vertex
+        :param dict(int,int) atom_id_to_key:
+            The mapping from atom ID to key of the vertex
+        :param ~numpy.ndarray atom_ids: The IDs of the atoms
+        :rtype: ~numpy.ndarray
+        :raises ~spinnman.exceptions.SpinnmanInvalidParameterException:
+            If an atom ID isn't one of the atoms of the vertex
+        """
+        mapping, table = self.__tables.get(label, (None, None))
+        if mapping is not atom_id_to_key:
+            table = numpy.fromiter(
+                (atom_id_to_key[atom_id]
+                 for atom_id in range(len(atom_id_to_key))),
+                dtype="uint32", count=len(atom_id_to_key))
+            self.__tables[label] = (atom_id_to_key, table)
+        atom_ids = numpy.asarray(atom_ids, dtype="int64")
+        if atom_ids.size and (
+                atom_ids.min() < 0 or atom_ids.max() >= len(table)):
+            raise SpinnmanInvalidParameterException(
+                "atom_ids", atom_ids,
+                "Not all between 0 and the number of atoms of {} ({})".format(
+                    label, len(table)))
+        return table[atom_ids]
@@ -13,8 +13,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import logging
+import time
+import numpy
+from spinn_utilities.log import FormatAdapter
+from spinnman.messages.eieio import EIEIOType
 from spinn_front_end_common.utilities.connections import LiveEventConnection
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
+from .eieio_packing import (
+    KeyTables, has_send_target, pack_eieio_data_messages)
+
+logger = FormatAdapter(logging.getLogger(__name__))
 
 # The maximum number of 32-bit keys that will fit in a packet
 _MAX_FULL_KEYS_PER_PACKET = 63
@@ -26,7 +35,7 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
     """ A connection for receiving and sending live spikes from and to\
         SpiNNaker
     """
-    __slots__ = []
+    __slots__ = ["__key_tables"]
 
     def __init__(self, receive_labels=None, send_labels=None, local_host=None,
                  local_port=NOTIFY_PORT,
@@ -48,6 +57,7 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
         super().__init__(
             live_packet_gather_label, receive_labels, send_labels,
             local_host, local_port)
+        self.__key_tables = KeyTables()
 
     def send_spike(self, label, neuron_id, send_full_keys=False):
         """ Send a spike from a single neuron
@@ -71,4 +81,84 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
             keys, getting the key for each neuron from the database, or
             whether to send 16-bit neuron IDs directly
         """
-        self.send_events(label, neuron_ids, send_full_keys)
+        self.send_spike_batch(label, neuron_ids, send_full_keys)
+
+    def send_spike_batch(self, labels, neuron_ids, send_full_keys=False):
+        """ Send a number of spikes from any number of populations, packing\
+            as many spikes as possible into each message
+
+        :param labels:
+            The label of the population from which each spike will
+            originate, or a single label from which all the spikes will
+            originate
+        :type labels: str or list(str) or ~numpy.ndarray
+        :param neuron_ids: The ID of the neuron sending each spike
+        :type neuron_ids: list(int) or ~numpy.ndarray
+        :param bool send_full_keys: Determines whether to send full 32-bit
+            keys, getting the key for each neuron from the database, or
+            whether to send 16-bit neuron IDs directly
+        :return: The number of messages sent; spikes from populations that\
+            there is nowhere to send to are not sent
+        :rtype: int
+        """
+        start_time = time.perf_counter()
+        neuron_ids = numpy.asarray(neuron_ids, dtype="int64").ravel()
+        msg_type = EIEIOType.KEY_16_BIT
+        max_keys = _MAX_HALF_KEYS_PER_PACKET
+        if send_full_keys:
+            msg_type = EIEIOType.KEY_32_BIT
+            max_keys = _MAX_FULL_KEYS_PER_PACKET
+
+        # Pack everything before sending anything, so that nothing is sent
+        # if any of the neuron IDs are invalid
+        packed = list()
+        for label, label_ids in self.__group_by_label(labels, neuron_ids):
+            keys = label_ids
+            if send_full_keys:
+                keys = self.__key_tables.get_keys(
+                    label, self._atom_id_to_key[label], label_ids)
+            packed.append((label, pack_eieio_data_messages(
+                msg_type, keys, max_keys)))
+
+        n_messages = 0
+        n_spikes = 0
+        for label, messages in packed:
+            if not has_send_target(self, label):
+                continue
+            for message in messages:
+                self.send_eieio_message(message, label)
+                n_messages += 1
+                n_spikes += message.n_elements
+
+        taken = time.perf_counter() - start_time
+        if taken > 0:
+            logger.debug(
+                "Sent {} spikes in {} messages in {:.6f}s ({:.0f} spikes/s)",
+                n_spikes, n_messages, taken, n_spikes / taken)
+        return n_messages
+
+    @staticmethod
+    def __group_by_label(labels, neuron_ids):
+        """ Split the neuron IDs by label, keeping the order of the IDs\
+            within each label and of the first appearance of each label
+
+        :param labels: a label or the label of each neuron ID
+        :param ~numpy.ndarray neuron_ids:
+        :rtype: iterable(tuple(str, ~numpy.ndarray))
+        """
+        if isinstance(labels, str):
+            return [(labels, neuron_ids)]
+        labels = numpy.asarray(labels).ravel()
+        if len(labels) != len(neuron_ids):
+            raise ValueError(
+                "There must be one label for each neuron ID, but there are "
+                "{} labels and {} neuron IDs".format(
+                    len(labels), len(neuron_ids)))
+        unique, first, inverse = numpy.unique(
+            labels, return_index=True, return_inverse=True)
+        order = numpy.argsort(inverse, kind="stable")
+        bounds = numpy.searchsorted(
+            inverse[order], numpy.arange(len(unique) + 1))
+        return [
+            (str(unique[i]), neuron_ids[order[bounds[i]:bounds[i + 1]]])
+            for i in numpy.argsort(first)]
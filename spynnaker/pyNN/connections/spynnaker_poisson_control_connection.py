@@ -13,18 +13,31 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
+import logging
+import time
+import numpy
+from spinn_utilities.log import FormatAdapter
 from spinn_utilities.overrides import overrides
+from spinnman.messages.eieio import EIEIOType
 from data_specification.enums import DataType
 from spinn_front_end_common.utilities.connections import LiveEventConnection
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
-import functools
+from .eieio_packing import (
+    KeyTables, has_send_target, pack_eieio_data_messages)
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# The maximum number of 32-bit keys with payloads that will fit in a packet
+_MAX_FULL_KEYS_PAYLOADS_PER_PACKET = 31
 
 
 class SpynnakerPoissonControlConnection(LiveEventConnection):
     __slots__ = [
         "__control_label_extension",
         "__control_label_to_label",
+        "__key_tables",
         "__label_to_control_label"]
 
     def __init__(
@@ -62,6 +75,7 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
         super().__init__(
             live_packet_gather_label=None, send_labels=control_labels,
             local_host=local_host, local_port=local_port)
+        self.__key_tables = KeyTables()
 
     def add_poisson_label(self, label):
         """
@@ -133,15 +147,67 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
         """
         self.set_rates(label, [(neuron_id, rate)])
 
-    def set_rates(self, label, neuron_id_rates):
+    def set_rates(self, label, neuron_ids, rates=None, coalesce=False):
         """ Set the rates of multiple Poisson neurons within a Poisson source
 
         :param str label: The label of the Population to set the rates of
-        :param list(tuple(int,float)) neuron_id_rates:
-            A list of tuples of (neuron ID, rate) to be set
+        :param neuron_ids:
+            The IDs of the neurons to set the rates of, or if rates is not
+            given, a list of tuples of (neuron ID, rate) to be set
+        :type neuron_ids: list(int) or ~numpy.ndarray or
+            list(tuple(int,float))
+        :param rates: The rate to set for each neuron in Hz
+        :type rates: list(float) or ~numpy.ndarray or None
+        :param bool coalesce:
+            Whether to send only the last of the rates given for each neuron,
+            as the earlier rates would be replaced as soon as they arrive
+        :return: The number of messages sent; none are sent if there is\
+            nowhere to send to
+        :rtype: int
+        :raises ValueError:
+            If the numbers of IDs and rates differ, or a rate is negative
+        :raises ~spinnman.exceptions.SpinnmanInvalidParameterException:
+            If a neuron ID isn't one of the neurons of the Population
         """
+        start_time = time.perf_counter()
+        if rates is None:
+            neuron_id_rates = list(neuron_ids)
+            neuron_ids = [nid for nid, _ in neuron_id_rates]
+            rates = [rate for _, rate in neuron_id_rates]
+        neuron_ids = numpy.asarray(neuron_ids, dtype="int64").ravel()
+        rates = numpy.asarray(rates, dtype="float64").ravel()
+        if len(neuron_ids) != len(rates):
+            raise ValueError(
+                "There must be one rate for each neuron ID, but there are "
+                "{} rates and {} neuron IDs".format(
+                    len(rates), len(neuron_ids)))
+        if numpy.any(rates < 0):
+            raise ValueError("Rates must not be negative")
+
+        if coalesce:
+            # Keep the last rate of each neuron, in the order they were given
+            _, last_reversed = numpy.unique(
+                neuron_ids[::-1], return_index=True)
+            keep = numpy.sort(len(neuron_ids) - 1 - last_reversed)
+            neuron_ids = neuron_ids[keep]
+            rates = rates[keep]
+
         control = self.__control_label(label)
-        datatype = DataType.S1615
-        atom_ids_and_payloads = [(nid, datatype.encode_as_int(rate))
-                                 for nid, rate in neuron_id_rates]
-        self.send_events_with_payloads(control, atom_ids_and_payloads)
+        keys_and_payloads = numpy.column_stack((
+            self.__key_tables.get_keys(
+                control, self._atom_id_to_key[control], neuron_ids),
+            DataType.S1615.encode_as_numpy_int_array(rates)))
+        messages = pack_eieio_data_messages(
+            EIEIOType.KEY_PAYLOAD_32_BIT, keys_and_payloads,
+            _MAX_FULL_KEYS_PAYLOADS_PER_PACKET)
+        if not has_send_target(self, control):
+            return 0
+        for message in messages:
+            self.send_eieio_message(message, control)
+
+        taken = time.perf_counter() - start_time
+        if taken > 0:
+            logger.debug(
+                "Sent {} rates in {} messages in {:.6f}s ({:.0f} rates/s)",
+                len(neuron_ids), len(messages), taken, len(neuron_ids) / taken)
+        return len(messages)
@@ -16,6 +16,7 @@
 from collections import defaultdict
 import os
 import struct
+import numpy
 from spinn_utilities.config_holder import get_config_bool
 from spinn_utilities.progress_bar import ProgressBar
 from spinnman.model import ExecutableTargets
@@ -25,28 +26,29 @@ from spinn_front_end_common.abstract_models import (
 from spinn_front_end_common.utilities import system_control_logic
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.utility_objs import ExecutableType
-from spinn_front_end_common.utilities.helpful_functions import n_word_struct
 from spinn_front_end_common.utilities.globals_variables import (
     report_default_directory)
 
 _THREE_WORDS = struct.Struct("<III")
+# words in a filter_info_t
+_FILTER_INFO_WORDS = 3
 # bits in a word
 _BITS_IN_A_WORD = 32
-# bit to mask a bit
-_BIT_MASK = 1
+# shift of each bit of a word, in neuron id order
+_BIT_SHIFTS = numpy.arange(_BITS_IN_A_WORD, dtype="uint32")
 
 
-def _bit_for_neuron_id(bitfield, neuron_id):
-    """ Get the bit for a neuron in the bitfield.
+def _bits_for_neurons(bitfield, n_neurons):
+    """ Get the bits for all the neurons in the bitfield.
 
-    :param list(int) bitfield:
+    :param ~numpy.ndarray bitfield:
         the block of words which represent the bitfield
-    :param int neuron_id: the neuron id to find the bit in the bitfield
-    :return: the bit (``0`` or ``1``)
-    :rtype: int
+    :param int n_neurons: the number of neurons to get the bits of
+    :return: the bit (``0`` or ``1``) of each neuron, in neuron id order
+    :rtype: ~numpy.ndarray
     """
-    word_id, bit_in_word = divmod(neuron_id, _BITS_IN_A_WORD)
-    return (bitfield[word_id] >> bit_in_word) & _BIT_MASK
+    bits = (bitfield[:, None] >> _BIT_SHIFTS) & 1
+    return bits.ravel()[:n_neurons]
 
 
 def _percent(amount, total):
@@ -163,10 +165,10 @@ class OnChipBitFieldGenerator(object):
                     local_redundant = 0
                     xy = (placement.x, placement.y)
                     for _, n_neurons, bitfield in self.__bitfields(placement):
-                        for neuron_id in range(n_neurons):
-                            if not _bit_for_neuron_id(bitfield, neuron_id):
-                                chip_redundant_count[xy] += 1
-                                local_redundant += 1
+                        n_redundant = n_neurons - int(numpy.count_nonzero(
+                            _bits_for_neurons(bitfield, n_neurons)))
+                        chip_redundant_count[xy] += n_redundant
+                        local_redundant += n_redundant
                         local_total += n_neurons
                     chip_packet_count[xy] = local_total
                     output.write(self._PER_CORE_SUMMARY.format(
@@ -217,10 +219,10 @@ class OnChipBitFieldGenerator(object):
 
         for master_pop_key, n_bits, bitfield in self.__bitfields(placement):
             # put into report
-            for neuron_id in range(n_bits):
-                f.write(self._FIELD_DETAIL.format(
-                    master_pop_key, neuron_id,
-                    _bit_for_neuron_id(bitfield, neuron_id)))
+            bits = _bits_for_neurons(bitfield, n_bits)
+            f.writelines(
+                self._FIELD_DETAIL.format(master_pop_key, neuron_id, bit)
+                for neuron_id, bit in enumerate(bits.tolist()))
 
     def __bitfield_placements(self, app_vertex):
         """ The placements of the machine vertices of the given app vertex \
@@ -239,7 +241,7 @@ class OnChipBitFieldGenerator(object):
         :param ~.Placement placement:
             The vertex must support AbstractSupportsBitFieldGeneration
         :returns: sequence of (master population key, num bits, bitfield data)
-        :rtype: iterable(tuple(int,int,list(int)))
+        :rtype: iterable(tuple(int,int,~numpy.ndarray))
         """
         # get bitfield address
         address = placement.vertex.bit_field_base_address(
@@ -250,26 +252,38 @@ class OnChipBitFieldGenerator(object):
             self.__txrx.read_memory(
                 placement.x, placement.y, address, _THREE_WORDS.size))
         address += _THREE_WORDS.size
-
-        # read in each bitfield
-        for _bit_field_index in range(total):
-            # master pop key, n words and read pointer; filter_info_t
-            master_pop_key, n_words, read_pointer = _THREE_WORDS.unpack(
-                self.__txrx.read_memory(
-                    placement.x, placement.y, address, _THREE_WORDS.size))
-            address += _THREE_WORDS.size
-            # Mask off merged and all_ones flag bits
-            n_words &= self._N_WORDS_MASK
-
-            # get bitfield words
-            if n_words:
-                bitfield = n_word_struct(n_words).unpack(
-                    self.__txrx.read_memory(
-                        placement.x, placement.y, read_pointer,
-                        n_words * BYTES_PER_WORD))
-            else:
-                bitfield = []
-            yield master_pop_key, n_words * _BITS_IN_A_WORD, bitfield
+        if not total:
+            return
+
+        # read all the filter_info_t entries at once; (master pop key,
+        # n words, read pointer) each
+        filters = numpy.frombuffer(self.__txrx.read_memory(
+            placement.x, placement.y, address,
+            total * _FILTER_INFO_WORDS * BYTES_PER_WORD),
+            dtype="<u4").reshape(total, _FILTER_INFO_WORDS)
+        keys = filters[:, 0]
+        # Mask off merged and all_ones flag bits
+        n_words = filters[:, 1] & self._N_WORDS_MASK
+        read_pointers = filters[:, 2].astype("int64")
+
+        # read all the bitfield words of the core at once; they are stored
+        # together after the filters, so read the span that covers them all
+        has_words = n_words > 0
+        if numpy.any(has_words):
+            start = int(read_pointers[has_words].min())
+            end = int((read_pointers + n_words * BYTES_PER_WORD)[
+                has_words].max())
+            words = numpy.frombuffer(self.__txrx.read_memory(
+                placement.x, placement.y, start, end - start), dtype="<u4")
+            offsets = (read_pointers - start) // BYTES_PER_WORD
+        else:
+            offsets = numpy.zeros(total, dtype="int64")
+            words = numpy.zeros(0, dtype="<u4")
+
+        for key, n_field_words, offset in zip(
+                keys.tolist(), n_words.tolist(), offsets.tolist()):
+            yield (key, n_field_words * _BITS_IN_A_WORD,
+                   words[offset:offset + n_field_words])
 
     def _calculate_core_data(self, app_graph, progress):
         """ gets the data needed for the bit field expander for the machine
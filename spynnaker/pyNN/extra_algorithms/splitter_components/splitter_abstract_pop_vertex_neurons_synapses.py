@@ -166,6 +166,12 @@ class SplitterAbstractPopulationVertexNeuronsSynapses(
                 " be run on a single synapse core.  Please ensure the number"
                 " of synapse cores is set to 1")
 
+        # There is no neuron core binary that receives or sends rates
+        if app_vertex.incoming_rate_projections or app_vertex.sends_rates:
+            raise SynapticConfigurationException(
+                "Rate projections are not supported when the neurons and"
+                " synapses of {} are on separate cores".format(label))
+
         # Do some checks to make sure everything is likely to fit
         atoms_per_core = min(
             app_vertex.get_max_atoms_per_core(), app_vertex.n_atoms)
@@ -13,14 +13,36 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import io
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pyNN.random import RandomDistribution
+from spinn_utilities.config_holder import get_config_bool, get_config_int
+from spinn_utilities.progress_bar import ProgressBar
+from data_specification import DataSpecificationGenerator
+from data_specification.constants import APP_PTR_TABLE_BYTE_SIZE
+from spinn_front_end_common.abstract_models import (
+    AbstractRewritesDataSpecification, AbstractGeneratesDataSpecification)
 from spinn_front_end_common.interface.interface_functions import (
     GraphDataSpecificationWriter)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
 from spynnaker.pyNN.models.utility_models.delays import (
     DelayExtensionMachineVertex)
 
 
 class SpynnakerDataSpecificationWriter(GraphDataSpecificationWriter):
     """ Executes data specification generation for sPyNNaker
+
+    If ``n_dsg_threads`` in the ``[Mapping]`` section of the configuration\
+    is more than 1, the specifications are generated by that many threads.\
+    The placements are grouped so that those which share host state (such\
+    as a random number generator, or the delay extension that receives\
+    their delayed connections) are generated in turn in the same thread, in\
+    the same order as they would be without threads, so the specifications\
+    are the same either way.  The delay extensions are generated once all\
+    the other vertices are done, as the other vertices add the delayed\
+    connections to them.
     """
 
     __slots__ = ()
@@ -51,7 +73,142 @@ class SpynnakerDataSpecificationWriter(GraphDataSpecificationWriter):
                 delay_extensions.append(placement)
             else:
                 placement_order.append(placement)
-        placement_order.extend(delay_extensions)
 
-        return super().__call__(
-            placements, hostname, machine, data_n_timesteps, placement_order)
+        n_threads = get_config_int("Mapping", "n_dsg_threads")
+        if (n_threads is None or n_threads <= 1 or
+                get_config_bool("Reports", "write_text_specs")):
+            placement_order.extend(delay_extensions)
+            return super().__call__(
+                placements, hostname, machine, data_n_timesteps,
+                placement_order)
+
+        # Set up the targets without generating anything
+        targets, region_sizes = super().__call__(
+            placements, hostname, machine, data_n_timesteps, [])
+        progress = ProgressBar(
+            placements.n_placements, "Generating data specifications")
+        sdram_usage = defaultdict(int)
+        vertices_to_reset = list()
+        with ThreadPoolExecutor(n_threads) as pool:
+            # The delay extensions must wait for the rest to finish
+            for phase in (placement_order, delay_extensions):
+                groups = self.__group_placements(phase)
+                specs = dict()
+                for group_specs in pool.map(self.__generate_specs, groups):
+                    specs.update(group_specs)
+
+                # Write in the same order as without threads
+                for placement in progress.over(phase, False):
+                    if placement in specs:
+                        vertex, data, sizes = specs[placement]
+                        self.__write_spec(
+                            placement, vertex, data, sizes, targets,
+                            region_sizes, sdram_usage, machine,
+                            data_n_timesteps)
+                        if isinstance(
+                                vertex, AbstractRewritesDataSpecification):
+                            vertices_to_reset.append(vertex)
+        progress.end()
+
+        # Ensure that the vertices know their regions have been reloaded
+        for vertex in vertices_to_reset:
+            vertex.set_reload_required(False)
+
+        return targets, region_sizes
+
+    @staticmethod
+    def __group_placements(placements):
+        """ Group placements so that those which share state on the host\
+            are in the same group, keeping their order
+
+        :param list(~pacman.model.placements.Placement) placements:
+        :rtype: list(list(~pacman.model.placements.Placement))
+        """
+        # Union the application vertices with what they share
+        parents = dict()
+
+        def find(key):
+            while parents.setdefault(key, key) != key:
+                parents[key] = parents[parents[key]]
+                key = parents[key]
+            return key
+
+        def union(a, b):
+            parents[find(a)] = find(b)
+
+        for placement in placements:
+            app_vertex = placement.vertex.app_vertex
+            key = id(placement.vertex if app_vertex is None else app_vertex)
+            find(key)
+            if not isinstance(app_vertex, AbstractPopulationVertex):
+                continue
+            # pylint: disable=protected-access
+            for proj in app_vertex.incoming_projections:
+                info = proj._synapse_information
+                shared = [info.connector, info.rng, info.synapse_dynamics]
+                for values in (info.weights, info.delays):
+                    if isinstance(values, RandomDistribution):
+                        shared.append(values.rng)
+                delay_edge = proj._projection_edge.delay_edge
+                if delay_edge is not None:
+                    shared.append(delay_edge.pre_vertex)
+                for item in shared:
+                    if item is not None:
+                        union(key, id(item))
+
+        groups = OrderedDict()
+        for placement in placements:
+            app_vertex = placement.vertex.app_vertex
+            key = find(id(
+                placement.vertex if app_vertex is None else app_vertex))
+            groups.setdefault(key, list()).append(placement)
+        return list(groups.values())
+
+    @classmethod
+    def __generate_specs(cls, placements):
+        """ Generate the specifications of a group of placements in turn
+
+        :param list(~pacman.model.placements.Placement) placements:
+        :return: The vertex that generated the specification, the
+            specification and the region sizes, by placement
+        :rtype: dict(~pacman.model.placements.Placement,
+            tuple(~pacman.model.graphs.AbstractVertex, bytes, list(int)))
+        """
+        specs = dict()
+        for placement in placements:
+            # If the machine vertex can't generate the spec, try with the
+            # application vertex
+            for vertex in (placement.vertex, placement.vertex.app_vertex):
+                if isinstance(vertex, AbstractGeneratesDataSpecification):
+                    data = io.BytesIO()
+                    spec = DataSpecificationGenerator(data)
+                    vertex.generate_data_specification(spec, placement)
+                    specs[placement] = (
+                        vertex, data.getvalue(), spec.region_sizes)
+                    break
+        return specs
+
+    @staticmethod
+    def __write_spec(
+            placement, vertex, data, sizes, targets, region_sizes,
+            sdram_usage, machine, data_n_timesteps):
+        """ Write a generated specification and check that it fits
+
+        :raises ConfigurationException: if things don't fit
+        """
+        # pylint: disable=too-many-arguments
+        pl = placement
+        with targets.create_data_spec(pl.x, pl.y, pl.p) as data_writer:
+            data_writer.write(data)
+        region_sizes[pl.x, pl.y, pl.p] = int(
+            APP_PTR_TABLE_BYTE_SIZE + sum(sizes))
+        sdram_usage[pl.x, pl.y] += int(sum(sizes))
+        if (sdram_usage[pl.x, pl.y] <=
+                machine.get_chip_at(pl.x, pl.y).sdram.size):
+            return
+        raise ConfigurationException(
+            "Too much SDRAM has been used on {}, {}; {} used {} "
+            "(estimated={})".format(
+                pl.x, pl.y, vertex, region_sizes[pl.x, pl.y, pl.p],
+                pl.vertex.resources_required.sdram.get_total_sdram(
+                    data_n_timesteps)))
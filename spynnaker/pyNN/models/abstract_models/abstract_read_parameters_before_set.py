@@ -25,7 +25,6 @@ class AbstractReadParametersBeforeSet(object, metaclass=AbstractBase):
 
     __slots__ = ()
 
-    @abstractmethod
     def read_parameters_from_machine(
             self, transceiver, placement, vertex_slice):
         """ Read the parameters from the machine before any are changed.
@@ -38,3 +37,33 @@ class AbstractReadParametersBeforeSet(object, metaclass=AbstractBase):
             the slice of atoms for this vertex
         :rtype: None
         """
+        self.update_parameters_from_data(
+            self.read_parameter_data(transceiver, placement, vertex_slice),
+            vertex_slice)
+
+    @abstractmethod
+    def read_parameter_data(self, transceiver, placement, vertex_slice):
+        """ Read the raw parameter data from the machine.  This must not\
+            change anything on the host, so that the data of several\
+            vertices can be read at the same time.
+
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            the SpinnMan interface
+        :param ~pacman.model.placements.Placement placement:
+            the placement of a vertex
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            the slice of atoms for this vertex
+        :return: The data read, to be passed to
+            :py:meth:`update_parameters_from_data`
+        """
+
+    @abstractmethod
+    def update_parameters_from_data(self, data, vertex_slice):
+        """ Update the parameters on the host with data read by\
+            :py:meth:`read_parameter_data`
+
+        :param data: The data read from the machine
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            the slice of atoms for this vertex
+        :rtype: None
+        """
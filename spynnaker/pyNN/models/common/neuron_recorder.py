@@ -68,7 +68,9 @@ class NeuronRecorder(object):
         "__events_per_core_datatypes",
         "__events_per_core_recording",
         "__events_per_ts",
-        "__region_ids"]
+        "__region_ids",
+        "__recording_modes",
+        "__modes"]
 
     _N_BYTES_FOR_TIMESTAMP = BYTES_PER_WORD
     _N_BYTES_PER_RATE = BYTES_PER_WORD
@@ -124,15 +126,30 @@ class NeuronRecorder(object):
 
     _MAX_RATE = 2 ** 32 - 1  # To allow a unit32_t to be used to store the rate
 
+    #: How the values seen during a sampling interval can be combined
+    RECORDING_MODES = {"sample": 0, "mean": 1, "min": 2, "max": 3}
+
+    #: Flag in the mode word to combine all units into a single column
+    _POPULATION_FLAG = 0x100
+
+    _N_BYTES_PER_MODE = BYTES_PER_WORD
+
+    #: size of a running sum for a combined recording
+    _N_BYTES_PER_SUM = 2 * BYTES_PER_WORD
+
     def __init__(
             self, allowed_variables, data_types, bitfield_variables,
             n_neurons, per_timestep_variables, per_timestep_datatypes,
-            events_per_core_variables, events_per_core_datatypes):
+            events_per_core_variables, events_per_core_datatypes,
+            recording_modes=False):
         """
         :param list(str) allowed_variables:
         :param list(str) data_types:
         :param list(str) bitfield_variables:
         :param int n_neurons:
+        :param bool recording_modes:
+            Whether the binary reads a recording mode for each variable,
+            and so whether :py:meth:`set_recording_mode` can be used
         """
         self.__sampling_rates = OrderedDict()
         self.__indexes = dict()
@@ -149,6 +166,8 @@ class NeuronRecorder(object):
         self.__events_per_core_recording = set()
         self.__events_per_ts = dict()
         self.__events_per_ts[self.MAX_REWIRES] = 0  # record('all')
+        self.__recording_modes = recording_modes
+        self.__modes = dict()
 
         # Get info on variables like these
         for variable in itertools.chain(allowed_variables, bitfield_variables):
@@ -181,9 +200,14 @@ class NeuronRecorder(object):
         if self.__sampling_rates[variable] == 0:
             return 0
         if self.__indexes[variable] is None:
-            return vertex_slice.n_atoms
-        return sum(vertex_slice.lo_atom <= index <= vertex_slice.hi_atom
-                   for index in self.__indexes[variable])
+            n_recording = vertex_slice.n_atoms
+        else:
+            n_recording = sum(
+                vertex_slice.lo_atom <= index <= vertex_slice.hi_atom
+                for index in self.__indexes[variable])
+        if self.is_population_recording(variable):
+            return min(n_recording, 1)
+        return n_recording
 
     def _neurons_recording(self, variable, vertex_slice):
         """
@@ -319,6 +343,8 @@ class NeuronRecorder(object):
             vertices, "Getting {} for {}".format(variable, label))
 
         indexes = []
+        population = self.is_population_recording(variable)
+        population_data = list()
         for i, vertex in enumerate(progress.over(vertices)):
             expected_rows = int(
                 math.ceil(n_machine_time_steps / sampling_rate))
@@ -328,7 +354,10 @@ class NeuronRecorder(object):
                 neurons = self._neurons_recording(
                     variable, vertex.vertex_slice)
                 n_items_per_timestep = len(neurons)
-                indexes.extend(neurons)
+                if population:
+                    n_items_per_timestep = min(n_items_per_timestep, 1)
+                else:
+                    indexes.extend(neurons)
             else:
                 indexes.append(i)
             placement_data = self._get_placement_matrix_data(
@@ -336,7 +365,10 @@ class NeuronRecorder(object):
                 missing_str, sampling_rate, label, data_type,
                 n_items_per_timestep)
 
-            if placement_data is not None:
+            if population:
+                if placement_data is not None:
+                    population_data.append((placement_data, len(neurons)))
+            elif placement_data is not None:
                 # append to the population data
                 if pop_level_data is None:
                     pop_level_data = placement_data
@@ -346,6 +378,11 @@ class NeuronRecorder(object):
                     pop_level_data = numpy.append(
                         pop_level_data, placement_data, axis=1)
 
+        if population and population_data:
+            pop_level_data = self.__combine_population_data(
+                variable, population_data)
+            indexes = [0]
+
         # warn user of missing data
         if len(missing_str) > 0:
             logger.warning(
@@ -354,6 +391,24 @@ class NeuronRecorder(object):
 
         return pop_level_data, indexes, sampling_interval
 
+    def __combine_population_data(self, variable, population_data):
+        """ Combine the single columns recorded by each core for a\
+            population recording into one column for the whole population
+
+        :param str variable:
+        :param list(tuple(~numpy.ndarray,int)) population_data:
+            The column of each core and the number of units it combined
+        :rtype: ~numpy.ndarray
+        """
+        columns = numpy.hstack([data for data, _ in population_data])
+        mode, _ = self.__modes[variable]
+        if mode == "min":
+            return numpy.min(columns, axis=1, keepdims=True)
+        if mode == "max":
+            return numpy.max(columns, axis=1, keepdims=True)
+        weights = numpy.array([n for _, n in population_data], dtype="float")
+        return numpy.dot(columns, weights / weights.sum()).reshape(-1, 1)
+
     def get_matrix_data(
             self, label, buffer_manager, placements,
             application_vertex, variable, n_machine_time_steps):
@@ -716,6 +771,64 @@ class NeuronRecorder(object):
             if variable in self.__per_timestep_recording])
         return variables
 
+    def set_recording_mode(self, variable, mode="sample", population=False):
+        """ Set how the values of a variable seen during each sampling\
+            interval are combined into the recorded value
+
+        :param str variable: PyNN variable name
+        :param str mode:
+            One of "sample" (the value at the sampled timestep), "mean",
+            "min" or "max" (of the values over the sampling interval)
+        :param bool population:
+            Whether to record a single column combining all the recorded
+            units, rather than one column per unit
+        :raises ConfigurationException:
+            If the binary does not support recording modes, or the variable
+            or mode is not supported
+        """
+        if not self.__recording_modes:
+            raise ConfigurationException(
+                "This model does not support recording modes")
+        if (variable not in self.__sampling_rates or
+                variable in self.__bitfield_variables):
+            raise ConfigurationException(
+                "Variable {} does not support recording modes".format(
+                    variable))
+        if mode not in self.RECORDING_MODES:
+            raise ConfigurationException(
+                "Recording mode {} is not one of {}".format(
+                    mode, list(self.RECORDING_MODES)))
+        self.__modes[variable] = (mode, bool(population))
+
+    def get_recording_mode(self, variable):
+        """ Get how the values of a variable are combined when recorded
+
+        :param str variable: PyNN variable name
+        :return: The mode and whether the units are combined
+        :rtype: tuple(str, bool)
+        """
+        return self.__modes.get(variable, ("sample", False))
+
+    def is_population_recording(self, variable):
+        """ Determine if a variable is recorded as a single column for the\
+            whole population
+
+        :param str variable: PyNN variable name
+        :rtype: bool
+        """
+        return self.get_recording_mode(variable)[1]
+
+    def __mode_word(self, variable):
+        """
+        :param str variable:
+        :rtype: int
+        """
+        mode, population = self.get_recording_mode(variable)
+        word = self.RECORDING_MODES[mode]
+        if population:
+            word |= self._POPULATION_FLAG
+        return word
+
     def _compute_rate(self, sampling_interval):
         """ Convert a sampling interval into a rate. \
             Remember, machine time step is in nanoseconds
@@ -1121,10 +1234,13 @@ class NeuronRecorder(object):
         # per-timestep variables which have no metadata
         n_words_for_n_neurons = self.__n_bytes_to_n_words(vertex_slice.n_atoms)
         n_bytes_for_n_neurons = n_words_for_n_neurons * BYTES_PER_WORD
-        var_bytes = (
-            (self._N_BYTES_PER_RATE + self._N_BYTES_PER_SIZE +
-             self._N_BYTES_PER_ENUM + n_bytes_for_n_neurons) *
-            (len(self.__sampling_rates) - len(self.__bitfield_variables)))
+        n_bytes_per_var = (
+            self._N_BYTES_PER_RATE + self._N_BYTES_PER_SIZE +
+            self._N_BYTES_PER_ENUM + n_bytes_for_n_neurons)
+        if self.__recording_modes:
+            n_bytes_per_var += self._N_BYTES_PER_MODE
+        var_bytes = n_bytes_per_var * (
+            len(self.__sampling_rates) - len(self.__bitfield_variables))
         bitfield_bytes = (
             (self._N_BYTES_PER_RATE + self._N_BYTES_PER_SIZE +
              n_bytes_for_n_neurons) *
@@ -1207,6 +1323,11 @@ class NeuronRecorder(object):
         # *_size
         usage += len(self.__sampling_rates) * self._N_BYTES_PER_SIZE
 
+        # *_sums for the combined recordings
+        for variable in self.__modes:
+            usage += self._N_BYTES_PER_SUM * (
+                self._count_recording_per_slice(variable, vertex_slice) + 1)
+
         # n_recordings_outstanding
         usage += self._N_BYTES_PER_OUTSTANDING_RECORDING
         return usage
@@ -1232,6 +1353,13 @@ class NeuronRecorder(object):
         n_bytes_for_n_neurons = n_words_for_n_neurons * BYTES_PER_WORD
         if rate == 0:
             data.append(numpy.zeros(n_words_for_n_neurons, dtype="uint32"))
+        elif self.is_population_recording(variable):
+            # Every recording unit writes to the single column 0
+            local_indexes = numpy.full(
+                n_bytes_for_n_neurons, n_recording, dtype="uint8")
+            for index in self._neurons_recording(variable, vertex_slice):
+                local_indexes[index - vertex_slice.lo_atom] = 0
+            data.append(local_indexes.view("uint32"))
         elif self.__indexes[variable] is None:
             data.append(numpy.arange(
                 n_bytes_for_n_neurons, dtype="uint8").view("uint32"))
@@ -1264,8 +1392,10 @@ class NeuronRecorder(object):
             n_recording = self._count_recording_per_slice(
                 variable, vertex_slice)
             dtype = self.__data_types[variable]
-            data.append(numpy.array(
-                [rate, n_recording, dtype.size], dtype="uint32"))
+            header = [rate, n_recording, dtype.size]
+            if self.__recording_modes:
+                header.append(self.__mode_word(variable))
+            data.append(numpy.array(header, dtype="uint32"))
             self.__add_indices(data, variable, rate, n_recording, vertex_slice)
 
         for variable in self.__bitfield_variables:
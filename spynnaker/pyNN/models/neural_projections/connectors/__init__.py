@@ -13,26 +13,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from spynnaker.pyNN.utilities.lazy_attributes import lazy_attributes
 from .abstract_connector import AbstractConnector
 from .abstract_generate_connector_on_machine import (
     AbstractGenerateConnectorOnMachine)
 from .abstract_connector_supports_views_on_machine import (
     AbstractConnectorSupportsViewsOnMachine)
-from .all_to_all_connector import AllToAllConnector
-from .array_connector import ArrayConnector
-from .csa_connector import CSAConnector
-from .distance_dependent_probability_connector import (
-    DistanceDependentProbabilityConnector)
-from .fixed_number_post_connector import FixedNumberPostConnector
-from .fixed_number_pre_connector import FixedNumberPreConnector
-from .fixed_probability_connector import FixedProbabilityConnector
-from .from_file_connector import FromFileConnector
-from .from_list_connector import FromListConnector
-from .index_based_probability_connector import IndexBasedProbabilityConnector
-from .multapse_connector import MultapseConnector
-from .one_to_one_connector import OneToOneConnector
-from .small_world_connector import SmallWorldConnector
-from .kernel_connector import KernelConnector
 
 __all__ = ["AbstractConnector", "AbstractGenerateConnectorOnMachine",
            "AbstractConnectorSupportsViewsOnMachine", "AllToAllConnector",
@@ -43,3 +29,27 @@ __all__ = ["AbstractConnector", "AbstractGenerateConnectorOnMachine",
            "FromListConnector", "IndexBasedProbabilityConnector",
            "KernelConnector",
            "MultapseConnector", "OneToOneConnector", "SmallWorldConnector"]
+
+# The concrete connectors are only imported when first used
+__getattr__, __dir__ = lazy_attributes(globals(), {
+    "AllToAllConnector": (".all_to_all_connector", "AllToAllConnector"),
+    "ArrayConnector": (".array_connector", "ArrayConnector"),
+    "CSAConnector": (".csa_connector", "CSAConnector"),
+    "DistanceDependentProbabilityConnector": (
+        ".distance_dependent_probability_connector",
+        "DistanceDependentProbabilityConnector"),
+    "FixedNumberPostConnector": (
+        ".fixed_number_post_connector", "FixedNumberPostConnector"),
+    "FixedNumberPreConnector": (
+        ".fixed_number_pre_connector", "FixedNumberPreConnector"),
+    "FixedProbabilityConnector": (
+        ".fixed_probability_connector", "FixedProbabilityConnector"),
+    "FromFileConnector": (".from_file_connector", "FromFileConnector"),
+    "FromListConnector": (".from_list_connector", "FromListConnector"),
+    "IndexBasedProbabilityConnector": (
+        ".index_based_probability_connector",
+        "IndexBasedProbabilityConnector"),
+    "MultapseConnector": (".multapse_connector", "MultapseConnector"),
+    "OneToOneConnector": (".one_to_one_connector", "OneToOneConnector"),
+    "SmallWorldConnector": (".small_world_connector", "SmallWorldConnector"),
+    "KernelConnector": (".kernel_connector", "KernelConnector")})
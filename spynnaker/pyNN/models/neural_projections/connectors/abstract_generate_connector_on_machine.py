@@ -17,11 +17,16 @@ from pyNN.random import available_distributions, RandomDistribution
 from enum import Enum
 import numpy
 from spinn_utilities.abstract_base import abstractproperty, AbstractBase
+from spinn_utilities.config_holder import get_config_bool
+from spinn_utilities.overrides import overrides
 from data_specification.enums.data_type import DataType
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spynnaker.pyNN.utilities import utility_calls
 from spynnaker.pyNN.models.neural_projections.connectors import (
     AbstractConnector)
+from .abstract_connector import _expr_context
+from .distance_dependence import (
+    DistanceDependence, N_DISTANCE_DEPENDENCE_WORDS)
 
 # Hash of the constant parameter generator
 PARAM_TYPE_CONSTANT_ID = 0
@@ -38,6 +43,13 @@ PARAM_TYPE_BY_NAME = {
 
 PARAM_TYPE_KERNEL = 6
 
+PARAM_TYPE_DISTANCE_DEPENDENT = 7
+
+# The size of the distance-dependent parameters; the post-slice start and
+# the distance dependence
+_DISTANCE_DEPENDENT_PARAMS_BYTES = (
+    (1 + N_DISTANCE_DEPENDENCE_WORDS) * BYTES_PER_WORD)
+
 
 # Hashes of the connection generators supported by the synapse expander
 class ConnectorIDs(Enum):
@@ -48,6 +60,7 @@ class ConnectorIDs(Enum):
     FIXED_NUMBER_PRE_CONNECTOR = 4
     FIXED_NUMBER_POST_CONNECTOR = 5
     KERNEL_CONNECTOR = 6
+    DISTANCE_DEPENDENT_PROBABILITY_CONNECTOR = 7
 
 
 class AbstractGenerateConnectorOnMachine(
@@ -58,7 +71,8 @@ class AbstractGenerateConnectorOnMachine(
     __slots__ = [
         "__delay_seed",
         "__weight_seed",
-        "__connector_seed"
+        "__connector_seed",
+        "__distance_dependences"
     ]
 
     def __init__(self, safe=True, callback=None, verbose=False):
@@ -71,6 +85,45 @@ class AbstractGenerateConnectorOnMachine(
         self.__delay_seed = dict()
         self.__weight_seed = dict()
         self.__connector_seed = dict()
+        self.__distance_dependences = dict()
+
+    @overrides(AbstractConnector.set_projection_information)
+    def set_projection_information(self, synapse_info):
+        super().set_projection_information(synapse_info)
+
+        # Work out which distance-dependent weights and delays can be
+        # generated on the machine
+        self.__distance_dependences = dict()
+        for values in (synapse_info.weights, synapse_info.delays):
+            if (isinstance(values, str) and
+                    not self._expand_distances(values)):
+                d = self._get_distances(values, synapse_info)
+                dependence = self._fit_distance_dependence(
+                    synapse_info, d, _expr_context.eval(values, d=d))
+                if dependence is not None:
+                    self.__distance_dependences[values] = dependence
+
+    def _fit_distance_dependence(self, synapse_info, d, values):
+        """ Find how to generate values that depend on the distance between\
+            the neurons on the machine
+
+        :param SynapseInformation synapse_info:
+        :param ~numpy.ndarray d:
+            The distances between the pre- and post-neurons
+        :param ~numpy.ndarray values: The values at those distances
+        :return: The distance dependence, or None if the values can't be\
+            generated on the machine
+        :rtype: DistanceDependence or None
+        """
+        if not get_config_bool(
+                "Simulation", "generate_distance_dependence_on_machine"):
+            return None
+        # The positions of the neurons in views are not known on the machine
+        if synapse_info.prepop_is_view or synapse_info.postpop_is_view:
+            return None
+        return DistanceDependence.from_values(
+            self.space, synapse_info.pre_population,
+            synapse_info.post_population, d, values)
 
     def _generate_lists_on_machine(self, values):
         """ Checks if the connector should generate lists on machine rather\
@@ -81,9 +134,10 @@ class AbstractGenerateConnectorOnMachine(
         :type values: int or ~pyNN.random.NumpyRNG
         :rtype: bool
         """
-        # Strings (i.e. for distance-dependent weights/delays) not supported
+        # Strings (i.e. for distance-dependent weights/delays) are only
+        # supported if they match what the machine can do
         if isinstance(values, str):
-            return False
+            return values in self.__distance_dependences
 
         # Scalars are fine on the machine
         if numpy.isscalar(values):
@@ -215,6 +269,8 @@ class AbstractGenerateConnectorOnMachine(
             float or list(int) or list(float)
         :rtype: int
         """
+        if isinstance(weights, str):
+            return PARAM_TYPE_DISTANCE_DEPENDENT
         return self._param_generator_id(weights)
 
     def gen_weights_params(self, weights, pre_vertex_slice, post_vertex_slice):
@@ -227,6 +283,9 @@ class AbstractGenerateConnectorOnMachine(
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :rtype: ~numpy.ndarray(~numpy.uint32)
         """
+        if isinstance(weights, str):
+            return self.__distance_dependent_params(
+                weights, post_vertex_slice)
         seed = self._generate_param_seed(
             pre_vertex_slice, post_vertex_slice, weights,
             self.__weight_seed)
@@ -240,6 +299,8 @@ class AbstractGenerateConnectorOnMachine(
             float or list(int) or list(float)
         :rtype: int
         """
+        if isinstance(weights, str):
+            return _DISTANCE_DEPENDENT_PARAMS_BYTES
         return self._param_generator_params_size_in_bytes(weights)
 
     def gen_delays_id(self, delays):
@@ -250,6 +311,8 @@ class AbstractGenerateConnectorOnMachine(
             float or list(int) or list(float)
         :rtype: int
         """
+        if isinstance(delays, str):
+            return PARAM_TYPE_DISTANCE_DEPENDENT
         return self._param_generator_id(delays)
 
     def gen_delay_params(self, delays, pre_vertex_slice, post_vertex_slice):
@@ -262,6 +325,8 @@ class AbstractGenerateConnectorOnMachine(
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :rtype: ~numpy.ndarray(~numpy.uint32)
         """
+        if isinstance(delays, str):
+            return self.__distance_dependent_params(delays, post_vertex_slice)
         seed = self._generate_param_seed(
             pre_vertex_slice, post_vertex_slice, delays,
             self.__delay_seed)
@@ -275,8 +340,22 @@ class AbstractGenerateConnectorOnMachine(
             float or list(int) or list(float)
         :rtype: int
         """
+        if isinstance(delays, str):
+            return _DISTANCE_DEPENDENT_PARAMS_BYTES
         return self._param_generator_params_size_in_bytes(delays)
 
+    def __distance_dependent_params(self, values, post_vertex_slice):
+        """ Get the parameters of the distance-dependent parameter\
+            generator on the machine
+
+        :param str values: The expression of the values
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :rtype: ~numpy.ndarray(~numpy.uint32)
+        """
+        return numpy.concatenate((
+            numpy.array([post_vertex_slice.lo_atom], dtype="uint32"),
+            self.__distance_dependences[values].words))
+
     @abstractproperty
     def gen_connector_id(self):
         """ The ID of the connection generator on the machine.
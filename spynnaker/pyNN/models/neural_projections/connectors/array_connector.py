@@ -14,6 +14,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy
+from scipy import sparse
 from spinn_utilities.overrides import overrides
 from .abstract_connector import AbstractConnector
 
@@ -23,8 +24,9 @@ class ArrayConnector(AbstractConnector):
         of the neurons in the pre- and post-populations.
     """
 
-    __slots = [
-        "__array", "__array_dims", "__n_total_connections"]
+    __slots__ = [
+        "__array", "__array_dims", "__by_post", "__by_pre",
+        "__n_total_connections"]
 
     def __init__(self, array, safe=True, callback=None, verbose=False):
         """
@@ -32,7 +34,10 @@ class ArrayConnector(AbstractConnector):
             An explicit boolean matrix that specifies the connections
             between the pre- and post-populations
             (see PyNN documentation). Must be 2D in practice.
-        :type array: ~numpy.ndarray(2, ~numpy.uint8)
+            A :py:mod:`scipy.sparse` matrix can also be given, so that a
+            large sparse matrix never has to be made dense.
+        :type array: ~numpy.ndarray(2, ~numpy.uint8) or
+            ~scipy.sparse.spmatrix
         :param bool safe:
             Whether to check that weights and delays have valid values.
             If False, this check is skipped.
@@ -47,45 +52,49 @@ class ArrayConnector(AbstractConnector):
         """
         super().__init__(safe, callback, verbose)
         self.__array = array
-        # we can get the total number of connections straight away
-        # from the boolean matrix
-        n_total_connections = 0
-        # array shape
+        # Keep the connections (the elements that are 1) compressed by
+        # row and by column, so that counts by pre- or post-neuron can be
+        # read from the index pointers without looking at the whole array
+        if sparse.issparse(array):
+            coo = sparse.coo_matrix(array)
+            coo.sum_duplicates()
+            connected = coo.data == 1
+            pre_ids = coo.row[connected]
+            post_ids = coo.col[connected]
+        else:
+            pre_ids, post_ids = numpy.nonzero(numpy.asarray(array) == 1)
         dims = array.shape
-        for i in range(dims[0]):
-            for j in range(dims[1]):
-                if array[i, j] == 1:
-                    n_total_connections += 1
-
-        self.__n_total_connections = n_total_connections
+        self.__by_pre = sparse.csr_matrix(
+            (numpy.ones(len(pre_ids), dtype="bool"), (pre_ids, post_ids)),
+            shape=dims)
+        self.__by_pre.sort_indices()
+        self.__by_post = self.__by_pre.tocsc()
+        self.__n_total_connections = self.__by_pre.nnz
         self.__array_dims = dims
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info):
         return self._get_delay_maximum(
-            synapse_info.delays, len(self.__array), synapse_info)
+            synapse_info.delays, self.__array_dims[0], synapse_info)
 
     @overrides(AbstractConnector.get_delay_minimum)
     def get_delay_minimum(self, synapse_info):
         return self._get_delay_minimum(
-            synapse_info.delays, len(self.__array), synapse_info)
+            synapse_info.delays, self.__array_dims[0], synapse_info)
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, synapse_info, min_delay=None,
             max_delay=None):
+        # Max number per row is required; the columns of the slice are
+        # contiguous in the column compressed form, so count the rows there
+        indptr = self.__by_post.indptr
+        pre_ids = self.__by_post.indices[
+            indptr[post_vertex_slice.lo_atom]:
+            indptr[post_vertex_slice.hi_atom + 1]]
         max_connections_row = 0
-        post_lo = post_vertex_slice.lo_atom
-        post_hi = post_vertex_slice.hi_atom
-        # Max number per row is required
-        for i in range(self.__array_dims[0]):
-            n_connections_row = 0
-            for j in range(post_lo, post_hi+1):
-                if self.__array[i, j] == 1:
-                    n_connections_row += 1
-
-            if n_connections_row > max_connections_row:
-                max_connections_row = n_connections_row
+        if len(pre_ids):
+            max_connections_row = int(numpy.bincount(pre_ids).max())
 
         if min_delay is None and max_delay is None:
             return max_connections_row
@@ -97,17 +106,9 @@ class ArrayConnector(AbstractConnector):
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(self, synapse_info):
         # Max number per column is required
-        max_connections_col = 0
-        for j in range(self.__array_dims[1]):
-            n_connections_col = 0
-            for i in range(self.__array_dims[0]):
-                if self.__array[i, j] == 1:
-                    n_connections_col = 0
-
-            if n_connections_col > max_connections_col:
-                max_connections_col = n_connections_col
-
-        return max_connections_col
+        if not self.__n_total_connections:
+            return 0
+        return int(numpy.diff(self.__by_post.indptr).max())
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self, synapse_info):
@@ -118,25 +119,16 @@ class ArrayConnector(AbstractConnector):
     def create_synaptic_block(
             self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
             synapse_type, synapse_info):
-        pre_neurons = []
-        post_neurons = []
-        n_connections = 0
-        pre_lo = pre_vertex_slice.lo_atom
-        pre_hi = pre_vertex_slice.hi_atom
-        post_lo = post_vertex_slice.lo_atom
-        post_hi = post_vertex_slice.hi_atom
-        for i in range(pre_lo, pre_hi+1):
-            for j in range(post_lo, post_hi+1):
-                if self.__array[i, j] == 1:
-                    pre_neurons.append(i)
-                    post_neurons.append(j)
-                    n_connections += 1
+        block_connections = self.__by_pre[
+            pre_vertex_slice.lo_atom:pre_vertex_slice.hi_atom + 1,
+            post_vertex_slice.lo_atom:post_vertex_slice.hi_atom + 1].tocoo()
+        n_connections = block_connections.nnz
 
         # Feed the arrays calculated above into the block structure
         block = numpy.zeros(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-        block["source"] = pre_neurons
-        block["target"] = post_neurons
+        block["source"] = block_connections.row + pre_vertex_slice.lo_atom
+        block["target"] = block_connections.col + post_vertex_slice.lo_atom
         block["weight"] = self._generate_weights(
             block["source"], block["target"], n_connections, None,
             pre_vertex_slice, post_vertex_slice, synapse_info)
@@ -33,8 +33,8 @@ class CSAConnector(AbstractConnector):
         https://github.com/INCF/csa/issues/10
     """
 
-    __slots = [
-        "__cset", "__full_connection_set", "__full_cset"]
+    __slots__ = [
+        "__cset", "__sources", "__targets"]
 
     def __init__(self, cset, safe=True, callback=None, verbose=False):
         """
@@ -63,9 +63,10 @@ class CSAConnector(AbstractConnector):
             raise ex
         self.__cset = cset
 
-        # Storage for full connection sets
-        self.__full_connection_set = None
-        self.__full_cset = None
+        # Storage for the full connection set, sorted by source and then
+        # target
+        self.__sources = None
+        self.__targets = None
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info):
@@ -81,42 +82,67 @@ class CSAConnector(AbstractConnector):
         return self._get_delay_minimum(
             synapse_info.delays, n_conns_max, synapse_info)
 
+    def _get_connection_set(self, synapse_info):
+        """ Get the full connection set between the populations
+
+        :param SynapseInformation synapse_info:
+        :return: The sources and targets of the connections, sorted by\
+            source and then target
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        # The connection set is only listed once; everything else is done
+        # on the arrays
+        if self.__sources is None:
+            pairs = numpy.array([x for x in csa.cross(
+                range(synapse_info.n_pre_neurons),
+                range(synapse_info.n_post_neurons)) * self.__cset],
+                dtype="uint32").reshape(-1, 2)
+            order = numpy.lexsort((pairs[:, 1], pairs[:, 0]))
+            self.__sources = pairs[order, 0]
+            self.__targets = pairs[order, 1]
+        return self.__sources, self.__targets
+
     def _get_n_connections(
             self, pre_vertex_slice, post_vertex_slice, synapse_info):
         """
         :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :param SynapseInformation synapse_info:
-        :rtype: tuple(int, cset.connset.CSet)
+        :return: The number of connections, and their sources and targets
+        :rtype: tuple(int, ~numpy.ndarray, ~numpy.ndarray)
         """
-        # do the work from self._cset in here
-
-        # this is where the magic needs to happen somehow
-        if self.__full_cset is None:
-            self.__full_cset = [x for x in csa.cross(
-                range(synapse_info.n_pre_neurons),
-                range(synapse_info.n_post_neurons)) * self.__cset]
-
-        # use CSA to cross the range of this vertex's neurons with the cset
-        pair_list = csa.cross(
-            range(pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom+1),
-            range(post_vertex_slice.lo_atom, post_vertex_slice.hi_atom+1)) \
-            * self.__full_cset
+        sources, targets = self._get_connection_set(synapse_info)
+
+        # The sources are sorted, so the connections from the pre-slice can
+        # be found by binary search; then keep those to the post-slice
+        start, end = numpy.searchsorted(
+            sources, [pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1])
+        sources = sources[start:end]
+        targets = targets[start:end]
+        in_post = ((targets >= post_vertex_slice.lo_atom) &
+                   (targets <= post_vertex_slice.hi_atom))
+        sources = sources[in_post]
+        targets = targets[in_post]
 
         if self.verbose:
-            print('full cset: ', self.__full_cset)
-            print('this vertex pair_list: ', pair_list)
-            print('this vertex pre_neurons: ', [x[0] for x in pair_list])
-            print('this vertex post_neurons: ', [x[1] for x in pair_list])
+            print('this vertex pre_neurons: ', sources)
+            print('this vertex post_neurons: ', targets)
 
-        n_connections = len(pair_list)  # size of the array created
-        return n_connections, pair_list
+        return len(sources), sources, targets
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, synapse_info, min_delay=None,
             max_delay=None):
-        n_connections_max = post_vertex_slice.n_atoms
+        sources, targets = self._get_connection_set(synapse_info)
+        in_post = ((targets >= post_vertex_slice.lo_atom) &
+                   (targets <= post_vertex_slice.hi_atom))
+        n_connections_max = 0
+        if numpy.any(in_post):
+            n_connections_max = int(numpy.bincount(sources[in_post]).max())
+
+        if min_delay is None and max_delay is None:
+            return n_connections_max
 
         return self._get_n_connections_from_pre_vertex_with_delay_maximum(
             synapse_info.delays,
@@ -125,8 +151,10 @@ class CSAConnector(AbstractConnector):
 
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(self, synapse_info):
-        n_connections_max = synapse_info.n_pre_neurons
-        return n_connections_max
+        _, targets = self._get_connection_set(synapse_info)
+        if not len(targets):
+            return 0
+        return int(numpy.bincount(targets).max())
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self, synapse_info):
@@ -138,23 +166,13 @@ class CSAConnector(AbstractConnector):
     def create_synaptic_block(
             self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
             synapse_type, synapse_info):
-        n_connections, pair_list = self._get_n_connections(
+        n_connections, sources, targets = self._get_n_connections(
             pre_vertex_slice, post_vertex_slice, synapse_info)
 
-        # Use whatever has been set up in _get_n_connections here
-        # to send into the block structure
-        # TO DO: not sure this works with repeated connector, but
-        #        what does a repeated connector mean in this context?
-        if self.__full_connection_set is None:
-            self.__full_connection_set = [x for x in pair_list]
-        else:
-            self.__full_connection_set += [x for x in pair_list]
-
         block = numpy.zeros(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
-        # source and target are the pre_neurons and post_neurons in pair_list
-        block["source"] = [x[0] for x in pair_list]
-        block["target"] = [x[1] for x in pair_list]
+        block["source"] = sources
+        block["target"] = targets
         block["weight"] = self._generate_weights(
             block["source"], block["target"], n_connections, None,
             pre_vertex_slice, post_vertex_slice, synapse_info)
@@ -170,8 +188,9 @@ class CSAConnector(AbstractConnector):
         :param int n_post_neurons:
         """
         # Yuck; this was supposed to be available to the user from scripts...
-        csa.show(self.__full_connection_set, n_pre_neurons, n_post_neurons)
+        csa.show(
+            list(zip(self.__sources, self.__targets)), n_pre_neurons,
+            n_post_neurons)
 
     def __repr__(self):
-        return "CSAConnector({})".format(
-            self.__full_cset)
+        return "CSAConnector({})".format(self.__cset)
@@ -0,0 +1,377 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Support for generating distance-dependent values on the machine.
+
+    The synapse expander (``common_distance.h``) computes values of the form\
+    ``offset + amplitude * kernel(d / scale)`` between neurons on regular\
+    grids of positions.  Here an expression in ``d`` is matched to one of\
+    those forms by evaluating it at the distances of the projection, and is\
+    only used on the machine if that reproduces the expression.
+"""
+
+import numpy
+from data_specification.enums.data_type import DataType
+
+#: The kernel shapes of the synapse expander, as in ``common_distance.h``
+KERNEL_GAUSSIAN = 0
+KERNEL_EXPONENTIAL = 1
+KERNEL_BOXCAR = 2
+KERNEL_LINEAR = 3
+
+#: The number of words of an encoded grid
+N_GRID_WORDS = 14
+
+#: The number of words of an encoded distance dependence
+N_DISTANCE_DEPENDENCE_WORDS = 3 + 2 * N_GRID_WORDS
+
+# The scaled distance in any direction beyond which the non-linear kernels
+# are 0 on the machine
+_FAR_DISTANCE = 64.0
+
+# The largest scaled position that the machine can hold with room to
+# subtract positions
+_MAX_POSITION = float(DataType.S1615.max) / 2
+
+# How close the fitted values have to be to the expression, relative to
+# the largest value
+_RELATIVE_TOLERANCE = 1e-6
+
+# How close positions have to be to a grid
+_POSITION_TOLERANCE = 1e-9
+
+
+class PositionGrid(object):
+    """ A regular grid of positions, as held by the synapse expander
+    """
+
+    __slots__ = ["__n_y", "__n_z", "__origin", "__steps"]
+
+    def __init__(self, origin, steps, n_y, n_z):
+        """
+        :param ~numpy.ndarray origin: The position of the first neuron
+        :param ~numpy.ndarray steps:
+            The change in position for a step in each grid index (3x3)
+        :param int n_y: The number of neurons in the middle grid index
+        :param int n_z: The number of neurons in the fastest grid index
+        """
+        self.__origin = numpy.array(origin, dtype="float64")
+        self.__steps = numpy.array(steps, dtype="float64").reshape(3, 3)
+        self.__n_y = n_y
+        self.__n_z = n_z
+
+    @staticmethod
+    def from_positions(positions):
+        """ Find the grid that some positions are on
+
+        :param ~numpy.ndarray positions: The positions, one per row
+        :return: The grid, or None if the positions are not on a grid
+        :rtype: PositionGrid or None
+        """
+        positions = numpy.asarray(positions, dtype="float64")
+        n = len(positions)
+        if n == 0:
+            return None
+        origin = positions[0]
+
+        # Find the step and extent of each index, fastest first
+        steps = numpy.zeros((3, 3))
+        extents = list()
+        stride = 1
+        for index in (2, 1):
+            if stride >= n:
+                extents.append(1)
+                continue
+            steps[index] = positions[stride] - origin
+            strided = positions[::stride]
+            expected = origin + numpy.outer(
+                numpy.arange(len(strided)), steps[index])
+            matches = numpy.all(
+                numpy.abs(strided - expected) <= _POSITION_TOLERANCE, axis=1)
+            extent = len(matches) if matches.all() else int(
+                numpy.argmin(matches))
+            extents.append(extent)
+            stride *= extent
+        if stride < n:
+            steps[0] = positions[stride] - origin
+        n_z, n_y = extents
+        grid = PositionGrid(origin, steps, n_y, n_z)
+        if not numpy.allclose(
+                grid.positions(numpy.arange(n)), positions, rtol=0,
+                atol=_POSITION_TOLERANCE):
+            return None
+        return grid
+
+    def positions(self, indices):
+        """ Get the positions of neurons on the grid
+
+        :param ~numpy.ndarray indices: The indices of the neurons
+        :rtype: ~numpy.ndarray
+        """
+        indices = numpy.asarray(indices)
+        grid_indices = numpy.stack((
+            indices // (self.__n_y * self.__n_z),
+            (indices // self.__n_z) % self.__n_y,
+            indices % self.__n_z), axis=-1)
+        return self.__origin + grid_indices.dot(self.__steps)
+
+    def transformed(self, axes, scale_factor=1.0, offset=0.0):
+        """ Get the grid as seen by a space
+
+        :param ~numpy.ndarray axes: The axes that the space measures
+        :param float scale_factor: The scale applied to the positions
+        :param float offset: The offset added before scaling
+        :rtype: PositionGrid
+        """
+        mask = numpy.zeros(3)
+        mask[axes] = 1.0
+        return PositionGrid(
+            (self.__origin + offset) * scale_factor * mask,
+            self.__steps * scale_factor * mask, self.__n_y, self.__n_z)
+
+    def scaled(self, scale):
+        """ Get the grid in units of a distance scale
+
+        :param float scale: The distance to use as a unit
+        :rtype: PositionGrid
+        """
+        return PositionGrid(
+            self.__origin / scale, self.__steps / scale, self.__n_y,
+            self.__n_z)
+
+    def max_position(self, n_neurons):
+        """ The largest coordinate of any of the neurons
+
+        :param int n_neurons: The number of neurons on the grid
+        :rtype: float
+        """
+        return numpy.max(numpy.abs(self.positions(numpy.arange(n_neurons))))
+
+    @property
+    def words(self):
+        """ The grid encoded as in ``common_distance.h``
+
+        :rtype: ~numpy.ndarray(uint32)
+        """
+        values = DataType.S1615.encode_as_numpy_int_array(
+            numpy.concatenate((self.__origin, self.__steps.flatten())))
+        return numpy.concatenate((
+            values.astype("uint32"),
+            numpy.array([self.__n_y, self.__n_z], dtype="uint32")))
+
+    @staticmethod
+    def from_words(words):
+        """ Decode a grid encoded as in ``common_distance.h``
+
+        :param ~numpy.ndarray words: The encoded grid
+        :rtype: PositionGrid
+        """
+        values = _decode_s1615(words[:12])
+        return PositionGrid(
+            values[:3], values[3:12], int(words[12]), int(words[13]))
+
+
+def _decode_s1615(words):
+    """ Decode some S1615 values
+
+    :param ~numpy.ndarray words:
+    :rtype: ~numpy.ndarray(float)
+    """
+    return (numpy.asarray(words, dtype="uint32").view("int32") /
+            float(DataType.S1615.scale))
+
+
+def _kernel(kernel, d):
+    """ Evaluate a kernel at some scaled distances
+
+    :param int kernel: The kernel shape
+    :param ~numpy.ndarray d: The distances
+    :rtype: ~numpy.ndarray
+    """
+    if kernel == KERNEL_GAUSSIAN:
+        return numpy.exp(-(d ** 2) / 2.0)
+    if kernel == KERNEL_EXPONENTIAL:
+        return numpy.exp(-d)
+    if kernel == KERNEL_BOXCAR:
+        return (d < 1.0).astype("float64")
+    return d
+
+
+def _fit_kernel(d, values):
+    """ Find the kernel shape, scale, offset and amplitude that best\
+        reproduce some values at some distances
+
+    :param ~numpy.ndarray d: The distances
+    :param ~numpy.ndarray values: The values at the distances
+    :return: kernel, scale, offset and amplitude, or None if nothing fits
+    :rtype: tuple(int, float, float, float) or None
+    """
+    tolerance = _RELATIVE_TOLERANCE * max(numpy.max(numpy.abs(values)), 1.0)
+
+    def fits(fit):
+        kernel, scale, offset, amplitude = fit
+        return numpy.all(numpy.abs(
+            offset + amplitude * _kernel(kernel, d / scale) - values) <=
+            tolerance)
+
+    candidates = list()
+
+    # A step (which includes a constant) at the middle of the gap in
+    # distance between where the value changes
+    order = numpy.argsort(d, kind="stable")
+    d_sorted = d[order]
+    v_sorted = values[order]
+    inside = v_sorted[0]
+    changes = numpy.flatnonzero(v_sorted != inside)
+    if not len(changes):
+        candidates.append((KERNEL_BOXCAR, 1.0, inside, 0.0))
+    elif d_sorted[changes[0]] > d_sorted[changes[0] - 1]:
+        outside = v_sorted[changes[0]]
+        scale = (d_sorted[changes[0]] + d_sorted[changes[0] - 1]) / 2.0
+        candidates.append((KERNEL_BOXCAR, scale, outside, inside - outside))
+
+    if numpy.ptp(d) > 0:
+        # A straight line
+        slope, intercept = numpy.polyfit(d, values, 1)
+        candidates.append((KERNEL_LINEAR, 1.0, intercept, slope))
+
+        # Exponentials of the distance and its square, fitted to the log
+        # of the values that are not too small to matter
+        sign = numpy.sign(values[numpy.argmax(numpy.abs(values))])
+        used = sign * values > tolerance
+        if (numpy.all(sign * values > -tolerance) and
+                numpy.ptp(d[used]) > 0):
+            log_values = numpy.log(sign * values[used])
+            slope, intercept = numpy.polyfit(d[used], log_values, 1)
+            if slope < 0:
+                candidates.append((
+                    KERNEL_EXPONENTIAL, -1.0 / slope, 0.0,
+                    sign * numpy.exp(intercept)))
+            slope, intercept = numpy.polyfit(d[used] ** 2, log_values, 1)
+            if slope < 0:
+                candidates.append((
+                    KERNEL_GAUSSIAN, numpy.sqrt(-0.5 / slope), 0.0,
+                    sign * numpy.exp(intercept)))
+
+    for fit in candidates:
+        if fits(fit):
+            return fit
+    return None
+
+
+class DistanceDependence(object):
+    """ A value that depends on the distance between neurons, in the form\
+        that the synapse expander can generate
+    """
+
+    __slots__ = [
+        "__amplitude", "__kernel", "__offset", "__post_grid", "__pre_grid"]
+
+    def __init__(self, kernel, offset, amplitude, pre_grid, post_grid):
+        """
+        :param int kernel: The shape of the dependence
+        :param float offset: The value added to the scaled kernel
+        :param float amplitude: The scale of the kernel
+        :param PositionGrid pre_grid:
+            The positions of the pre-neurons in units of the distance scale
+        :param PositionGrid post_grid:
+            The positions of the post-neurons in units of the distance scale
+        """
+        # pylint: disable=too-many-arguments
+        self.__kernel = kernel
+        self.__offset = offset
+        self.__amplitude = amplitude
+        self.__pre_grid = pre_grid
+        self.__post_grid = post_grid
+
+    @staticmethod
+    def from_values(space, pre_population, post_population, d, values):
+        """ Find how to generate some values on the machine
+
+        :param ~pyNN.space.Space space:
+            The space in which the distances were measured
+        :param pre_population: The pre-population
+        :param post_population: The post-population
+        :param ~numpy.ndarray d:
+            The distances between each pre- and post-neuron
+        :param ~numpy.ndarray values: The values at the distances
+        :return: The distance dependence, or None if it can't be generated\
+            on the machine
+        :rtype: DistanceDependence or None
+        """
+        # pylint: disable=too-many-arguments
+        if space is None or space.periodic_boundaries is not None:
+            return None
+        values = numpy.asarray(values, dtype="float64")
+        d = numpy.asarray(d, dtype="float64")
+        if values.shape != d.shape or not numpy.all(numpy.isfinite(values)):
+            return None
+        pre_grid = PositionGrid.from_positions(pre_population.positions)
+        post_grid = PositionGrid.from_positions(post_population.positions)
+        if pre_grid is None or post_grid is None:
+            return None
+        fit = _fit_kernel(d.flatten(), values.flatten())
+        if fit is None:
+            return None
+        kernel, scale, offset, amplitude = fit
+        if max(abs(offset), abs(amplitude)) > float(DataType.S1615.max):
+            return None
+
+        pre_grid = pre_grid.transformed(space.axes).scaled(scale)
+        post_grid = post_grid.transformed(
+            space.axes, space.scale_factor, space.offset).scaled(scale)
+        if (max(pre_grid.max_position(pre_population.size),
+                post_grid.max_position(post_population.size)) >=
+                _MAX_POSITION):
+            return None
+        return DistanceDependence(
+            kernel, offset, amplitude, pre_grid, post_grid)
+
+    @property
+    def words(self):
+        """ The distance dependence encoded as in ``common_distance.h``
+
+        :rtype: ~numpy.ndarray(uint32)
+        """
+        values = DataType.S1615.encode_as_numpy_int_array(
+            numpy.array([self.__offset, self.__amplitude]))
+        return numpy.concatenate((
+            numpy.array([self.__kernel], dtype="uint32"),
+            values.astype("uint32"), self.__pre_grid.words,
+            self.__post_grid.words))
+
+
+def evaluate_distance_dependence(words, pre_indices, post_indices):
+    """ Evaluate an encoded distance dependence as the synapse expander\
+        would, but in floating point; this is a reference against which to\
+        check the statistics of what is generated
+
+    :param ~numpy.ndarray words: The encoded distance dependence
+    :param ~numpy.ndarray pre_indices: The indices of the pre-neurons
+    :param ~numpy.ndarray post_indices: The indices of the post-neurons
+    :return: The values between each pre- and post-neuron
+    :rtype: ~numpy.ndarray
+    """
+    kernel = int(words[0])
+    offset, amplitude = _decode_s1615(words[1:3])
+    pre_grid = PositionGrid.from_words(words[3:3 + N_GRID_WORDS])
+    post_grid = PositionGrid.from_words(
+        words[3 + N_GRID_WORDS:N_DISTANCE_DEPENDENCE_WORDS])
+    diffs = numpy.abs(
+        post_grid.positions(post_indices)[None, :, :] -
+        pre_grid.positions(pre_indices)[:, None, :])
+    kernels = _kernel(kernel, numpy.sqrt(numpy.sum(diffs ** 2, axis=-1)))
+    if kernel != KERNEL_LINEAR:
+        kernels[numpy.any(diffs > _FAR_DISTANCE, axis=-1)] = 0.0
+    return offset + amplitude * kernels
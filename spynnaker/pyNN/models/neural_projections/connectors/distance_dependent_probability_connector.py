@@ -21,9 +21,13 @@ from numpy import (
     minimum, e, pi)
 from spinn_utilities.overrides import overrides
 from spinn_utilities.safe_eval import SafeEval
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spynnaker.pyNN.utilities.utility_calls import (
     get_probable_maximum_selected, get_probable_minimum_selected)
 from .abstract_connector import AbstractConnector
+from .abstract_generate_connector_on_machine import (
+    AbstractGenerateConnectorOnMachine, ConnectorIDs)
+from .distance_dependence import N_DISTANCE_DEPENDENCE_WORDS
 
 # support for arbitrary expression for the distance dependence
 _d_expr_context = SafeEval(math, numpy, arccos, arcsin, arctan, arctan2, ceil,
@@ -31,14 +35,23 @@ _d_expr_context = SafeEval(math, numpy, arccos, arcsin, arctan, arctan2, ceil,
                            log, log10, modf, power, sin, sinh, sqrt, tan, tanh,
                            maximum, minimum, e=e, pi=pi)
 
+# The view, allow self connections, the probability and the seed
+N_GEN_PARAMS = 5 + N_DISTANCE_DEPENDENCE_WORDS + 4
 
-class DistanceDependentProbabilityConnector(AbstractConnector):
+
+class DistanceDependentProbabilityConnector(
+        AbstractGenerateConnectorOnMachine):
     """ Make connections using a distribution which varies with distance.
+
+    The connections are generated on the machine if the populations are\
+    on regular grids and the probability is a Gaussian, exponential, step or\
+    linear function of the distance.
     """
 
     __slots__ = [
         "__allow_self_connections",
         "__d_expression",
+        "__probability_dependence",
         "__probs"]
 
     def __init__(
@@ -78,6 +91,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         super().__init__(safe, callback, verbose)
         self.__d_expression = d_expression
         self.__allow_self_connections = allow_self_connections
+        self.__probability_dependence = None
         self._rng = rng
         if n_connections is not None:
             raise NotImplementedError(
@@ -113,6 +127,11 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
 
         self.__probs = _d_expr_context.eval(self.__d_expression, d=d)
 
+        self.__probability_dependence = None
+        if not expand_distances:
+            self.__probability_dependence = self._fit_distance_dependence(
+                synapse_info, d, self.__probs)
+
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info):
         return self._get_delay_maximum(
@@ -205,6 +224,35 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         block["synapse_type"] = synapse_type
         return block
 
+    @overrides(AbstractGenerateConnectorOnMachine.generate_on_machine)
+    def generate_on_machine(self, weights, delays):
+        return (self.__probability_dependence is not None and
+                super().generate_on_machine(weights, delays))
+
+    @property
+    @overrides(AbstractGenerateConnectorOnMachine.gen_connector_id)
+    def gen_connector_id(self):
+        return ConnectorIDs.DISTANCE_DEPENDENT_PROBABILITY_CONNECTOR.value
+
+    @overrides(AbstractGenerateConnectorOnMachine.gen_connector_params)
+    def gen_connector_params(
+            self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
+            synapse_type, synapse_info):
+        params = numpy.array([
+            0, synapse_info.n_pre_neurons - 1,
+            0, synapse_info.n_post_neurons - 1,
+            self.__allow_self_connections], dtype="uint32")
+        seed = numpy.array(self._get_connector_seed(
+            pre_vertex_slice, post_vertex_slice, self._rng), dtype="uint32")
+        return numpy.concatenate((
+            params, self.__probability_dependence.words, seed))
+
+    @property
+    @overrides(
+        AbstractGenerateConnectorOnMachine.gen_connector_params_size_in_bytes)
+    def gen_connector_params_size_in_bytes(self):
+        return N_GEN_PARAMS * BYTES_PER_WORD
+
     def __repr__(self):
         return "DistanceDependentProbabilityConnector({})".format(
             self.__d_expression)
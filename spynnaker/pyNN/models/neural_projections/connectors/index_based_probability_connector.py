@@ -30,16 +30,20 @@ _index_expr_context = SafeEval(math, numpy, arccos, arcsin, arctan, arctan2,
                                ldexp, log, log10, modf, power, sin, sinh, sqrt,
                                tan, tanh, maximum, minimum, e=e, pi=pi)
 
+# The most probabilities to evaluate at once when looking for the maximum
+_MAX_EVALUATED = 2 ** 20
+
 
 class IndexBasedProbabilityConnector(AbstractConnector):
     """ Make connections using a probability distribution which varies\
         dependent upon the indices of the pre- and post-populations.
     """
 
-    __slots = [
+    __slots__ = [
         "__allow_self_connections",
+        "__compiled_expression",
         "__index_expression",
-        "__probs"]
+        "__max_probs"]
 
     def __init__(
             self, index_expression, allow_self_connections=True, rng=None,
@@ -73,39 +77,76 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         """
         super().__init__(safe, callback, verbose)
         self._rng = rng
-        self.__index_expression = index_expression
         self.__allow_self_connections = allow_self_connections
-        self.__probs = None
+        self.__set_index_expression(index_expression)
 
-    def _update_probs_from_index_expression(self, synapse_info):
+    def __set_index_expression(self, index_expression):
+        """
+        :param str index_expression:
         """
+        # Compile the expression once; the probabilities are then only
+        # evaluated a block at a time, as they are needed
+        self.__index_expression = index_expression
+        self.__compiled_expression = compile(
+            index_expression, "<index_expression>", "eval")
+        self.__max_probs = dict()
+
+    def _get_probs(self, pre_lo, pre_hi, post_lo, post_hi):
+        """ Evaluate the probabilities of a block of the connections
+
+        :param int pre_lo: The first pre-neuron of the block
+        :param int pre_hi: The last pre-neuron of the block
+        :param int post_lo: The first post-neuron of the block
+        :param int post_hi: The last post-neuron of the block
+        :return: The probabilities, indexed by pre- and then post-neuron
+        :rtype: ~numpy.ndarray
+        """
+        i = numpy.arange(pre_lo, pre_hi + 1, dtype="float64")
+        j = numpy.arange(post_lo, post_hi + 1, dtype="float64")
+        probs = _index_expr_context.eval(
+            self.__compiled_expression, i=i[:, None], j=j[None, :])
+        return numpy.broadcast_to(probs, (len(i), len(j)))
+
+    def _get_max_prob(self, synapse_info, post_vertex_slice=None):
+        """ Get the maximum probability of a connection to a slice of the\
+            post-neurons, or to any post-neuron
+
         :param SynapseInformation synapse_info:
+        :param post_vertex_slice: The slice, or None for all post-neurons
+        :type post_vertex_slice: ~pacman.model.graphs.common.Slice or None
+        :rtype: float
         """
-        # note: this only needs to be done once
-        if self.__probs is None:
-            # numpy array of probabilities using the index_expression
-            self.__probs = numpy.fromfunction(
-                lambda i, j: _index_expr_context.eval(
-                    self.__index_expression, i=i, j=j),
-                (synapse_info.n_pre_neurons, synapse_info.n_post_neurons))
+        if post_vertex_slice is None:
+            key = (0, synapse_info.n_post_neurons - 1)
+        else:
+            key = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        if key not in self.__max_probs:
+            post_lo, post_hi = key
+            n_pre = synapse_info.n_pre_neurons
+            # Go through the pre-neurons in blocks to bound the memory used
+            n_rows = max(1, _MAX_EVALUATED // (post_hi - post_lo + 1))
+            self.__max_probs[key] = max(
+                numpy.amax(self._get_probs(
+                    pre_lo, min(pre_lo + n_rows, n_pre) - 1,
+                    post_lo, post_hi))
+                for pre_lo in range(0, n_pre, n_rows))
+        return self.__max_probs[key]
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info):
-        self._update_probs_from_index_expression(synapse_info)
         n_connections = utility_calls.get_probable_maximum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-            numpy.amax(self.__probs))
+            self._get_max_prob(synapse_info))
         return self._get_delay_maximum(
             synapse_info.delays, n_connections, synapse_info)
 
     @overrides(AbstractConnector.get_delay_minimum)
     def get_delay_minimum(self, synapse_info):
-        self._update_probs_from_index_expression(synapse_info)
         n_connections = utility_calls.get_probable_minimum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-            numpy.amax(self.__probs))
+            self._get_max_prob(synapse_info))
         return self._get_delay_minimum(
             synapse_info.delays, n_connections, synapse_info)
 
@@ -113,10 +154,10 @@ class IndexBasedProbabilityConnector(AbstractConnector):
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, synapse_info, min_delay=None,
             max_delay=None):
-        self._update_probs_from_index_expression(synapse_info)
         n_connections = utility_calls.get_probable_maximum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-            post_vertex_slice.n_atoms, numpy.amax(self.__probs))
+            post_vertex_slice.n_atoms,
+            self._get_max_prob(synapse_info, post_vertex_slice))
 
         if min_delay is None or max_delay is None:
             return int(math.ceil(n_connections))
@@ -128,18 +169,16 @@ class IndexBasedProbabilityConnector(AbstractConnector):
 
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(self, synapse_info):
-        self._update_probs_from_index_expression(synapse_info)
         return utility_calls.get_probable_maximum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-            synapse_info.n_pre_neurons, numpy.amax(self.__probs))
+            synapse_info.n_pre_neurons, self._get_max_prob(synapse_info))
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self, synapse_info):
-        self._update_probs_from_index_expression(synapse_info)
         n_connections = utility_calls.get_probable_maximum_selected(
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
-            numpy.amax(self.__probs))
+            self._get_max_prob(synapse_info))
         return self._get_weight_maximum(
             synapse_info.weights, n_connections, synapse_info)
 
@@ -147,11 +186,9 @@ class IndexBasedProbabilityConnector(AbstractConnector):
     def create_synaptic_block(
             self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
             synapse_type, synapse_info):
-        # setup probs here
-        self._update_probs_from_index_expression(synapse_info)
-
-        probs = self.__probs[
-            pre_vertex_slice.as_slice, post_vertex_slice.as_slice].reshape(-1)
+        probs = self._get_probs(
+            pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom,
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom).reshape(-1)
 
         n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
         items = self._rng.next(n_items)
@@ -159,7 +196,13 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         # If self connections are not allowed, remove the possibility of self
         # connections by setting the probability to a value of infinity
         if not self.__allow_self_connections:
-            items[0:n_items:post_vertex_slice.n_atoms + 1] = numpy.inf
+            pre_ids = numpy.repeat(numpy.arange(
+                pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1),
+                post_vertex_slice.n_atoms)
+            post_ids = numpy.tile(numpy.arange(
+                post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1),
+                pre_vertex_slice.n_atoms)
+            items[pre_ids == post_ids] = numpy.inf
 
         present = items < probs
         ids = numpy.where(present)[0]
@@ -168,7 +211,7 @@ class IndexBasedProbabilityConnector(AbstractConnector):
         block = numpy.zeros(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
         block["source"] = (
-            (ids / post_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom)
+            (ids // post_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom)
         block["target"] = (
             (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
         block["weight"] = self._generate_weights(
@@ -210,4 +253,4 @@ class IndexBasedProbabilityConnector(AbstractConnector):
 
     @index_expression.setter
     def index_expression(self, new_value):
-        self.__index_expression = new_value
+        self.__set_index_expression(new_value)
@@ -40,9 +40,11 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine,
     __slots__ = [
         "__allow_self_connections",
         "__num_synapses",
+        "__numpy_rng",
         "__post_slices",
         "__pre_slices",
         "__synapses_per_edge",
+        "__synapses_per_edge_starts",
         "__with_replacement"]
 
     def __init__(self, n, allow_self_connections=True,
@@ -79,8 +81,26 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine,
         self.__pre_slices = None
         self.__post_slices = None
         self.__synapses_per_edge = None
+        self.__synapses_per_edge_starts = None
+        self.__numpy_rng = None
         self._rng = rng
 
+    def _get_numpy_rng(self):
+        """ Get a NumPy random generator to draw from.  This is the generator\
+            underlying the connector RNG where there is one, or otherwise one\
+            seeded from the connector RNG, so that a seeded connector always\
+            produces the same connectivity.
+
+        :rtype: ~numpy.random.RandomState
+        """
+        if self.__numpy_rng is None:
+            rng = getattr(self._rng, "rng", None)
+            if not hasattr(rng, "multinomial"):
+                rng = numpy.random.RandomState(
+                    getattr(self._rng, "seed", None))
+            self.__numpy_rng = rng
+        return self.__numpy_rng
+
     def get_rng_next(self, num_synapses, prob_connect):
         """ Get the required RNGs
 
@@ -89,23 +109,13 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine,
         :param list(float) prob_connect: The probability of connection
         :rtype: ~numpy.ndarray
         """
-        # Below is how numpy does multinomial internally...
-        size = len(prob_connect)
-        multinomial = numpy.zeros(size, int)
-        total = 1.0
-        dn = num_synapses
-        for j in range(0, size - 1):
-            multinomial[j] = self._rng.next(
-                1, distribution="binomial",
-                parameters={'n': dn, 'p': prob_connect[j] / total})
-            dn = dn - multinomial[j]
-            if dn <= 0:
-                break
-            total = total - prob_connect[j]
-        if dn > 0:
-            multinomial[size - 1] = dn
-
-        return multinomial
+        prob_connect = numpy.asarray(prob_connect, dtype="float64")
+        total = prob_connect.sum()
+        if total <= 0:
+            return numpy.zeros(len(prob_connect), dtype=int)
+        # Normalise to avoid rounding making the sum go over 1
+        return self._get_numpy_rng().multinomial(
+            num_synapses, prob_connect / total)
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info):
@@ -125,29 +135,30 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine,
         if (self.__synapses_per_edge is None or
                 len(self.__pre_slices) != len(pre_slices) or
                 len(self.__post_slices) != len(post_slices)):
-            n_pre_atoms = sum(pre.n_atoms for pre in pre_slices if pre)
-            n_post_atoms = sum(post.n_atoms for post in post_slices if post)
-            n_connections = n_pre_atoms * n_post_atoms
+            # Empty (view) slices are given as empty lists
+            pre_sizes = numpy.array(
+                [pre.n_atoms if pre else 0 for pre in pre_slices],
+                dtype="float64")
+            post_sizes = numpy.array(
+                [post.n_atoms if post else 0 for post in post_slices],
+                dtype="float64")
+            n_connections = pre_sizes.sum() * post_sizes.sum()
             if (not self.__with_replacement and
                     n_connections < self.__num_synapses):
                 raise SpynnakerException(
                     "FixedNumberTotalConnector will not work correctly when "
                     "with_replacement=False & num_synapses > n_pre * n_post")
-            prob_connect = [
-                pre.n_atoms * post.n_atoms / float(n_connections)
-                if pre and post else 0
-                for pre in pre_slices for post in post_slices]
-            # Use the multinomial directly if possible
-            if (hasattr(self._rng, "rng") and
-                    hasattr(self._rng.rng, "multinomial")):
-                self.__synapses_per_edge = self._rng.rng.multinomial(
-                    self.__num_synapses, prob_connect)
-            else:
-                self.__synapses_per_edge = self.get_rng_next(
-                    self.__num_synapses, prob_connect)
-            if sum(self.__synapses_per_edge) != self.__num_synapses:
+
+            # One probability per (pre, post) pair, in pre-major order
+            prob_connect = numpy.outer(pre_sizes, post_sizes).ravel()
+            self.__synapses_per_edge = self.get_rng_next(
+                self.__num_synapses, prob_connect)
+            n_generated = numpy.sum(self.__synapses_per_edge)
+            if n_generated != self.__num_synapses:
                 raise SpynnakerException("{} of {} synapses generated".format(
-                    sum(self.__synapses_per_edge), self.__num_synapses))
+                    n_generated, self.__num_synapses))
+            self.__synapses_per_edge_starts = numpy.concatenate(
+                ([0], numpy.cumsum(self.__synapses_per_edge)[:-1]))
             self.__pre_slices = pre_slices
             self.__post_slices = post_slices
 
@@ -168,9 +179,7 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine,
         """
         index = (len(self.__post_slices) * pre_slice_index) + post_slice_index
         n_connections = self.__synapses_per_edge[index]
-        start_connection = 0
-        if index > 0:
-            start_connection = numpy.sum(self.__synapses_per_edge[:index])
+        start_connection = self.__synapses_per_edge_starts[index]
         return slice(start_connection, start_connection + n_connections, 1)
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
@@ -240,7 +249,7 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine,
 
         # Now do the actual random choice from the available connections
         try:
-            chosen = numpy.random.choice(
+            chosen = self._get_numpy_rng().choice(
                 pairs.shape[0], size=n_connections,
                 replace=self.__with_replacement)
         except Exception as e:
@@ -56,7 +56,7 @@ from spynnaker.pyNN.exceptions import InvalidParameterType
 from spynnaker.pyNN.utilities.ranged import (
     SpynnakerRangeDictionary)
 from spynnaker.pyNN.utilities.constants import POSSION_SIGMA_SUMMATION_LIMIT
-from spynnaker.pyNN.utilities.running_stats import RunningStats
+from spynnaker.pyNN.utilities.state_snapshot import StateSnapshot
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSynapseDynamics, AbstractSynapseDynamicsStructural)
 from .synapse_io import get_max_row_info
@@ -80,6 +80,19 @@ _NEURON_BASE_N_CPU_CYCLES = 10
 # 1 for incoming spike buffer size
 _SYNAPSES_BASE_SDRAM_USAGE_IN_BYTES = 7 * BYTES_PER_WORD
 
+# 1 for whether rates are sent
+# 1 for the offset of the inhibitory rate keys
+# 1 for the number of sources
+_RATE_COUPLING_HEADER_BYTES = 3 * BYTES_PER_WORD
+
+# 1 for the key
+# 1 for the mask
+# 1 for the number of source neurons
+# 1 for the offset of the inhibitory rate keys
+# 1 for whether the inhibitory rate is used
+# 1 for the receptor
+_RATE_SOURCE_HEADER_BYTES = 6 * BYTES_PER_WORD
+
 
 class AbstractPopulationVertex(
         TDMAAwareApplicationVertex, AbstractContainsUnits,
@@ -114,7 +127,10 @@ class AbstractPopulationVertex(
         "__incoming_projections",
         "__synapse_dynamics",
         "__max_row_info",
-        "__self_projection"]
+        "__self_projection",
+        "__incoming_rate_projections",
+        "__sends_rates",
+        "__ring_buffer_shifts_cache"]
 
     #: recording region IDs
     _SPIKE_RECORDING_REGION = 0
@@ -211,7 +227,8 @@ class AbstractPopulationVertex(
             self.__neuron_impl.get_recordable_data_types())
         self.__neuron_recorder = NeuronRecorder(
             neuron_recordable_variables, record_data_types,
-            [NeuronRecorder.SPIKES], n_neurons, [], {}, [], {})
+            [NeuronRecorder.SPIKES], n_neurons, [], {}, [], {},
+            self.__neuron_impl.supports_recording_modes)
         self.__synapse_recorder = NeuronRecorder(
             [], {}, [],
             n_neurons, [NeuronRecorder.PACKETS],
@@ -232,6 +249,9 @@ class AbstractPopulationVertex(
         self.__incoming_projections = list()
         self.__max_row_info = dict()
         self.__self_projection = None
+        self.__incoming_rate_projections = list()
+        self.__sends_rates = False
+        self.__ring_buffer_shifts_cache = (None, None)
 
         # Prepare for dealing with STDP - there can only be one (non-static)
         # synapse dynamics per vertex at present
@@ -273,6 +293,39 @@ class AbstractPopulationVertex(
         if projection._projection_edge.pre_vertex == self:
             self.__self_projection = projection
 
+    def add_incoming_rate_projection(self, rate_projection):
+        """ Add a rate projection incoming to this vertex
+
+        :param RateProjection rate_projection:
+            The new rate projection to add
+        """
+        self.__change_requires_mapping = True
+        self.__incoming_rate_projections.append(rate_projection)
+
+    @property
+    def incoming_rate_projections(self):
+        """ The rate projections that target this population vertex
+
+        :rtype: list(RateProjection)
+        """
+        return self.__incoming_rate_projections
+
+    def set_sends_rates(self):
+        """ Make the vertex send its rates to other vertices instead of\
+            spikes
+        """
+        if not self.__sends_rates:
+            self.__change_requires_mapping = True
+        self.__sends_rates = True
+
+    @property
+    def sends_rates(self):
+        """ Whether the vertex sends rates instead of spikes
+
+        :rtype: bool
+        """
+        return self.__sends_rates
+
     @property
     def self_projection(self):
         """ Get any projection from this vertex to itself
@@ -475,6 +528,18 @@ class AbstractPopulationVertex(
             self.__raise_var_not_supported(variable)
         self.__change_requires_mapping = not self.is_recording(variable)
 
+    def set_recording_mode(self, variable, mode="sample", population=False):
+        """ Set how the values of a variable seen during each sampling\
+            interval are combined into the recorded value
+
+        :param str variable: PyNN variable name
+        :param str mode: One of "sample", "mean", "min" or "max"
+        :param bool population:
+            Whether to record a single column combining all the units
+        """
+        self.__neuron_recorder.set_recording_mode(variable, mode, population)
+        self.__change_requires_mapping = True
+
     @overrides(AbstractNeuronRecordable.get_data)
     def get_data(
             self, variable, n_machine_time_steps, placements, buffer_manager):
@@ -513,6 +578,7 @@ class AbstractPopulationVertex(
             raise KeyError(
                 "Vertex does not support initialisation of"
                 " parameter {}".format(variable))
+        old_values = self.__values_of(self._state_variables[variable])
         if self.__has_run:
             self._state_variables[variable].set_value_by_selector(
                 selector, value)
@@ -525,9 +591,92 @@ class AbstractPopulationVertex(
                 selector, value)
             # Update the sate variables in case asked for
             self._state_variables.copy_into(self.__initial_state_variables)
+        self.__reload_changed(self._state_variables[variable], old_values)
+
+    def get_state_snapshot(self):
+        """ Get the current values of every parameter and state variable
+
+        :rtype: ~spynnaker.pyNN.utilities.state_snapshot.StateSnapshot
+        """
+        return StateSnapshot(
+            self.__neuron_impl.model_name, self.__n_atoms,
+            {key: self.__values_of(self._parameters[key])
+             for key in self._parameters.keys()},
+            {key: self.__values_of(self._state_variables[key])
+             for key in self._state_variables.keys()})
+
+    def restore_state_snapshot(self, snapshot):
+        """ Start from the values of every parameter and state variable in a\
+            snapshot; this must be done before the first run
+
+        :param ~spynnaker.pyNN.utilities.state_snapshot.StateSnapshot \
+                snapshot:
+            The snapshot to restore
+        :raises ConfigurationException:
+            If the snapshot is of a different model or size, or this has
+            already run
+        """
+        if self.__has_run:
+            raise ConfigurationException(
+                "A state snapshot can only be restored before the first run")
+        if (snapshot.model_name != self.__neuron_impl.model_name or
+                snapshot.n_neurons != self.__n_atoms):
+            raise ConfigurationException(
+                "Cannot restore a snapshot of {} {} into {} {}".format(
+                    snapshot.n_neurons, snapshot.model_name,
+                    self.__n_atoms, self.__neuron_impl.model_name))
+        for values, ranged_dict in (
+                (snapshot.parameters, self._parameters),
+                (snapshot.state_variables, self.__initial_state_variables)):
+            if set(values.keys()) != set(ranged_dict.keys()):
+                raise ConfigurationException(
+                    "The snapshot holds {} rather than {}".format(
+                        sorted(values.keys()), sorted(ranged_dict.keys())))
+            for key, value in values.items():
+                ranged_dict[key].set_value(value)
+        self._state_variables.copy_into(self.__initial_state_variables)
+
+    @staticmethod
+    def __values_of(ranged_list):
+        """ Get a snapshot of the values of a ranged list
+
+        :param ~spinn_utilities.ranged.AbstractList ranged_list:
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.array(ranged_list.get_values())
+
+    def __reload_changed(self, ranged_list, old_values):
+        """ Mark as needing a reload only those machine vertices that hold\
+            atoms whose values in a ranged list differ from the old values
+
+        :param ~spinn_utilities.ranged.AbstractList ranged_list:
+            The values after the change
+        :param ~numpy.ndarray old_values: The values before the change
+        """
+        new_values = self.__values_of(ranged_list)
+        if new_values.shape != old_values.shape:
+            self.__reload_atoms(None)
+        else:
+            self.__reload_atoms(numpy.nonzero(new_values != old_values)[0])
+
+    def __reload_atoms(self, atom_ids):
+        """ Mark as needing a reload those machine vertices that hold any\
+            of the given atoms; the data of other vertices is unchanged so\
+            does not have to be regenerated
+
+        :param atom_ids: The sorted ids of the changed atoms, or None if all
+        :type atom_ids: ~numpy.ndarray or None
+        """
         for vertex in self.machine_vertices:
-            if isinstance(vertex, AbstractRewritesDataSpecification):
-                vertex.set_reload_required(True)
+            if not isinstance(vertex, AbstractRewritesDataSpecification):
+                continue
+            if atom_ids is not None:
+                vertex_slice = vertex.vertex_slice
+                first = numpy.searchsorted(atom_ids, vertex_slice.lo_atom)
+                if (first == len(atom_ids) or
+                        atom_ids[first] > vertex_slice.hi_atom):
+                    continue
+            vertex.set_reload_required(True)
 
     @property
     def initialize_parameters(self):
@@ -598,10 +747,23 @@ class AbstractPopulationVertex(
             raise InvalidParameterType(
                 "Population {} does not have parameter {}".format(
                     self.__neuron_impl.model_name, key))
+        old_values = self.__values_of(self._parameters[key])
         self._parameters.set_value(key, value)
-        for vertex in self.machine_vertices:
-            if isinstance(vertex, AbstractRewritesDataSpecification):
-                vertex.set_reload_required(True)
+        self.__reload_changed(self._parameters[key], old_values)
+
+    @overrides(AbstractPopulationSettable.set_value_by_selector)
+    def set_value_by_selector(self, selector, key, value):
+        """ Set a property of the overall model for a subset of the atoms.
+        """
+        if key not in self._parameters:
+            raise InvalidParameterType(
+                "Population {} does not have parameter {}".format(
+                    self.__neuron_impl.model_name, key))
+        ranged_list = self._parameters[key]
+        old_values = self.__values_of(ranged_list)
+        ranged_list.set_value_by_selector(
+            selector, value, ranged_list.is_list(value, self.n_atoms))
+        self.__reload_changed(ranged_list, old_values)
 
     @property
     def weight_scale(self):
@@ -743,9 +905,9 @@ class AbstractPopulationVertex(
         # Mark that reset has been done, and reload state variables
         self.__has_run = False
         self._state_variables.copy_into(self.__initial_state_variables)
-        for vertex in self.machine_vertices:
-            if isinstance(vertex, AbstractRewritesDataSpecification):
-                vertex.set_reload_required(True)
+        # The state on the machine has moved on from that on the host, so
+        # every vertex has to be reloaded
+        self.__reload_atoms(None)
 
         # If synapses change during the run,
         if (self.__synapse_dynamics is not None and
@@ -768,32 +930,41 @@ class AbstractPopulationVertex(
         and timestep.
 
         All arguments should be assumed real values except n_synapses_in\
-        which will be an integer.
+        which will be an integer.  Each argument can also be an array, in\
+        which case a bound is computed for each element all at once.
 
-        :param float weight_mean: Mean of weight distribution (in either nA or\
+        :param weight_mean: Mean of weight distribution (in either nA or\
             microSiemens as required)
-        :param float weight_std_dev: SD of weight distribution
-        :param float spikes_per_second: Maximum expected Poisson rate in Hz
-        :param int machine_timestep: in us
-        :param int n_synapses_in: No of connected synapses
+        :type weight_mean: float or ~numpy.ndarray
+        :param weight_std_dev: SD of weight distribution
+        :type weight_std_dev: float or ~numpy.ndarray
+        :param spikes_per_second: Maximum expected Poisson rate in Hz
+        :type spikes_per_second: float or ~numpy.ndarray
+        :param n_synapses_in: No of connected synapses
+        :type n_synapses_in: int or ~numpy.ndarray
         :param float sigma: How many SD above the mean to go for upper bound;\
             a good starting choice is 5.0. Given length of simulation we can\
             set this for approximate number of saturation events.
-        :rtype: float
+        :rtype: float or ~numpy.ndarray
         """
+        weight_mean = numpy.asarray(weight_mean, dtype="float64")
+        weight_std_dev = numpy.asarray(weight_std_dev, dtype="float64")
+
         # E[ number of spikes ] in a timestep
         steps_per_second = MICRO_TO_SECOND_CONVERSION / machine_time_step()
         average_spikes_per_timestep = (
-            float(n_synapses_in * spikes_per_second) / steps_per_second)
+            numpy.multiply(n_synapses_in, spikes_per_second, dtype="float64") /
+            steps_per_second)
 
         # Exact variance contribution from inherent Poisson variation
         poisson_variance = average_spikes_per_timestep * (weight_mean ** 2)
 
         # Upper end of range for Poisson summation required below
         # upper_bound needs to be an integer
-        upper_bound = int(round(average_spikes_per_timestep +
-                                POSSION_SIGMA_SUMMATION_LIMIT *
-                                math.sqrt(average_spikes_per_timestep)))
+        upper_bound = numpy.rint(
+            average_spikes_per_timestep +
+            POSSION_SIGMA_SUMMATION_LIMIT *
+            numpy.sqrt(average_spikes_per_timestep))
 
         # Closed-form exact solution for summation that gives the variance
         # contributed by weight distribution variation when modulated by
@@ -802,34 +973,111 @@ class AbstractPopulationVertex(
         # Mathematica because (1) it's regularised and needs a further
         # multiplication and (2) it's actually the complement that is needed
         # i.e. 'gammaincc']
-
-        weight_variance = 0.0
-
-        if weight_std_dev > 0:
-            # pylint: disable=no-member
+        # pylint: disable=no-member
+        with numpy.errstate(all="ignore"):
             lngamma = special.gammaln(1 + upper_bound)
             gammai = special.gammaincc(
                 1 + upper_bound, average_spikes_per_timestep)
-
-            big_ratio = (math.log(average_spikes_per_timestep) * upper_bound -
-                         lngamma)
-
-            if -701.0 < big_ratio < 701.0 and big_ratio != 0.0:
-                log_weight_variance = (
-                    -average_spikes_per_timestep +
-                    math.log(average_spikes_per_timestep) +
-                    2.0 * math.log(weight_std_dev) +
-                    math.log(math.exp(average_spikes_per_timestep) * gammai -
-                             math.exp(big_ratio)))
-                weight_variance = math.exp(log_weight_variance)
+            log_average = numpy.log(average_spikes_per_timestep)
+            big_ratio = log_average * upper_bound - lngamma
+            difference = (numpy.exp(average_spikes_per_timestep) * gammai -
+                          numpy.exp(big_ratio))
+            log_weight_variance = (
+                -average_spikes_per_timestep + log_average +
+                2.0 * numpy.log(weight_std_dev) + numpy.log(difference))
+        # No spikes or no spread of weights gives no variance
+        use_weight_variance = (
+            (weight_std_dev > 0) & (average_spikes_per_timestep > 0) &
+            (-701.0 < big_ratio) & (big_ratio < 701.0) & (big_ratio != 0.0) &
+            (difference > 0))
+        weight_variance = numpy.where(
+            use_weight_variance, numpy.exp(
+                numpy.where(use_weight_variance, log_weight_variance, 0.0)),
+            0.0)
 
         # upper bound calculation -> mean + n * SD
         return ((average_spikes_per_timestep * weight_mean) +
-                (sigma * math.sqrt(poisson_variance + weight_variance)))
+                (sigma * numpy.sqrt(poisson_variance + weight_variance)))
+
+    @staticmethod
+    def __pooled_stats(synapse_types, n_synapse_types, means, variances,
+                       n_items):
+        """ Combine the statistics of groups of items into the statistics of\
+            all the items of each synapse type at once, in the same way as\
+            adding each group to a ``RunningStats`` does
+
+        :param ~numpy.ndarray synapse_types: The synapse type of each group
+        :param int n_synapse_types: The number of synapse types
+        :param ~numpy.ndarray means: The mean of each group
+        :param ~numpy.ndarray variances: The variance of each group
+        :param ~numpy.ndarray n_items: The number of items in each group
+        :return: The mean, variance and number of items of each type
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+        """
+        # Empty groups are ignored, as RunningStats does
+        used = n_items > 0
+        types = synapse_types[used]
+        means = means[used]
+        variances = variances[used]
+        n_items = n_items[used]
+        total_items = numpy.bincount(
+            types, weights=n_items, minlength=n_synapse_types)
+        with numpy.errstate(all="ignore"):
+            mean = numpy.bincount(
+                types, weights=n_items * means,
+                minlength=n_synapse_types) / total_items
+            mean = numpy.where(total_items > 0, mean, 0.0)
+            deltas = means - mean[types]
+            mean_2 = numpy.bincount(
+                types, weights=(variances * (n_items - 1.0) +
+                                n_items * deltas * deltas),
+                minlength=n_synapse_types)
+            variance = numpy.where(
+                total_items > 1, mean_2 / (total_items - 1.0), 0.0)
+        return mean, variance, total_items
 
     def get_ring_buffer_shifts(self, incoming_projections):
         """ Get the shift of the ring buffers for transfer of values into the
-            input buffers for this model.
+            input buffers for this model.  The result is kept, so that\
+            repartitioning with the same projections does not repeat the work.
+
+        :param list(~spynnaker.pyNN.models.Projection) incoming_projections:
+            The projections to consider in the calculations
+        :rtype: list(int)
+        """
+        # The rates of the sources can change without a new projection,
+        # e.g. when a Poisson rate is raised, so they are part of the key
+        key = (tuple(incoming_projections),
+               self.__input_rates(incoming_projections),
+               self.__spikes_per_second, self.__ring_buffer_sigma,
+               machine_time_step())
+        cached_key, shifts = self.__ring_buffer_shifts_cache
+        if cached_key != key:
+            shifts = self.__compute_ring_buffer_shifts(incoming_projections)
+            self.__ring_buffer_shifts_cache = (key, shifts)
+        return list(shifts)
+
+    @staticmethod
+    def __input_rates(incoming_projections):
+        """ Get the maximum rates of the sources of the projections that\
+            declare them
+
+        :param list(~spynnaker.pyNN.models.Projection) incoming_projections:
+        :rtype: tuple(tuple(float, float) or None)
+        """
+        rates = list()
+        for proj in incoming_projections:
+            pre_vertex = proj._projection_edge.pre_vertex
+            if isinstance(pre_vertex, AbstractMaxSpikes):
+                rates.append((pre_vertex.max_spikes_per_second(),
+                              pre_vertex.max_spikes_per_ts()))
+            else:
+                rates.append(None)
+        return tuple(rates)
+
+    def __compute_ring_buffer_shifts(self, incoming_projections):
+        """ Compute the shift of the ring buffers from the statistics of all\
+            the incoming projections at once
 
         :param list(~spynnaker.pyNN.models.Projection) incoming_projections:
             The projections to consider in the calculations
@@ -838,93 +1086,97 @@ class AbstractPopulationVertex(
         weight_scale = self.__neuron_impl.get_global_weight_scale()
         weight_scale_squared = weight_scale * weight_scale
         n_synapse_types = self.__neuron_impl.get_n_synapse_types()
-        running_totals = [RunningStats() for _ in range(n_synapse_types)]
-        delay_running_totals = [RunningStats() for _ in range(n_synapse_types)]
-        total_weights = numpy.zeros(n_synapse_types)
-        biggest_weight = numpy.zeros(n_synapse_types)
-        weights_signed = False
-        rate_stats = [RunningStats() for _ in range(n_synapse_types)]
         steps_per_second = MICRO_TO_SECOND_CONVERSION / machine_time_step()
-
-        for proj in incoming_projections:
+        n_projections = len(incoming_projections)
+
+        # Gather the statistics of each projection
+        synapse_types = numpy.zeros(n_projections, dtype="int64")
+        weight_means = numpy.zeros(n_projections)
+        weight_variances = numpy.zeros(n_projections)
+        weight_maxes = numpy.zeros(n_projections)
+        delay_variances = numpy.zeros(n_projections)
+        n_connections = numpy.zeros(n_projections)
+        spikes_per_second = numpy.full(
+            n_projections, float(self.__spikes_per_second))
+        spikes_per_tick = numpy.full(n_projections, max(
+            1.0, self.__spikes_per_second / steps_per_second))
+        weights_signed = False
+        for i, proj in enumerate(incoming_projections):
             synapse_info = proj._synapse_information
-            synapse_type = synapse_info.synapse_type
             synapse_dynamics = synapse_info.synapse_dynamics
             connector = synapse_info.connector
 
-            weight_mean = (
-                synapse_dynamics.get_weight_mean(
-                    connector, synapse_info) * weight_scale)
-            n_connections = \
+            synapse_types[i] = synapse_info.synapse_type
+            weight_means[i] = synapse_dynamics.get_weight_mean(
+                connector, synapse_info)
+            weight_variances[i] = synapse_dynamics.get_weight_variance(
+                connector, synapse_info.weights, synapse_info)
+            weight_maxes[i] = synapse_dynamics.get_weight_maximum(
+                connector, synapse_info)
+            delay_variances[i] = synapse_dynamics.get_delay_variance(
+                connector, synapse_info.delays, synapse_info)
+            n_connections[i] = \
                 connector.get_n_connections_to_post_vertex_maximum(
                     synapse_info)
-            weight_variance = synapse_dynamics.get_weight_variance(
-                connector, synapse_info.weights,
-                synapse_info) * weight_scale_squared
-            running_totals[synapse_type].add_items(
-                weight_mean, weight_variance, n_connections)
-
-            delay_variance = synapse_dynamics.get_delay_variance(
-                connector, synapse_info.delays, synapse_info)
-            delay_running_totals[synapse_type].add_items(
-                0.0, delay_variance, n_connections)
 
-            weight_max = (synapse_dynamics.get_weight_maximum(
-                connector, synapse_info) * weight_scale)
-            biggest_weight[synapse_type] = max(
-                biggest_weight[synapse_type], weight_max)
-
-            spikes_per_tick = max(
-                1.0, self.__spikes_per_second / steps_per_second)
-            spikes_per_second = self.__spikes_per_second
             pre_vertex = proj._projection_edge.pre_vertex
             if isinstance(pre_vertex, AbstractMaxSpikes):
                 rate = pre_vertex.max_spikes_per_second()
                 if rate != 0:
-                    spikes_per_second = rate
-                spikes_per_tick = pre_vertex.max_spikes_per_ts()
-            rate_stats[synapse_type].add_items(
-                spikes_per_second, 0, n_connections)
-            total_weights[synapse_type] += spikes_per_tick * (
-                weight_max * n_connections)
+                    spikes_per_second[i] = rate
+                spikes_per_tick[i] = pre_vertex.max_spikes_per_ts()
 
             if synapse_dynamics.are_weights_signed():
                 weights_signed = True
-
-        max_weights = numpy.zeros(n_synapse_types)
-        for synapse_type in range(n_synapse_types):
-            if delay_running_totals[synapse_type].variance == 0.0:
-                max_weights[synapse_type] = max(total_weights[synapse_type],
-                                                biggest_weight[synapse_type])
-            else:
-                stats = running_totals[synapse_type]
-                rates = rate_stats[synapse_type]
-                max_weights[synapse_type] = min(
-                    self._ring_buffer_expected_upper_bound(
-                        stats.mean, stats.standard_deviation, rates.mean,
-                        stats.n_items, self.__ring_buffer_sigma),
-                    total_weights[synapse_type])
-                max_weights[synapse_type] = max(
-                    max_weights[synapse_type], biggest_weight[synapse_type])
-
-        # Convert these to powers; we could use int.bit_length() for this if
-        # they were integers, but they aren't...
-        max_weight_powers = (
-            0 if w <= 0 else int(math.ceil(max(0, math.log(w, 2))))
-            for w in max_weights)
+        weight_means *= weight_scale
+        weight_variances *= weight_scale_squared
+        weight_maxes *= weight_scale
+
+        # Combine them for each synapse type
+        mean, variance, n_items = self.__pooled_stats(
+            synapse_types, n_synapse_types, weight_means, weight_variances,
+            n_connections)
+        _, delay_variance, _ = self.__pooled_stats(
+            synapse_types, n_synapse_types, numpy.zeros(n_projections),
+            delay_variances, n_connections)
+        rate_mean, _, _ = self.__pooled_stats(
+            synapse_types, n_synapse_types, spikes_per_second,
+            numpy.zeros(n_projections), n_connections)
+        total_weights = numpy.bincount(
+            synapse_types, weights=spikes_per_tick * weight_maxes *
+            n_connections, minlength=n_synapse_types)
+        biggest_weight = numpy.zeros(n_synapse_types)
+        numpy.maximum.at(biggest_weight, synapse_types, weight_maxes)
+
+        # Where the delays vary, the inputs are spread over time, so the
+        # expected upper bound is used if it is smaller than the total
+        max_weights = numpy.maximum(total_weights, biggest_weight)
+        spread = delay_variance != 0.0
+        if spread.any():
+            bounds = self._ring_buffer_expected_upper_bound(
+                mean[spread], numpy.sqrt(variance[spread]), rate_mean[spread],
+                n_items[spread], self.__ring_buffer_sigma)
+            max_weights[spread] = numpy.maximum(
+                numpy.minimum(bounds, total_weights[spread]),
+                biggest_weight[spread])
+
+        # Convert these to powers
+        with numpy.errstate(divide="ignore"):
+            max_weight_powers = numpy.where(
+                max_weights <= 0, 0, numpy.ceil(numpy.maximum(
+                    0, numpy.log2(max_weights)))).astype("int64")
 
         # If 2^max_weight_power equals the max weight, we have to add another
         # power, as range is 0 - (just under 2^max_weight_power)!
-        max_weight_powers = (
-            w + 1 if (2 ** w) <= a else w
-            for w, a in zip(max_weight_powers, max_weights))
+        max_weight_powers += (
+            2.0 ** max_weight_powers <= max_weights).astype("int64")
 
         # If we have synapse dynamics that uses signed weights,
         # Add another bit of shift to prevent overflows
         if weights_signed:
-            max_weight_powers = (m + 1 for m in max_weight_powers)
+            max_weight_powers += 1
 
-        return list(max_weight_powers)
+        return [int(w) for w in max_weight_powers]
 
     @staticmethod
     def __get_weight_scale(ring_buffer_to_input_left_shift):
@@ -1213,8 +1465,29 @@ class AbstractPopulationVertex(
             neuron_regions.neuron_recording,
             self.__neuron_recorder.get_metadata_sdram_usage_in_bytes(
                 vertex_slice))
+        if self.__neuron_impl.supports_rate_coupling:
+            sdram.add_cost(
+                neuron_regions.rate_coupling,
+                self.get_rate_coupling_size(vertex_slice))
         return sdram
 
+    def get_rate_coupling_size(self, vertex_slice):
+        """ Get the size of the rate coupling region; as the source slices\
+            are not known until the sources are split, this allows for each\
+            source to be split into as many slices as it has atoms
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The slice of neurons to get the size of
+        :rtype: int
+        """
+        size = _RATE_COUPLING_HEADER_BYTES
+        for projection in self.__incoming_rate_projections:
+            pre_vertex = projection.edge.pre_vertex
+            size += pre_vertex.n_atoms * _RATE_SOURCE_HEADER_BYTES
+            size += (pre_vertex.n_atoms * vertex_slice.n_atoms *
+                     BYTES_PER_WORD)
+        return size
+
     def get_common_dtcm(self):
         """ Get the amount of DTCM used by common parts
 
@@ -13,21 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from .eif_cond_alpha_isfa_ista import EIFConductanceAlphaPopulation
-from .hh_cond_exp import HHCondExp
-from .if_cond_alpha import IFCondAlpha
-from .if_cond_exp_base import IFCondExpBase
-from .if_curr_alpha import IFCurrAlpha
-from .if_curr_dual_exp_base import IFCurrDualExpBase
-from .if_curr_exp_base import IFCurrExpBase
-from .if_facets_hardware1 import IFFacetsConductancePopulation
-from .izk_cond_exp_base import IzkCondExpBase
-from .izk_curr_exp_base import IzkCurrExpBase
-from .if_cond_exp_stoc import IFCondExpStoc
-from .if_curr_delta import IFCurrDelta
-from .if_curr_exp_ca2_adaptive import IFCurrExpCa2Adaptive
-from .if_curr_exp_semd_base import IFCurrExpSEMDBase
-from .meanfield_base import MeanfieldBase
+from spynnaker.pyNN.utilities.lazy_attributes import lazy_attributes
 
 __all__ = ["EIFConductanceAlphaPopulation", "HHCondExp", "IFCondAlpha",
            "IFCondExpBase", "IFCurrAlpha", "IFCurrDualExpBase",
@@ -35,3 +21,24 @@ __all__ = ["EIFConductanceAlphaPopulation", "HHCondExp", "IFCondAlpha",
            "IzkCurrExpBase", "IFCondExpStoc",
            "IFCurrDelta", "IFCurrExpCa2Adaptive", "IFCurrExpSEMDBase",
            "MeanfieldBase", ]
+
+# The models are only imported when first used, as each pulls in a lot
+__getattr__, __dir__ = lazy_attributes(globals(), {
+    "EIFConductanceAlphaPopulation": (
+        ".eif_cond_alpha_isfa_ista", "EIFConductanceAlphaPopulation"),
+    "HHCondExp": (".hh_cond_exp", "HHCondExp"),
+    "IFCondAlpha": (".if_cond_alpha", "IFCondAlpha"),
+    "IFCondExpBase": (".if_cond_exp_base", "IFCondExpBase"),
+    "IFCurrAlpha": (".if_curr_alpha", "IFCurrAlpha"),
+    "IFCurrDualExpBase": (".if_curr_dual_exp_base", "IFCurrDualExpBase"),
+    "IFCurrExpBase": (".if_curr_exp_base", "IFCurrExpBase"),
+    "IFFacetsConductancePopulation": (
+        ".if_facets_hardware1", "IFFacetsConductancePopulation"),
+    "IzkCondExpBase": (".izk_cond_exp_base", "IzkCondExpBase"),
+    "IzkCurrExpBase": (".izk_curr_exp_base", "IzkCurrExpBase"),
+    "IFCondExpStoc": (".if_cond_exp_stoc", "IFCondExpStoc"),
+    "IFCurrDelta": (".if_curr_delta", "IFCurrDelta"),
+    "IFCurrExpCa2Adaptive": (
+        ".if_curr_exp_ca2_adaptive", "IFCurrExpCa2Adaptive"),
+    "IFCurrExpSEMDBase": (".if_curr_exp_semd_base", "IFCurrExpSEMDBase"),
+    "MeanfieldBase": (".meanfield_base", "MeanfieldBase")})
@@ -120,13 +120,20 @@ class MeanfieldBase(AbstractPyNNMeanfieldModelStandard):
                  isyn_inh=0.0,
 
                  sample=1000,
-                 err_func=0.):
+                 err_func=0.,
+
+                 integrator="rk2",
+                 tolerance=0.01,
+                 h_min=0.01,
+                 max_steps=16):
         # pylint: disable=too-many-arguments, too-many-locals
         #muVV = ((muGe*Erev_exc + muGi*Erev_inh + Gl*El - Ve*tauw*(b) + a*El) /muG)/ (1+a/muG)
         #w = Ve * b * tauw + a * (El-muV0)
         neuron_model = MeanfieldOfAdexNetwork(a, b, tauw, Trefrac,
                                               Vreset, delta_v, ampnoise,
-                                              Timescale_inv, Ve, Vi, w)
+                                              Timescale_inv, Ve, Vi, w,
+                                              integrator, tolerance, h_min,
+                                              max_steps)
         params_from_network = ParamsFromNetwork(pconnec, q_exc, q_inh,
                                                 Tsyn_exc, Tsyn_inh,
                                                 Erev_exc, Erev_inh,
@@ -18,6 +18,7 @@ from data_specification.enums.data_type import DataType
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.globals_variables import (
     machine_time_step_per_ms)
+from .synapse_expander_replay import can_replay, replay_expansion
 
 # Address to indicate that the synaptic region is unused
 SYN_REGION_UNUSED = 0xFFFFFFFF
@@ -28,6 +29,7 @@ class GeneratorData(object):
     """
     __slots__ = [
         "__delayed_synaptic_matrix_offset",
+        "__gen_data",
         "__max_delayed_row_n_synapses",
         "__max_delayed_row_n_words",
         "__max_row_n_synapses",
@@ -62,6 +64,7 @@ class GeneratorData(object):
         self.__synapse_information = synapse_information
         self.__max_stage = max_stage
         self.__max_delay_per_stage = max_delay_per_stage
+        self.__gen_data = None
 
         # Offsets are used in words in the generator, but only
         # if the values are valid
@@ -89,9 +92,45 @@ class GeneratorData(object):
 
     @property
     def gen_data(self):
-        """ The data to be written for this connection
+        """ The data to be written for this connection.  This is only made\
+            once, so that it can be replayed on the host later
 
-        :rtype: ~numpy.ndarray(~numpy.uint32)
+        :rtype: list(~numpy.ndarray(~numpy.uint32))
+        """
+        if self.__gen_data is None:
+            self.__gen_data = self.__make_gen_data()
+        return self.__gen_data
+
+    @property
+    def can_replay(self):
+        """ Whether the connections generated from this data can be made\
+            again on the host, rather than being read from the machine
+
+        :rtype: bool
+        """
+        return can_replay(self.gen_data)
+
+    def replay_connections(self, weight_scales):
+        """ Make the connections that are generated from this data on the\
+            host, exactly as they are made on the machine
+
+        :param list(float) weight_scales: The weight scale of each synapse type
+        :return: The connections, with the same dtype and units as when read
+            from the machine
+        :rtype: ~numpy.ndarray
+        """
+        connections = replay_expansion(
+            self.gen_data, self.__post_vertex_slice.lo_atom,
+            self.__post_vertex_slice.n_atoms,
+            weight_scales[self.__synapse_information.synapse_type])
+        connections["delay"] /= machine_time_step_per_ms()
+        connections["weight"] /= weight_scales[
+            self.__synapse_information.synapse_type]
+        return connections
+
+    def __make_gen_data(self):
+        """
+        :rtype: list(~numpy.ndarray(~numpy.uint32))
         """
         connector = self.__synapse_information.connector
         synapse_dynamics = self.__synapse_information.synapse_dynamics
@@ -188,3 +188,21 @@ class AbstractNeuronImpl(object, metaclass=AbstractBase):
 
         :rtype: bool
         """
+
+    @property
+    def supports_recording_modes(self):
+        """ Whether the binary reads a recording mode for each variable,\
+            so that values can be combined over time or units when recorded
+
+        :rtype: bool
+        """
+        return False
+
+    @property
+    def supports_rate_coupling(self):
+        """ Whether the binary has a rate coupling region, so that it can\
+            send and receive rates rather than spikes
+
+        :rtype: bool
+        """
+        return False
@@ -190,6 +190,16 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
     def get_synapse_targets(self):
         return self.__synapse_type.get_synapse_targets()
 
+    @property
+    @overrides(AbstractNeuronImpl.supports_recording_modes)
+    def supports_recording_modes(self):
+        return True
+
+    @property
+    @overrides(AbstractNeuronImpl.supports_rate_coupling)
+    def supports_rate_coupling(self):
+        return True
+
     @overrides(AbstractNeuronImpl.get_recordable_variables)
     def get_recordable_variables(self):
         return self._RECORDABLES
@@ -16,6 +16,7 @@
 from .abstract_neuron_model import AbstractNeuronModel
 from .neuron_model_izh import NeuronModelIzh
 from .meanfield_of_adex_network import MeanfieldOfAdexNetwork
+from .meanfield_reference import MeanfieldReference, run_coupled
 from .params_from_network import ParamsFromNetwork
 from .P_fit_polynomial_exc import pFitPolynomialExc
 from .P_fit_polynomial_inh import pFitPolynomialInh
@@ -25,6 +26,6 @@ from .neuron_model_leaky_integrate_and_fire import (
 
 __all__ = ["AbstractNeuronModel", "NeuronModelIzh",
            "NeuronModelLeakyIntegrateAndFire",
-           "MeanfieldOfAdexNetwork",
+           "MeanfieldOfAdexNetwork", "MeanfieldReference",
            "pFitPolynomialExc", "pFitPolynomialInh",
-           "ParamsFromNetwork", "Mathsbox"]
+           "ParamsFromNetwork", "Mathsbox", "run_coupled"]
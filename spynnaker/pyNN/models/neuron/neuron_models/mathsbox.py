@@ -49,7 +49,8 @@ class Mathsbox(AbstractInputType):
         """
         super().__init__(
             [DataType.UINT32, #sample
-            DataType.S1615]) # error fonction
+            DataType.S1615, # error fonction
+            DataType.S1615]) # var_sqrt (working space)
         self._sample = sample
         self._err_func = err_func
 
@@ -89,14 +90,14 @@ class Mathsbox(AbstractInputType):
 
         # Add the rest of the data
         return [
-            parameters[SAMPLE], state_variables[ERR_FUNC],
+            parameters[SAMPLE], state_variables[ERR_FUNC], 0,
         ]
 
     @overrides(AbstractStandardNeuronComponent.update_values)
     def update_values(self, values, parameters, state_variables):
 
         # Decode the values
-        _sample = values
+        _sample, err_func, _var_sqrt = values
 
         # Copy the changed data only
         state_variables[ERR_FUNC] = err_func
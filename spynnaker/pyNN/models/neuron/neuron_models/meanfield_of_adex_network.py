@@ -34,6 +34,17 @@ VE = "Ve"
 VI = "Vi"
 W = "w"
 
+#: A guess at the CPU cycles taken by one integration step of a meanfield
+_CYCLES_PER_STEP = 150
+
+#: The integrators that can be chosen, mapped to their ids on the machine
+INTEGRATORS = {
+    # Fixed steps of the RK2 midpoint method
+    "rk2": 0,
+    # Embedded Heun-Euler pair with step size control per meanfield
+    "heun_euler": 1
+}
+
 UNITS = {
     ###--Meanfield--###
     #NBR: "",
@@ -56,19 +67,34 @@ class MeanfieldOfAdexNetwork(AbstractNeuronModel):
     """
     __slots__ = [
         "_a", "_b", "_tauw", "_Trefrac", "_Vreset", "_delta_v",
-        "_ampnoise", "_Timescale_inv", "_Ve_init", "_Vi_init", "_w_init"
+        "_ampnoise", "_Timescale_inv", "_Ve_init", "_Vi_init", "_w_init",
+        "_integrator", "_tolerance", "_h_min", "_max_steps"
     ]
 
     def __init__(self, a, b, tauw,
                  Trefrac, Vreset, delta_v,
                  ampnoise, Timescale_inv,
-                 Ve_init, Vi_init, w_init):
+                 Ve_init, Vi_init, w_init,
+                 integrator="rk2", tolerance=0.01, h_min=0.01, max_steps=16):
         """
         :param a: :math:`a`
         :type a: float, iterable(float), ~pyNN.random.RandomDistribution or
             (mapping) function
-        
+        :param str integrator:
+            The integrator to use; one of the keys of :py:data:`INTEGRATORS`
+        :param float tolerance:
+            The largest local error (in Hz) accepted by the adaptive
+            integrator in one step
+        :param float h_min:
+            The smallest step (in ms) that the adaptive integrator will take
+        :param int max_steps:
+            The most steps the adaptive integrator will try in each update;
+            this bounds the time taken per timestep
         """
+        if integrator not in INTEGRATORS:
+            raise ValueError(
+                "Unknown integrator {}; choose one of {}".format(
+                    integrator, sorted(INTEGRATORS)))
         super().__init__(
             [DataType.S1615, #a DataType.UINT32, #nbr
             DataType.S1615, #b
@@ -82,7 +108,11 @@ class MeanfieldOfAdexNetwork(AbstractNeuronModel):
             DataType.S1615, #Vi
             DataType.S1615, #W
             DataType.S1615],  # this_h (= machine_time_step)
-            [DataType.S1615])  # machine_time_step
+            [DataType.S1615,  # machine_time_step
+             DataType.UINT32,  # integrator
+             DataType.S1615,  # tolerance
+             DataType.S1615,  # h_min
+             DataType.UINT32])  # max_steps
         self._a = a
         self._b = b
         self._tauw = tauw
@@ -94,11 +124,18 @@ class MeanfieldOfAdexNetwork(AbstractNeuronModel):
         self._Ve_init = Ve_init
         self._Vi_init = Vi_init
         self._w_init = w_init
+        self._integrator = integrator
+        self._tolerance = tolerance
+        self._h_min = h_min
+        self._max_steps = max_steps
 
     @overrides(AbstractStandardNeuronComponent.get_n_cpu_cycles)
     def get_n_cpu_cycles(self, n_neurons):
-        # A bit of a guess
-        return 150 * n_neurons
+        # The adaptive integrator may try up to max_steps steps per update
+        n_steps = 1
+        if self._integrator == "heun_euler":
+            n_steps = self._max_steps
+        return _CYCLES_PER_STEP * n_steps * n_neurons
 
     @overrides(AbstractStandardNeuronComponent.add_parameters)
     def add_parameters(self, parameters):
@@ -130,7 +167,9 @@ class MeanfieldOfAdexNetwork(AbstractNeuronModel):
     @overrides(AbstractNeuronModel.get_global_values)
     def get_global_values(self, ts):
         # pylint: disable=arguments-differ
-        return [float(ts) / MICRO_TO_MILLISECOND_CONVERSION]
+        return [float(ts) / MICRO_TO_MILLISECOND_CONVERSION,
+                INTEGRATORS[self._integrator], self._tolerance, self._h_min,
+                self._max_steps]
 
     @overrides(AbstractStandardNeuronComponent.get_values)
     def get_values(self, parameters, state_variables, vertex_slice, ts):
@@ -207,6 +246,38 @@ class MeanfieldOfAdexNetwork(AbstractNeuronModel):
     def Timescale_inv(self):
         return self._Timescale_inv
 
+    @property
+    def integrator(self):
+        """ The integrator used to update the meanfields
+
+        :rtype: str
+        """
+        return self._integrator
+
+    @property
+    def tolerance(self):
+        """ The largest local error accepted by the adaptive integrator
+
+        :rtype: float
+        """
+        return self._tolerance
+
+    @property
+    def h_min(self):
+        """ The smallest step taken by the adaptive integrator
+
+        :rtype: float
+        """
+        return self._h_min
+
+    @property
+    def max_steps(self):
+        """ The most steps tried by the adaptive integrator per update
+
+        :rtype: int
+        """
+        return self._max_steps
+
     @property
     def Ve_init(self):
         """ Settable model parameter: :math:`V_{e}`
@@ -0,0 +1,298 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import math
+import numpy
+from .meanfield_of_adex_network import INTEGRATORS
+
+#: The value the machine adds to quantities to keep them away from zero
+_TINY = 0.000001
+_TWO_OVER_SQRT_PI = 2.0 / math.sqrt(math.pi)
+
+
+class MeanfieldReference(object):
+    """ A host model of the update that the machine does to a single\
+        meanfield, in double precision.  This can be used to check what the\
+        machine does, and to find the largest timestep at which the chosen\
+        integrator stays accurate; the adaptive integrator counts the steps\
+        it accepts and rejects.
+    """
+
+    __slots__ = [
+        "__params", "__integrator", "__tolerance", "__h_min", "__max_steps",
+        "__Ve", "__Vi", "__w", "__this_h", "__n_accepted", "__n_rejected",
+        "__exc_rate", "__inh_rate"]
+
+    def __init__(self, parameters, integrator="rk2", tolerance=0.01,
+                 h_min=0.01, max_steps=16):
+        """
+        :param dict(str,float) parameters:
+            The parameters and initial values of the meanfield, by the names
+            used by
+            :py:class:`~spynnaker.pyNN.models.neuron.builds.MeanfieldBase`,
+            e.g. ``dict(MeanfieldBase.default_parameters,
+            **MeanfieldBase.default_initial_values)``
+        :param str integrator: The integrator to use
+        :param float tolerance:
+            The largest local error accepted by the adaptive integrator
+        :param float h_min: The smallest step of the adaptive integrator
+        :param int max_steps:
+            The most steps tried by the adaptive integrator per update
+        """
+        if integrator not in INTEGRATORS:
+            raise ValueError(
+                "Unknown integrator {}; choose one of {}".format(
+                    integrator, sorted(INTEGRATORS)))
+        self.__params = dict(parameters)
+        self.__integrator = integrator
+        self.__tolerance = tolerance
+        self.__h_min = h_min
+        self.__max_steps = max_steps
+        self.__Ve = float(parameters["Ve"])
+        self.__Vi = float(parameters["Vi"])
+        self.__w = float(parameters["w"])
+        self.__this_h = None
+        self.__n_accepted = 0
+        self.__n_rejected = 0
+        self.__exc_rate = 0.0
+        self.__inh_rate = 0.0
+
+    @property
+    def state(self):
+        """ The current excitatory rate, inhibitory rate and adaptation
+
+        :rtype: tuple(float, float, float)
+        """
+        return self.__Ve, self.__Vi, self.__w
+
+    @property
+    def n_accepted(self):
+        """ The number of integration steps accepted so far
+
+        :rtype: int
+        """
+        return self.__n_accepted
+
+    @property
+    def n_rejected(self):
+        """ The number of integration steps rejected so far (always 0 for\
+            fixed step integrators)
+
+        :rtype: int
+        """
+        return self.__n_rejected
+
+    def run(self, n_timesteps, timestep=1.0, n_steps_per_timestep=1):
+        """ Run the meanfield as the machine would.
+
+        :param int n_timesteps: The number of timesteps to run for
+        :param float timestep: The machine timestep, in ms
+        :param int n_steps_per_timestep: The number of updates per timestep
+        :return: The state at the start of each timestep, as recorded by
+            the machine, with a row for each of Ve, Vi and w
+        :rtype: ~numpy.ndarray
+        """
+        recorded = numpy.zeros((3, n_timesteps))
+        for tick in range(n_timesteps):
+            recorded[:, tick] = self.state
+            self.step(timestep, n_steps_per_timestep)
+        return recorded
+
+    def step(self, timestep=1.0, n_steps_per_timestep=1, exc_rate=0.0,
+             inh_rate=0.0):
+        """ Do the updates of a single timestep as the machine would.
+
+        :param float timestep: The machine timestep, in ms
+        :param int n_steps_per_timestep: The number of updates per timestep
+        :param float exc_rate:
+            The excitatory rate coupled in from other meanfields
+        :param float inh_rate:
+            The inhibitory rate coupled in from other meanfields
+        """
+        h = timestep / n_steps_per_timestep
+        if self.__this_h is None:
+            self.__this_h = h
+        self.__exc_rate = exc_rate
+        self.__inh_rate = inh_rate
+        for _ in range(n_steps_per_timestep):
+            if self.__integrator == "heun_euler":
+                self.__heun_euler(h)
+            else:
+                self.__rk2(self.__this_h)
+                self.__this_h = h
+
+    def __transfer_function(self, suffix):
+        """ The rate that a population is driven towards by the current state
+
+        :param str suffix: "exc" or "inh", to choose the threshold fit
+        :rtype: float
+        """
+        p = self.__params
+        # The coupled rates add to the rates of the meanfield itself
+        Ve = self.__Ve + self.__exc_rate
+        Vi = self.__Vi + self.__inh_rate
+        Ve = Ve if Ve >= _TINY else Ve + _TINY
+        Vi = Vi if Vi >= _TINY else Vi + _TINY
+        W = self.__w
+
+        # Fluctuation regime
+        Fe = Ve * (1.0 - p["gei"]) * p["pconnec"] * p["Ntot"]
+        Fi = Vi * p["gei"] * p["pconnec"] * p["Ntot"]
+        Qe, Qi = p["q_exc"], p["q_inh"]
+        Te, Ti = p["Tsyn_exc"], p["Tsyn_inh"]
+        Ee, Ei = p["Erev_exc"], p["Erev_inh"]
+        Gl, Cm, El = p["Gl"], p["Cm"], p["El"]
+        muGe = Qe * Te * Fe
+        muGi = Qi * Ti * Fi
+        muG = Gl + muGe + muGi
+        if muG < _TINY:
+            muG += _TINY
+        muV = (muGe * Ee + muGi * Ei + Gl * El - W) / muG
+        Tm = Cm / muG
+        Ue = Qe * (Ee - muV) / muG
+        Ui = Qi * (Ei - muV) / muG
+        exc = (Ue * Te) ** 2
+        inh = (Ti * Ui) ** 2
+        sV = 0.5 * (Fe * exc / (Te + Tm) + Fi * inh / (Ti + Tm))
+        if Fe < _TINY:
+            Fe += _TINY
+        elif Fi < _TINY:
+            Fi += _TINY
+        Tv = (Fe * exc + Fi * inh) / (Fe * exc / (Te + Tm) +
+                                      Fi * inh / (Ti + Tm))
+        if Tv < _TINY:
+            Tv += _TINY
+        TvN = Tv * Gl / Cm
+
+        # Threshold
+        P = [p["p{}_{}".format(i, suffix)] for i in range(11)]
+        mu = (muV - p["muV0"]) / p["DmuV0"]
+        s = (sV - p["sV0"]) / p["DsV0"]
+        t = (TvN - p["TvN0"]) / p["DTvN0"]
+        Vthre = (P[0] + P[1] * mu + P[2] * s + P[3] * t + P[5] * mu * mu +
+                 P[6] * s * s + P[7] * t * t + P[8] * mu * s + P[9] * mu * t +
+                 P[10] * s * t)
+
+        # Complementary error function by the midpoint rule
+        if sV < _TINY:
+            sV += _TINY
+        argument = (Vthre - muV) / (1.4142137 * sV)
+        erf = 0.0
+        if argument > 0:
+            step = argument / p["sample"]
+            points = (numpy.arange(p["sample"] + 1) + 0.5) * step
+            erf = step * _TWO_OVER_SQRT_PI * numpy.exp(-points * points).sum()
+        Fout = 0.5 * Gl * (1.0 - erf) / (Cm * TvN)
+        if Fout < _TINY:
+            Fout += _TINY
+        return Fout
+
+    def __rk2_step(self, h, tf_exc, tf_inh):
+        """ One RK2 midpoint step with the transfer functions held fixed
+
+        :return: The change in each state variable, and the largest
+            difference from an Euler step (the local error estimate)
+        :rtype: tuple(tuple(float,float,float), float)
+        """
+        T_inv = self.__params["Timescale_inv"]
+        tauw = self.__params["tauw"]
+        b = self.__params["b"]
+        Ve, Vi, w = self.state
+        k1 = ((tf_exc - Ve) * T_inv, (tf_inh - Vi) * T_inv,
+              -w / tauw + b * Ve)
+        k2 = ((tf_exc - (Ve + h * k1[0])) * T_inv,
+              (tf_inh - (Vi + h * k1[1])) * T_inv,
+              -(w + h * k1[2]) / tauw + b * Ve)
+        change = tuple(0.5 * h * (a + c) for a, c in zip(k1, k2))
+        error = max(abs(0.5 * h * (c - a)) for a, c in zip(k1, k2))
+        return change, error
+
+    def __apply(self, change):
+        self.__Ve += change[0]
+        self.__Vi += change[1]
+        self.__w += change[2]
+
+    def __rk2(self, h):
+        tf_exc = self.__transfer_function("exc")
+        tf_inh = self.__transfer_function("inh")
+        change, _ = self.__rk2_step(h, tf_exc, tf_inh)
+        self.__apply(change)
+        self.__n_accepted += 1
+
+    def __heun_euler(self, interval):
+        h = max(self.__this_h, self.__h_min)
+        remaining = interval
+        n_tries = 0
+        tfs = None
+        while remaining > 0:
+            n_tries += 1
+            if h > remaining or n_tries >= self.__max_steps:
+                h = remaining
+            if tfs is None:
+                tfs = (self.__transfer_function("exc"),
+                       self.__transfer_function("inh"))
+            change, error = self.__rk2_step(h, *tfs)
+            if (error > self.__tolerance and h > self.__h_min and
+                    n_tries < self.__max_steps):
+                h = max(h / 2.0, self.__h_min)
+                self.__n_rejected += 1
+                continue
+            self.__apply(change)
+            tfs = None
+            # Stop float rounding leaving a sliver of the interval to do
+            remaining -= h
+            if remaining < interval * 1e-9:
+                remaining = 0.0
+            self.__n_accepted += 1
+            if error * 4.0 < self.__tolerance and h * 2.0 <= interval:
+                h *= 2.0
+        self.__this_h = h
+
+
+def run_coupled(populations, couplings, n_timesteps, timestep=1.0,
+                n_steps_per_timestep=1):
+    """ Run populations of meanfields coupled by rates as the machine would;\
+        each population receives the rates that its sources had at the start\
+        of the timestep, i.e. the rates sent at the end of the previous one.
+
+    :param list(list(MeanfieldReference)) populations:
+        The meanfields of each population
+    :param couplings: The couplings between the populations, each of\
+        (pre index, post index, weights of shape (n_pre, n_post), source\
+        ``"Ve"`` or ``"Vi"``, receptor ``"excitatory"`` or ``"inhibitory"``)
+    :type couplings: list(tuple(int, int, ~numpy.ndarray, str, str))
+    :param int n_timesteps: The number of timesteps to run for
+    :param float timestep: The machine timestep, in ms
+    :param int n_steps_per_timestep: The number of updates per timestep
+    :return: For each population, the state at the start of each timestep,\
+        indexed by Ve/Vi/w, meanfield and timestep
+    :rtype: list(~numpy.ndarray)
+    """
+    recorded = [numpy.zeros((3, len(units), n_timesteps))
+                for units in populations]
+    for tick in range(n_timesteps):
+        for units, record in zip(populations, recorded):
+            record[:, :, tick] = numpy.array(
+                [unit.state for unit in units]).T
+        inputs = [numpy.zeros((2, len(units))) for units in populations]
+        # Nothing has been sent before the first timestep
+        if tick > 0:
+            for pre, post, weights, source, receptor in couplings:
+                rates = recorded[pre][0 if source == "Ve" else 1, :, tick]
+                inputs[post][0 if receptor == "excitatory" else 1] += (
+                    rates.dot(weights))
+        for units, (exc, inh) in zip(populations, inputs):
+            for i, unit in enumerate(units):
+                unit.step(timestep, n_steps_per_timestep, exc[i], inh[i])
+    return recorded
@@ -21,10 +21,12 @@ from spinn_utilities.overrides import overrides
 from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
 from spinn_front_end_common.utilities import helpful_functions
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from data_specification.enums import DataType
 from spynnaker.pyNN.models.abstract_models import (
     AbstractReadParametersBeforeSet)
 from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
-from spynnaker.pyNN.utilities.utility_calls import get_n_bits
+from spynnaker.pyNN.utilities.utility_calls import (
+    get_n_bits, convert_array_to)
 
 
 class NeuronProvenance(ctypes.LittleEndianStructure):
@@ -47,7 +49,7 @@ class NeuronProvenance(ctypes.LittleEndianStructure):
 # Identifiers for neuron regions
 NeuronRegions = namedtuple(
     "NeuronRegions",
-    ["neuron_params", "neuron_recording"])
+    ["neuron_params", "neuron_recording", "rate_coupling"])
 
 
 class PopulationMachineNeurons(
@@ -156,6 +158,62 @@ class PopulationMachineNeurons(
         neuron_recorder.write_neuron_recording_region(
             spec, self._neuron_regions.neuron_recording, self._vertex_slice)
 
+        # Write the rate coupling region if the binary has one
+        if self._app_vertex.neuron_impl.supports_rate_coupling:
+            self._write_rate_coupling(spec, routing_info)
+
+    def _get_n_neuron_keys(self):
+        """ The number of keys needed to send from the neurons; a vertex that\
+            sends rates needs a second block of keys for the inhibitory rates
+
+        :rtype: int
+        """
+        n_atoms = self._vertex_slice.n_atoms
+        if self._app_vertex.sends_rates:
+            return 2 * 2**get_n_bits(n_atoms)
+        return n_atoms
+
+    def _write_rate_coupling(self, spec, routing_info):
+        """ Write the rate coupling region
+
+        :param ~data_specification.DataSpecificationGenerator spec:
+            The data specification to write to
+        :param ~pacman.model.routing_info.RoutingInfo routing_info:
+            The routing information to read the source keys from
+        """
+        spec.reserve_memory_region(
+            region=self._neuron_regions.rate_coupling,
+            size=self._app_vertex.get_rate_coupling_size(self._vertex_slice),
+            label="rate coupling")
+        spec.switch_write_focus(self._neuron_regions.rate_coupling)
+
+        post_slice = self._vertex_slice
+        sources = list()
+        for projection in self._app_vertex.incoming_rate_projections:
+            for edge in projection.edge.machine_edges:
+                if edge.post_vertex is not self:
+                    continue
+                pre_slice = edge.pre_vertex.vertex_slice
+                r_info = routing_info.get_routing_info_from_pre_vertex(
+                    edge.pre_vertex, SPIKE_PARTITION_ID)
+                weights = projection.weights[
+                    pre_slice.as_slice, post_slice.as_slice]
+                sources.append((
+                    r_info.first_key, r_info.first_mask, pre_slice.n_atoms,
+                    2**get_n_bits(pre_slice.n_atoms),
+                    int(projection.source_is_vi), projection.receptor,
+                    weights))
+
+        spec.write_value(int(self._app_vertex.sends_rates))
+        spec.write_value(2**get_n_bits(post_slice.n_atoms))
+        spec.write_value(len(sources))
+        for (key, mask, n_pre, vi_offset, source_is_vi, receptor,
+                weights) in sources:
+            spec.write_array(
+                [key, mask, n_pre, vi_offset, source_is_vi, receptor])
+            spec.write_array(convert_array_to(
+                weights.flatten(), DataType.S1615).view("uint32"))
+
     def _write_neuron_parameters(self, spec, ring_buffer_shifts):
         """ Write the neuron parameters region
 
@@ -208,9 +266,8 @@ class PopulationMachineNeurons(
             self._vertex_slice)
         spec.write_array(neuron_data)
 
-    @overrides(AbstractReadParametersBeforeSet.read_parameters_from_machine)
-    def read_parameters_from_machine(
-            self, transceiver, placement, vertex_slice):
+    @overrides(AbstractReadParametersBeforeSet.read_parameter_data)
+    def read_parameter_data(self, transceiver, placement, vertex_slice):
 
         # locate SDRAM address to where the neuron parameters are stored
         neuron_region_sdram_address = \
@@ -233,11 +290,13 @@ class PopulationMachineNeurons(
             vertex_slice) - neurons_pre_size
 
         # get data from the machine
-        byte_array = transceiver.read_memory(
+        return transceiver.read_memory(
             placement.x, placement.y, neuron_parameters_sdram_address,
             size_of_region)
 
+    @overrides(AbstractReadParametersBeforeSet.update_parameters_from_data)
+    def update_parameters_from_data(self, data, vertex_slice):
         # update python neuron parameters with the data
         self._app_vertex.neuron_impl.read_data(
-            byte_array, 0, vertex_slice, self._app_vertex.parameters,
+            data, 0, vertex_slice, self._app_vertex.parameters,
             self._app_vertex.state_variables)
@@ -18,6 +18,7 @@ import ctypes
 
 from pacman.executor.injection_decorator import inject_items
 from spinn_utilities.overrides import overrides
+from pacman.model.graphs.machine import MachineVertex
 from spinn_front_end_common.abstract_models import (
     AbstractGeneratesDataSpecification, AbstractRewritesDataSpecification)
 from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
@@ -108,6 +109,7 @@ class PopulationMachineVertex(
         BIT_FIELD_BUILDER = 13
         BIT_FIELD_KEY_MAP = 14
         RECORDING = 15
+        RATE_COUPLING = 16
 
     # Regions for this vertex used by common parts
     COMMON_REGIONS = CommonRegions(
@@ -119,7 +121,8 @@ class PopulationMachineVertex(
     # Regions for this vertex used by neuron parts
     NEURON_REGIONS = NeuronRegions(
         neuron_params=REGIONS.NEURON_PARAMS.value,
-        neuron_recording=REGIONS.NEURON_RECORDING.value
+        neuron_recording=REGIONS.NEURON_RECORDING.value,
+        rate_coupling=REGIONS.RATE_COUPLING.value
     )
 
     # Regions for this vertex used by synapse parts
@@ -195,6 +198,10 @@ class PopulationMachineVertex(
     def _set_key(self, key):
         self.__key = key
 
+    @overrides(MachineVertex.get_n_keys_for_partition)
+    def get_n_keys_for_partition(self, partition):
+        return self._get_n_neuron_keys()
+
     @property
     @overrides(PopulationMachineNeurons._neuron_regions)
     def _neuron_regions(self):
@@ -18,6 +18,7 @@ import ctypes
 
 from pacman.executor.injection_decorator import inject_items
 from spinn_utilities.overrides import overrides
+from pacman.model.graphs.machine import MachineVertex
 from spinn_front_end_common.abstract_models import (
     AbstractGeneratesDataSpecification, AbstractRewritesDataSpecification)
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
@@ -74,6 +75,7 @@ class PopulationNeuronsMachineVertex(
         NEURON_PARAMS = 4
         NEURON_RECORDING = 5
         SDRAM_EDGE_PARAMS = 6
+        RATE_COUPLING = 7
 
     # Regions for this vertex used by common parts
     COMMON_REGIONS = CommonRegions(
@@ -85,7 +87,8 @@ class PopulationNeuronsMachineVertex(
     # Regions for this vertex used by neuron parts
     NEURON_REGIONS = NeuronRegions(
         neuron_params=REGIONS.NEURON_PARAMS.value,
-        neuron_recording=REGIONS.NEURON_RECORDING.value
+        neuron_recording=REGIONS.NEURON_RECORDING.value,
+        rate_coupling=REGIONS.RATE_COUPLING.value
     )
 
     _PROFILE_TAG_LABELS = {
@@ -137,6 +140,10 @@ class PopulationNeuronsMachineVertex(
     def _set_key(self, key):
         self.__key = key
 
+    @overrides(MachineVertex.get_n_keys_for_partition)
+    def get_n_keys_for_partition(self, partition):
+        return self._get_n_neuron_keys()
+
     @property
     @overrides(PopulationMachineNeurons._neuron_regions)
     def _neuron_regions(self):
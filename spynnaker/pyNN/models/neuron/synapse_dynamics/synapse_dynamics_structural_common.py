@@ -307,25 +307,34 @@ class SynapseDynamicsStructuralCommon(
         connections["source"] = connections["source"] - lo_atoms
         connections["target"] = connections["target"] - vertex_slice.lo_atom
 
-        # Make an array of all data required
-        conn_data = numpy.dstack(
-            (pop_indices, subpop_indices, connections["source"]))[0]
-
-        # Break data into rows based on target and strip target out
-        rows = [conn_data[connections["target"] == i]
-                for i in range(0, vertex_slice.n_atoms)]
-
-        if any(len(row) > self.s_max for row in rows):
+        # Make a single word of all data required per connection; this is
+        # the little-endian layout of the (u1 pop, u1 subpop, u2 source)
+        # record read by the C code
+        conn_data = (
+            (pop_indices.astype("uint32") & 0xFF) |
+            ((subpop_indices.astype("uint32") & 0xFF) << 8) |
+            ((connections["source"].astype("uint32") & 0xFFFF) << 16))
+
+        # Group the connections by target, keeping their original order
+        targets = connections["target"].astype("int64")
+        order = numpy.argsort(targets, kind="stable")
+        row_lengths = numpy.bincount(targets, minlength=vertex_slice.n_atoms)
+        if len(row_lengths) and row_lengths.max() > self.s_max:
             raise Exception("Too many initial connections per incoming neuron")
 
-        # Make each row the required length through padding with 0xFFFF
-        padded_rows = [numpy.pad(row, [(self.s_max - len(row), 0), (0, 0)],
-                                 "constant", constant_values=0xFFFF)
-                       for row in rows]
+        # Each row is padded at the start with 0xFFFF in every field, so the
+        # connections of a row go to its last columns
+        sorted_targets = targets[order]
+        row_starts = numpy.cumsum(row_lengths) - row_lengths
+        columns = (
+            numpy.arange(len(order)) - row_starts[sorted_targets] +
+            self.s_max - row_lengths[sorted_targets])
+        post_to_pre = numpy.full(
+            (vertex_slice.n_atoms, self.s_max), 0xFFFFFFFF, dtype="uint32")
+        post_to_pre[sorted_targets, columns] = conn_data[order]
 
         # Finally make the table and write it out
-        post_to_pre = numpy.core.records.fromarrays(
-            numpy.concatenate(padded_rows).T, formats="u1, u1, u2").view("u4")
+        post_to_pre = post_to_pre.ravel()
         if len(post_to_pre) != vertex_slice.n_atoms * self.s_max:
             raise Exception(
                 "Wrong size of pre-to-pop tables: {} Found, {} Expected"
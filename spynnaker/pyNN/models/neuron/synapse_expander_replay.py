@@ -0,0 +1,480 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" A host replay of the synapse expander
+    (``neural_modelling/src/synapse_expander``), which regenerates the\
+    connections that the expander makes from the same generator data and\
+    seeds, so that they don't have to be read back from the machine.
+
+    Only the generators that need nothing but uniform random numbers and\
+    fixed point arithmetic are replayed; these are the one-to-one, all-to-all,\
+    fixed-probability, fixed-total, fixed-pre and fixed-post connection\
+    generators, the constant and uniform parameter generators and the static\
+    matrix generator.  Anything else can't be replayed, and so must be read\
+    from the machine.
+"""
+
+import numpy
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    AbstractSynapseDynamics)
+
+_UINT32_MASK = 0xFFFFFFFF
+
+#: The number of fractional bits of an ``accum``
+_ACCUM_FRACT_BITS = 15
+
+#: The size of the generator data header in words
+_N_HEADER_WORDS = 16
+
+# The hashes of the generators, as in the synapse expander
+_STATIC_MATRIX = 0
+_ONE_TO_ONE = 0
+_ALL_TO_ALL = 1
+_FIXED_PROBABILITY = 2
+_FIXED_TOTAL = 3
+_FIXED_PRE = 4
+_FIXED_POST = 5
+_PARAM_CONSTANT = 0
+_PARAM_UNIFORM = 1
+
+
+class MarsKiss64(object):
+    """ The mars-kiss 64 random number generator, as used by the synapse\
+        expander
+    """
+
+    __slots__ = ["__seed"]
+
+    def __init__(self, seed):
+        """
+        :param list(int) seed: The 4 words of the seed
+        """
+        self.__seed = [int(s) & _UINT32_MASK for s in seed]
+
+    def next(self):
+        """ Get the next random number
+
+        :rtype: int
+        """
+        seed = self.__seed
+        seed[0] = (314527869 * seed[0] + 1234567) & _UINT32_MASK
+        y = seed[1]
+        y ^= (y << 5) & _UINT32_MASK
+        y ^= y >> 7
+        y ^= (y << 22) & _UINT32_MASK
+        seed[1] = y
+        t = 4294584393 * seed[2] + seed[3]
+        seed[3] = t >> 32
+        seed[2] = t & _UINT32_MASK
+        return (seed[0] + seed[1] + seed[2]) & _UINT32_MASK
+
+    def next_n(self, n):
+        """ Get the next few random numbers
+
+        :param int n: How many numbers to get
+        :rtype: ~numpy.ndarray(uint64)
+        """
+        return numpy.fromiter(
+            (self.next() for _ in range(n)), dtype="uint64", count=n)
+
+    def in_range(self, n):
+        """ Get a random number in [0, n), as the expander does by scaling\
+            the bottom 15 bits
+
+        :param int n: The size of the range
+        :rtype: int
+        """
+        return ((self.next() & 0x7FFF) * n) >> 15
+
+
+def _signed(word):
+    """ Interpret a word as signed
+
+    :param int word:
+    :rtype: int
+    """
+    word = int(word)
+    return word - (1 << 32) if word & 0x80000000 else word
+
+
+class _OneToOne(object):
+    __slots__ = ["_pre_lo", "_pre_hi", "_post_lo", "_post_hi"]
+
+    def __init__(self, params):
+        self._pre_lo, self._pre_hi, self._post_lo, self._post_hi = (
+            int(p) for p in params[:4])
+
+    def _in_pre_view(self, pre):
+        return self._pre_lo <= pre <= self._pre_hi
+
+    def _post_in_view(self, post_slice_start, post_slice_count):
+        """ The post-indices of the slice that are in the post-view
+        """
+        posts = numpy.arange(
+            post_slice_start, post_slice_start + post_slice_count)
+        return posts[(posts >= self._post_lo) & (posts <= self._post_hi)]
+
+    def generate(
+            self, pre, post_slice_start, post_slice_count, max_row_length):
+        if max_row_length < 1 or not self._in_pre_view(pre):
+            return numpy.zeros(0, dtype="uint32")
+        post = pre - self._pre_lo + self._post_lo
+        if (not self._post_lo <= post <= self._post_hi or
+                not post_slice_start <= post <
+                post_slice_start + post_slice_count):
+            return numpy.zeros(0, dtype="uint32")
+        return numpy.array([post - post_slice_start], dtype="uint32")
+
+
+class _AllToAll(_OneToOne):
+    __slots__ = ["_allow_self"]
+
+    def __init__(self, params):
+        super().__init__(params)
+        self._allow_self = bool(params[4])
+
+    def _eligible(self, pre, post_slice_start, post_slice_count):
+        posts = self._post_in_view(post_slice_start, post_slice_count)
+        if not self._allow_self:
+            posts = posts[posts != pre]
+        return posts
+
+    def generate(
+            self, pre, post_slice_start, post_slice_count, max_row_length):
+        if max_row_length < 1 or not self._in_pre_view(pre):
+            return numpy.zeros(0, dtype="uint32")
+        posts = self._eligible(pre, post_slice_start, post_slice_count)
+        return (posts - post_slice_start).astype("uint32")
+
+
+class _FixedProbability(_AllToAll):
+    __slots__ = ["__probability", "__rng"]
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.__probability = int(params[5])
+        self.__rng = MarsKiss64(params[6:10])
+
+    def generate(
+            self, pre, post_slice_start, post_slice_count, max_row_length):
+        if max_row_length < 1 or not self._in_pre_view(pre):
+            return numpy.zeros(0, dtype="uint32")
+        posts = self._eligible(pre, post_slice_start, post_slice_count)
+        # One number is drawn for every candidate, even once the row is full
+        values = self.__rng.next_n(len(posts))
+        posts = posts[values <= self.__probability][:max_row_length]
+        return (posts - post_slice_start).astype("uint32")
+
+
+class _FixedTotal(_OneToOne):
+    __slots__ = [
+        "__allow_self", "__with_replacement", "__n_connections",
+        "__n_potential", "__rng"]
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.__allow_self = bool(params[4])
+        self.__with_replacement = bool(params[5])
+        self.__n_connections = int(params[6])
+        self.__n_potential = int(params[7])
+        self.__rng = MarsKiss64(params[8:12])
+
+    def __pick(self, n_total):
+        # The expander multiplies an unsigned long fract by an integer
+        return (self.__rng.next() * n_total) >> 32
+
+    def __n_row_connections(self, n_values):
+        count = 0
+        k_left = n_values
+        not_k_left = self.__n_potential - n_values
+        for _ in range(self.__n_connections):
+            if self.__with_replacement:
+                if self.__pick(self.__n_potential) < n_values:
+                    count += 1
+            elif self.__pick(k_left + not_k_left) < k_left:
+                count += 1
+                k_left -= 1
+            else:
+                not_k_left -= 1
+        return count
+
+    def generate(
+            self, pre, post_slice_start, post_slice_count, max_row_length):
+        empty = numpy.zeros(0, dtype="uint32")
+        if (max_row_length == 0 or self.__n_connections == 0 or
+                not self._in_pre_view(pre)):
+            return empty
+        slice_hi = post_slice_start + post_slice_count - 1
+        if self._post_hi < post_slice_start or self._post_lo > slice_hi:
+            return empty
+        lo = max(self._post_lo, post_slice_start)
+        hi = min(self._post_hi, slice_hi)
+        n_values = hi - lo + 1
+        if (not self.__allow_self and
+                self._post_lo <= pre <= self._post_hi):
+            n_values -= 1
+
+        if pre == self._pre_hi:
+            n_conns = self.__n_connections
+        else:
+            n_conns = self.__n_row_connections(n_values)
+        n_conns = min(n_conns, max_row_length)
+
+        rng = self.__rng
+        if self.__with_replacement:
+            indices = [rng.in_range(n_values) for _ in range(n_conns)]
+        else:
+            # Reservoir sampling
+            indices = list(range(n_conns))
+            for i in range(n_conns, n_values):
+                j = rng.in_range(i + 1)
+                if j < n_conns:
+                    indices[j] = i
+
+        self.__n_connections -= n_conns
+        self.__n_potential -= n_values
+        return numpy.array(indices, dtype="uint32") + (lo - post_slice_start)
+
+
+def _sample(rng, n_conns, n_values, with_replacement, disallowed):
+    """ Sample as the fixed-pre and fixed-post generators do
+
+    :param MarsKiss64 rng: The generator to draw from
+    :param int n_conns: How many values to pick
+    :param int n_values: How many values to pick from
+    :param bool with_replacement: Whether values can be picked again
+    :param disallowed: The value that can't be picked, if any
+    :type disallowed: int or None
+    :rtype: list(int)
+    """
+    if with_replacement:
+        values = list()
+        for _ in range(n_conns):
+            j = rng.in_range(n_values)
+            while j == disallowed:
+                j = rng.in_range(n_values)
+            values.append(j)
+        return values
+
+    # Reservoir sampling, skipping the disallowed value
+    values = list(range(n_conns))
+    replace_start = n_conns
+    if disallowed is not None and disallowed < n_conns:
+        values[disallowed] = n_conns
+        replace_start = n_conns + 1
+    for i in range(replace_start, n_values):
+        if i != disallowed:
+            j = rng.in_range(i + 1)
+            if j < n_conns:
+                values[j] = i
+    return values
+
+
+class _FixedPre(_OneToOne):
+    __slots__ = ["__n_pre", "__columns"]
+
+    def __init__(self, params):
+        super().__init__(params)
+        allow_self = bool(params[4])
+        with_replacement = bool(params[5])
+        self.__n_pre = int(params[6])
+        n_values = int(params[7])
+        rng = MarsKiss64(params[8:12])
+
+        # All the columns are chosen up front, as on the machine
+        n_columns = self._post_hi - self._post_lo + 1
+        self.__columns = numpy.array([
+            _sample(rng, self.__n_pre, n_values, with_replacement,
+                    None if allow_self else n)
+            for n in range(n_columns)],
+            dtype="int64").reshape(n_columns, self.__n_pre) + self._pre_lo
+
+    def generate(
+            self, pre, post_slice_start, post_slice_count, max_row_length):
+        if (max_row_length == 0 or self.__n_pre == 0 or
+                not self._in_pre_view(pre)):
+            return numpy.zeros(0, dtype="uint32")
+        posts = numpy.arange(len(self.__columns)) + self._post_lo
+        in_slice = (posts >= post_slice_start) & (
+            posts < post_slice_start + post_slice_count)
+        counts = numpy.count_nonzero(self.__columns[in_slice] == pre, axis=1)
+        return (numpy.repeat(posts[in_slice], counts) -
+                post_slice_start).astype("uint32")
+
+
+class _FixedPost(_OneToOne):
+    __slots__ = [
+        "__allow_self", "__with_replacement", "__n_post", "__n_values",
+        "__rng"]
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.__allow_self = bool(params[4])
+        self.__with_replacement = bool(params[5])
+        self.__n_post = int(params[6])
+        self.__n_values = int(params[7])
+        self.__rng = MarsKiss64(params[8:12])
+
+    def generate(
+            self, pre, post_slice_start, post_slice_count, max_row_length):
+        if (max_row_length == 0 or self.__n_post == 0 or
+                not self._in_pre_view(pre)):
+            return numpy.zeros(0, dtype="uint32")
+        posts = numpy.array(_sample(
+            self.__rng, self.__n_post, self.__n_values,
+            self.__with_replacement, None if self.__allow_self else pre),
+            dtype="int64") + self._post_lo
+        posts = posts[(posts >= post_slice_start) &
+                      (posts < post_slice_start + post_slice_count)]
+        return (posts - post_slice_start).astype("uint32")
+
+
+_CONNECTORS = {
+    _ONE_TO_ONE: _OneToOne,
+    _ALL_TO_ALL: _AllToAll,
+    _FIXED_PROBABILITY: _FixedProbability,
+    _FIXED_TOTAL: _FixedTotal,
+    _FIXED_PRE: _FixedPre,
+    _FIXED_POST: _FixedPost
+}
+
+
+class _ParamConstant(object):
+    __slots__ = ["__value"]
+
+    def __init__(self, params):
+        self.__value = _signed(params[0])
+
+    def generate(self, n):
+        return numpy.full(n, self.__value, dtype="int64")
+
+
+class _ParamUniform(object):
+    __slots__ = ["__low", "__range", "__rng"]
+
+    def __init__(self, params):
+        self.__low = _signed(params[0])
+        self.__range = _signed(params[1]) - self.__low
+        self.__rng = MarsKiss64(params[2:6])
+
+    def generate(self, n):
+        # An unsigned long fract times an accum; this can overflow 64 bits
+        values = self.__rng.next_n(n).astype(object)
+        return (self.__low + ((values * self.__range) >> 32)).astype(
+            "int64")
+
+
+_PARAMS = {
+    _PARAM_CONSTANT: _ParamConstant,
+    _PARAM_UNIFORM: _ParamUniform
+}
+
+
+def can_replay(gen_data):
+    """ Determine if the expansion of some generator data can be replayed\
+        on the host
+
+    :param list(~numpy.ndarray) gen_data:
+        The generator data, as given by ``GeneratorData.gen_data``
+    :rtype: bool
+    """
+    header = gen_data[0]
+    matrix_id, connector_id, weight_id, delay_id = (
+        int(h) for h in header[12:_N_HEADER_WORDS])
+    return (matrix_id == _STATIC_MATRIX and connector_id in _CONNECTORS and
+            weight_id in _PARAMS and delay_id in _PARAMS)
+
+
+def replay_expansion(
+        gen_data, post_slice_start, post_slice_count, weight_scale):
+    """ Regenerate the connections that the synapse expander makes from\
+        some generator data
+
+    :param list(~numpy.ndarray) gen_data:
+        The generator data, as given by ``GeneratorData.gen_data``
+    :param int post_slice_start: The first post-neuron of the core
+    :param int post_slice_count: The number of post-neurons of the core
+    :param float weight_scale: The scale of the weights of the synapse type
+    :return: The connections, with weights and delays in machine units (i.e.
+        scaled weights and delays in time steps); the dtype is
+        AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE
+    :rtype: ~numpy.ndarray
+    :raises ValueError: If the data can't be replayed
+    """
+    # pylint: disable=too-many-locals
+    if not can_replay(gen_data):
+        raise ValueError("The expansion of this data can't be replayed")
+    header, _matrix_params, connector_params, weight_params, delay_params = (
+        gen_data)
+    (offset, delayed_offset, max_row_n_words, max_delayed_row_n_words,
+     max_row_n_synapses, max_delayed_row_n_synapses, pre_slice_start,
+     pre_slice_count, max_stage, max_delay_per_stage, timestep_per_delay,
+     _synapse_type, _, connector_id, weight_id, delay_id) = (
+        int(h) for h in header[:_N_HEADER_WORDS])
+    connector = _CONNECTORS[connector_id](connector_params)
+    weights_gen = _PARAMS[weight_id](weight_params)
+    delays_gen = _PARAMS[delay_id](delay_params)
+    weight_scale = int(round(weight_scale * (1 << 32)))
+
+    # The space in the row of each delay stage (in words; for static
+    # synapses that is also in synapses)
+    space = numpy.zeros(max_stage, dtype="int64")
+    if offset != 0xFFFFFFFF:
+        space[0] = max_row_n_words
+    if delayed_offset != 0xFFFFFFFF:
+        space[1:] = max_delayed_row_n_words
+    max_n_synapses = max_row_n_synapses + max_delayed_row_n_synapses
+
+    connections = list()
+    for pre in range(pre_slice_start, pre_slice_start + pre_slice_count):
+        indices = connector.generate(
+            pre, post_slice_start, post_slice_count, max_n_synapses)
+        n = len(indices)
+        if not n:
+            continue
+
+        # Delays are generated before weights, as in the expander
+        delays = delays_gen.generate(n) * timestep_per_delay
+        delays = numpy.where(
+            delays < 0, 1, delays >> (2 * _ACCUM_FRACT_BITS)) & 0xFFFF
+        weights = numpy.abs(weights_gen.generate(n)).astype(object)
+        weights = ((weights * weight_scale) >> (
+            _ACCUM_FRACT_BITS + 32)).astype("int64") & 0xFFFF
+
+        # Work out the stage of each delay, limiting to the last stage
+        delays = numpy.maximum(delays, 1)
+        stages = (delays - 1) // max_delay_per_stage
+        too_big = stages >= max_stage
+        stages[too_big] = max_stage - 1
+        delays[too_big] = max_stage * max_delay_per_stage
+
+        # Drop anything that doesn't fit in its row
+        keep = numpy.ones(n, dtype=bool)
+        for stage in numpy.unique(stages):
+            in_stage = numpy.flatnonzero(stages == stage)
+            keep[in_stage[space[stage]:]] = False
+
+        row = numpy.zeros(
+            numpy.count_nonzero(keep),
+            dtype=AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+        row["source"] = pre
+        row["target"] = indices[keep] + post_slice_start
+        row["weight"] = weights[keep]
+        row["delay"] = delays[keep]
+        connections.append(row)
+
+    if not connections:
+        return numpy.zeros(
+            0, dtype=AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+    return numpy.concatenate(connections)
@@ -14,6 +14,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import numpy
 
+from spinn_utilities.config_holder import get_config_bool
 from pacman.model.graphs.common.slice import Slice
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.helpful_functions import (
@@ -21,6 +22,8 @@ from spinn_front_end_common.utilities.helpful_functions import (
 from .synaptic_matrix import SynapticMatrix
 from .generator_data import GeneratorData, SYN_REGION_UNUSED
 from .synapse_io import read_all_synapses, convert_to_connections
+from .synapse_dynamics import (
+    AbstractSynapseDynamicsStructural, SynapseDynamicsStatic)
 
 # The most pre-atoms that the generator can handle at once
 MAX_GENERATED_ATOMS = 1024
@@ -82,7 +85,9 @@ class SynapticMatrixApp(object):
         # A cache of the received synaptic matrix
         "__received_block",
         # A cache of the received delayed synaptic matrix
-        "__delay_received_block"
+        "__delay_received_block",
+        # The data given to the synapse expander to generate the matrix
+        "__generator_data"
     ]
 
     def __init__(
@@ -150,6 +155,9 @@ class SynapticMatrixApp(object):
         self.__received_block = None
         self.__delay_received_block = None
 
+        # This is stored when the matrix is to be generated on the machine
+        self.__generator_data = None
+
     def __get_matrix(self, machine_edge):
         """ Get or create a matrix object
 
@@ -423,7 +431,21 @@ class SynapticMatrixApp(object):
         :return: The updated block address
         :rtype: int
         """
+        n_generator_data = len(generator_data)
+        block_addr = self.__write_on_chip_matrix_data(
+            generator_data, block_addr)
+        self.__generator_data = generator_data[n_generator_data:]
+        return block_addr
+
+    def __write_on_chip_matrix_data(self, generator_data, block_addr):
+        """ Prepare to write a matrix using an on-chip generator
 
+        :param list(GeneratorData) generator_data: List of data to add to
+        :param int block_addr:
+            The address in the synaptic matrix region to start writing at
+        :return: The updated block address
+        :rtype: int
+        """
         if self.__use_app_keys:
             # Reserve the space in the matrix for an application-level key,
             # and tell the pop table
@@ -720,6 +742,9 @@ class SynapticMatrixApp(object):
         # This might happen if the matrix is never actually generated
         if self.__m_edges is None:
             return []
+        connections = self.__replay_connections()
+        if connections is not None:
+            return connections
         synapses_address = locate_memory_region_for_placement(
             placement, self.__synaptic_matrix_region, transceiver)
         single_address = (locate_memory_region_for_placement(
@@ -736,6 +761,27 @@ class SynapticMatrixApp(object):
                 transceiver, placement, synapses_address, single_address))
         return connections
 
+    def __replay_connections(self):
+        """ Make the connections generated on the machine on the host\
+            instead, if they can be and replaying is enabled
+
+        :return: A list of arrays of connections, each with dtype
+            AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE,
+            or None if they must be read from the machine
+        :rtype: list(~numpy.ndarray) or None
+        """
+        # Only static synapses are unchanged by running
+        dynamics = self.__synapse_info.synapse_dynamics
+        if (not self.__generator_data or
+                not get_config_bool(
+                    "Simulation", "replay_generated_connections") or
+                not isinstance(dynamics, SynapseDynamicsStatic) or
+                isinstance(dynamics, AbstractSynapseDynamicsStructural) or
+                not all(data.can_replay for data in self.__generator_data)):
+            return None
+        return [data.replay_connections(self.__weight_scales)
+                for data in self.__generator_data]
+
     def clear_connection_cache(self):
         """ Clear saved connections
         """
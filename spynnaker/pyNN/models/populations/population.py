@@ -38,6 +38,8 @@ from spynnaker.pyNN.models.abstract_models import (
 from spynnaker.pyNN.models.abstract_pynn_model import AbstractPyNNModel
 from spynnaker.pyNN.models.recorder import Recorder
 from spynnaker.pyNN.utilities.constants import SPIKES
+from spynnaker.pyNN.utilities.state_snapshot import StateSnapshot
+from spynnaker.pyNN.utilities.utility_calls import read_parameters_before_set
 from .idmixin import IDMixin
 from .population_base import PopulationBase
 from .population_view import PopulationView
@@ -931,15 +933,11 @@ class Population(PopulationBase):
         if (sim.has_ran
                 and not self.__has_read_neuron_parameters_this_run
                 and not sim.use_virtual_board):
-            # go through each machine vertex and read the neuron parameters
-            # it contains
-            for vertex in self.__vertex.machine_vertices:
-                if isinstance(vertex, AbstractReadParametersBeforeSet):
-                    # tell the core to rewrite neuron params back to the
-                    # SDRAM space.
-                    placement = sim.placements.get_placement_of_vertex(vertex)
-                    vertex.read_parameters_from_machine(
-                        sim.transceiver, placement, vertex.vertex_slice)
+            # read the neuron parameters of every machine vertex
+            read_parameters_before_set(
+                [vertex for vertex in self.__vertex.machine_vertices
+                 if isinstance(vertex, AbstractReadParametersBeforeSet)],
+                sim.transceiver, sim.placements, sim.machine)
 
             self.__has_read_neuron_parameters_this_run = True
 
@@ -1008,6 +1006,59 @@ class Population(PopulationBase):
         # state that something has changed in the population
         self.__change_requires_mapping = True
 
+    # NON-PYNN API CALL
+    def set_recording_mode(self, variable, mode="sample", population=False):
+        """ Set how the values of a variable seen during each sampling\
+            interval are combined into the recorded value.  This is on top\
+            of the ``sampling_interval`` given to :py:meth:`record`.
+
+        :param str variable: the variable to set the mode of
+        :param str mode:
+            "sample" to record the value at each sampled timestep (the
+            default), or "mean", "min" or "max" to record that of the values
+            over each sampling interval
+        :param bool population:
+            Whether to record a single column combining all the recorded
+            cells, rather than one column per cell
+        """
+        get_simulator().verify_not_running()
+        if not hasattr(self.__vertex, "set_recording_mode"):
+            raise ConfigurationException(
+                "Population does not support recording modes")
+        self.__vertex.set_recording_mode(variable, mode, population)
+        # state that something has changed in the population
+        self.__change_requires_mapping = True
+
+    # NON-PYNN API CALL
+    def save_state(self, filename):
+        """ Save the values of every parameter and state variable of the\
+            population to a file; after a run, these are read from the\
+            machine first.  The state can be restored into a fresh population\
+            of the same model with :py:meth:`load_state`, so that a long run\
+            can be done in chunks.
+
+        :param str filename: The name of the file to save to
+        """
+        get_simulator().verify_not_running()
+        if not hasattr(self.__vertex, "get_state_snapshot"):
+            raise ConfigurationException(
+                "Population does not support saving its state")
+        self._read_parameters_before_set()
+        self.__vertex.get_state_snapshot().save(filename)
+
+    # NON-PYNN API CALL
+    def load_state(self, filename):
+        """ Restore the values of every parameter and state variable saved\
+            by :py:meth:`save_state`; this must be done before the first run.
+
+        :param str filename: The name of the file to load from
+        """
+        get_simulator().verify_not_running()
+        if not hasattr(self.__vertex, "restore_state_snapshot"):
+            raise ConfigurationException(
+                "Population does not support loading its state")
+        self.__vertex.restore_state_snapshot(StateSnapshot.load(filename))
+
     @property
     def size(self):
         """ The number of neurons in the population
@@ -439,9 +439,11 @@ class Projection(object):
         graph_edges = get_simulator().original_application_graph.\
             get_edges_ending_at_vertex(post_synaptic_vertex)
 
-        # Search the edges for any that start at the presynaptic vertex
+        # Search the edges for any that start at the presynaptic vertex,
+        # ignoring those that are not projections (e.g. rate projections)
         for edge in graph_edges:
-            if edge.pre_vertex == pre_synaptic_vertex:
+            if (edge.pre_vertex == pre_synaptic_vertex and
+                    isinstance(edge, ProjectionApplicationEdge)):
                 return edge
         return None
 
@@ -0,0 +1,162 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import numpy
+from pacman.model.graphs.application import ApplicationEdge
+from spinn_front_end_common.utilities.globals_variables import get_simulator
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
+from spynnaker.pyNN.models.populations import Population
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+
+
+class RateProjection(object):
+    """ A projection of the rates of one mean-field population onto another.\
+        Rather than spikes, each unit of the pre-population sends its\
+        excitatory and inhibitory rates every timestep; the selected rate\
+        is weighted and added to the excitatory or inhibitory input rate of\
+        each unit of the post-population in the next timestep.
+
+    .. note::
+        A population that sends rates no longer sends spikes.
+    """
+
+    __slots__ = [
+        "__edge",
+        "__label",
+        "__receptor",
+        "__source_is_vi",
+        "__weights"]
+
+    #: The rates that can be sent
+    SOURCES = ("Ve", "Vi")
+
+    #: The inputs of the post-population that rates can be added to
+    RECEPTOR_TYPES = ("excitatory", "inhibitory")
+
+    def __init__(
+            self, pre_synaptic_population, post_synaptic_population,
+            weights, source="Ve", receptor_type="excitatory", label=None):
+        """
+        :param ~spynnaker.pyNN.models.populations.Population \
+                pre_synaptic_population:
+            The population whose rates are sent
+        :param ~spynnaker.pyNN.models.populations.Population \
+                post_synaptic_population:
+            The population that receives the rates
+        :param weights:
+            The weight from each pre-unit to each post-unit, either as a\
+            single value or as an array of shape (n_pre, n_post)
+        :type weights: float or ~numpy.ndarray
+        :param str source: The rate to send; ``"Ve"`` or ``"Vi"``
+        :param str receptor_type:
+            The input to add to; ``"excitatory"`` or ``"inhibitory"``
+        :param str label: The label of the projection
+        :raises ConfigurationException:
+            If the populations or arguments are not supported
+        """
+        # pylint: disable=too-many-arguments
+        pre_vertex = self.__check_population(pre_synaptic_population)
+        post_vertex = self.__check_population(post_synaptic_population)
+        if source not in self.SOURCES:
+            raise ConfigurationException(
+                "Rate source {} not one of {}".format(source, self.SOURCES))
+        if receptor_type not in self.RECEPTOR_TYPES:
+            raise ConfigurationException(
+                "Rate receptor {} not one of {}".format(
+                    receptor_type, self.RECEPTOR_TYPES))
+        shape = (pre_vertex.n_atoms, post_vertex.n_atoms)
+        try:
+            self.__weights = numpy.array(numpy.broadcast_to(
+                numpy.asarray(weights, dtype="float64"), shape))
+        except ValueError as e:
+            raise ConfigurationException(
+                "Rate weights must be a single value or of shape {}".format(
+                    shape)) from e
+        self.__source_is_vi = source == "Vi"
+        self.__receptor = self.RECEPTOR_TYPES.index(receptor_type)
+
+        sim = get_simulator()
+        if label is None:
+            label = "rate projection edge {}".format(
+                sim.none_labelled_edge_count)
+            sim.increment_none_labelled_edge_count()
+        self.__label = label
+
+        self.__edge = ApplicationEdge(pre_vertex, post_vertex, label=label)
+        sim.add_application_edge(self.__edge, SPIKE_PARTITION_ID)
+        pre_vertex.set_sends_rates()
+        post_vertex.add_incoming_rate_projection(self)
+
+    @staticmethod
+    def __check_population(population):
+        """
+        :param ~spynnaker.pyNN.models.populations.Population population:
+        :return: The vertex of the population
+        :rtype: AbstractPopulationVertex
+        """
+        if not isinstance(population, Population):
+            raise ConfigurationException(
+                "Unexpected parameter type {}. Expected Population".format(
+                    type(population)))
+        vertex = population._vertex
+        if (not isinstance(vertex, AbstractPopulationVertex) or
+                not vertex.neuron_impl.supports_rate_coupling):
+            raise ConfigurationException(
+                "Population {} does not support rate coupling".format(
+                    population.label))
+        return vertex
+
+    @property
+    def edge(self):
+        """ The edge that the rates are sent over
+
+        :rtype: ~pacman.model.graphs.application.ApplicationEdge
+        """
+        return self.__edge
+
+    @property
+    def weights(self):
+        """ The weight from each pre-unit to each post-unit
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__weights
+
+    @property
+    def source_is_vi(self):
+        """ Whether the inhibitory rather than the excitatory rate is sent
+
+        :rtype: bool
+        """
+        return self.__source_is_vi
+
+    @property
+    def receptor(self):
+        """ The index of the input that the rates are added to; 0 for\
+            excitatory and 1 for inhibitory
+
+        :rtype: int
+        """
+        return self.__receptor
+
+    @property
+    def label(self):
+        """
+        :rtype: str
+        """
+        return self.__label
+
+    def __repr__(self):
+        return "RateProjection {}".format(self.__label)
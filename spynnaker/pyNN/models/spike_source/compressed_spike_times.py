@@ -0,0 +1,146 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_utilities.ranged import RangedListOfList
+
+
+class CompressedSpikeTimes(object):
+    """ The spike times of a number of neurons, held as one flat array of\
+        times and the offset into that array of the times of each neuron\
+        (i.e. in compressed sparse row form).
+
+    This can be used where a list of arrays of times is expected; indexing\
+    with an integer gives a view of the times of one neuron, and slicing\
+    gives the times of a range of neurons without copying the times.
+    """
+
+    __slots__ = ["__offsets", "__times"]
+
+    def __init__(self, offsets, times):
+        """
+        :param ~numpy.ndarray offsets:
+            The index in times of the first time of each neuron, followed by
+            the index after the last time of the last neuron
+        :param ~numpy.ndarray times: The times of all the neurons in turn
+        """
+        self.__offsets = offsets
+        self.__times = times
+
+    @staticmethod
+    def from_lists(spike_times):
+        """ Compress the spike times of each neuron
+
+        :param spike_times: The spike times of each neuron
+        :type spike_times: list(list(float)) or ~numpy.ndarray or
+            ~spinn_utilities.ranged.RangedListOfList or CompressedSpikeTimes
+        :rtype: CompressedSpikeTimes
+        """
+        if isinstance(spike_times, CompressedSpikeTimes):
+            return spike_times
+
+        # A rectangular array has the same number of times for each neuron
+        if isinstance(spike_times, numpy.ndarray) and spike_times.ndim == 2:
+            n_neurons, n_times = spike_times.shape
+            return CompressedSpikeTimes(
+                numpy.arange(n_neurons + 1, dtype="int64") * n_times,
+                spike_times.astype("float64").ravel())
+
+        # Neurons in a range of a ranged list share their times
+        if isinstance(spike_times, RangedListOfList):
+            ranges = list(spike_times.iter_ranges())
+            chunks = [
+                numpy.tile(numpy.asarray(value, dtype="float64"), stop - start)
+                for start, stop, value in ranges]
+            counts = numpy.repeat(
+                numpy.array([len(value) for _, _, value in ranges],
+                            dtype="int64"),
+                [stop - start for start, stop, _ in ranges])
+        else:
+            chunks = [numpy.asarray(times, dtype="float64").ravel()
+                      for times in spike_times]
+            counts = numpy.fromiter(
+                (len(chunk) for chunk in chunks), dtype="int64",
+                count=len(chunks))
+
+        offsets = numpy.zeros(len(counts) + 1, dtype="int64")
+        numpy.cumsum(counts, out=offsets[1:])
+        times = (numpy.concatenate(chunks) if chunks
+                 else numpy.zeros(0, dtype="float64"))
+        return CompressedSpikeTimes(offsets, times)
+
+    @property
+    def offsets(self):
+        """ The index in times of the first time of each neuron, followed by\
+            the index after the last time of the last neuron
+
+        :rtype: ~numpy.ndarray(int64)
+        """
+        return self.__offsets
+
+    @property
+    def times(self):
+        """ The times of all the neurons; note that this may include times\
+            of neurons that are not in this object if it is a slice
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__times
+
+    @property
+    def all_times(self):
+        """ The times of all the neurons in this object
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__times[self.__offsets[0]:self.__offsets[-1]]
+
+    def map_times(self, function):
+        """ Apply a function to all the times at once
+
+        :param callable(~numpy.ndarray) function:
+            Converts an array of times into another array of the same length
+        :rtype: CompressedSpikeTimes
+        """
+        return CompressedSpikeTimes(
+            self.__offsets - self.__offsets[0], function(self.all_times))
+
+    def tolist(self):
+        """ Get the times of each neuron as lists
+
+        :rtype: list(list)
+        """
+        return [self.__times[lo:hi].tolist() for lo, hi in zip(
+            self.__offsets[:-1], self.__offsets[1:])]
+
+    def __len__(self):
+        return len(self.__offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise IndexError("Only contiguous slices are supported")
+            return CompressedSpikeTimes(
+                self.__offsets[start:max(start, stop) + 1], self.__times)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Neuron {} is out of range".format(index))
+        return self.__times[self.__offsets[index]:self.__offsets[index + 1]]
+
+    def __iter__(self):
+        for lo, hi in zip(self.__offsets[:-1], self.__offsets[1:]):
+            yield self.__times[lo:hi]
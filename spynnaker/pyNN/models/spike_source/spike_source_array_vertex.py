@@ -27,6 +27,7 @@ from spinn_front_end_common.utilities.globals_variables import (
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, EIEIOSpikeRecorder, SimplePopulationSettable)
 from spynnaker.pyNN.utilities import constants
+from .compressed_spike_times import CompressedSpikeTimes
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -36,15 +37,43 @@ def _as_numpy_ticks(times, time_step):
         numpy.floor(numpy.array(times) * 1000.0) / time_step).astype("int64")
 
 
+def _is_double_list(spike_times):
+    """ Determine if spike times are given for each neuron, rather than\
+        one list of times for all the neurons
+
+    :param spike_times:
+    :rtype: bool
+    """
+    if isinstance(spike_times, CompressedSpikeTimes):
+        return True
+    return bool(len(spike_times)) and hasattr(spike_times[0], "__len__")
+
+
+def _compress(spike_times):
+    """ Convert spike times into the form in which they are held
+
+    :param spike_times:
+    :return: The times of each neuron in compressed form, or the times of\
+        all the neurons in a single array
+    :rtype: CompressedSpikeTimes or ~numpy.ndarray
+    """
+    if _is_double_list(spike_times):
+        return CompressedSpikeTimes.from_lists(spike_times)
+    return numpy.array(spike_times, dtype="float64").ravel()
+
+
 def _send_buffer_times(spike_times, time_step):
-    # Convert to ticks
-    if len(spike_times) and hasattr(spike_times[0], "__len__"):
-        data = []
-        for times in spike_times:
-            data.append(_as_numpy_ticks(times, time_step))
-        return data
-    else:
-        return _as_numpy_ticks(spike_times, time_step)
+    """ Convert held spike times to ticks
+
+    :param spike_times: The times, as given by :py:func:`_compress`
+    :type spike_times: CompressedSpikeTimes or ~numpy.ndarray
+    :param int time_step: The time step in microseconds
+    :rtype: CompressedSpikeTimes or ~numpy.ndarray
+    """
+    if isinstance(spike_times, CompressedSpikeTimes):
+        return spike_times.map_times(
+            lambda times: _as_numpy_ticks(times, time_step))
+    return _as_numpy_ticks(spike_times, time_step)
 
 
 class SpikeSourceArrayVertex(
@@ -64,13 +93,14 @@ class SpikeSourceArrayVertex(
         self.__model = model
         if spike_times is None:
             spike_times = []
-        self._spike_times = spike_times
+        self._spike_times = _compress(spike_times)
         time_step = self.get_spikes_sampling_interval()
 
         super().__init__(
             n_keys=n_neurons, label=label, constraints=constraints,
             max_atoms_per_core=max_atoms_per_core,
-            send_buffer_times=_send_buffer_times(spike_times, time_step),
+            send_buffer_times=_send_buffer_times(
+                self._spike_times, time_step),
             send_buffer_partition_id=constants.SPIKE_PARTITION_ID,
             splitter=splitter)
 
@@ -93,45 +123,26 @@ class SpikeSourceArrayVertex(
     def spike_times(self):
         """ The spike times of the spike source array
         """
-        return list(self._spike_times)
+        return self._spike_times.tolist()
 
-    def _to_early_spikes_single_list(self, spike_times):
-        """
-        Checks if there is one or more spike_times before the current time
+    def _check_spikes(self, spike_times):
+        """ Checks if there is one or more spike_times before the current time
 
-        Logs a warning for the first oen found
+        Logs a warning for the first one found
 
-        :param iterable(int spike_times:
+        :param spike_times: The times, as given by :py:func:`_compress`
+        :type spike_times: CompressedSpikeTimes or ~numpy.ndarray
         """
         current_time = get_simulator().get_current_time()
-        for i in range(len(spike_times)):
-            if spike_times[i] > current_time:
-                logger.warning(
-                    "SpikeSourceArray {} has spike_times that are lower than "
-                    "the current time {} For example {} - "
-                    "these will be ignored.".format(
-                        self, current_time, float(spike_times[i])))
-                return
-
-    def _check_spikes_double_list(self, spike_times):
-        """
-        Checks if there is one or more spike_times before the current time
-
-        Logs a warning for the first oen found
-
-        :param iterable(iterable(int) spike_times:
-        """
-        current_time = get_simulator().get_current_time()
-        for neuron_id in range(0, self.n_atoms):
-            id_times = spike_times[neuron_id]
-            for i in range(len(id_times)):
-                if id_times[i] > current_time:
-                    logger.warning(
-                       "SpikeSourceArray {} has spike_times that are lower "
-                       "than the current time {} For example {} - "
-                       "these will be ignored.".format(
-                            self, current_time, float(id_times[i])))
-                    return
+        if isinstance(spike_times, CompressedSpikeTimes):
+            spike_times = spike_times.all_times
+        early = numpy.flatnonzero(spike_times < current_time)
+        if len(early):
+            logger.warning(
+                "SpikeSourceArray {} has spike_times that are lower than "
+                "the current time {} For example {} - "
+                "these will be ignored.".format(
+                    self, current_time, float(spike_times[early[0]])))
 
     @spike_times.setter
     def spike_times(self, spike_times):
@@ -140,12 +151,9 @@ class SpikeSourceArrayVertex(
 
         """
         time_step = self.get_spikes_sampling_interval()
+        spike_times = _compress(spike_times)
         # warn the user if they are asking for a spike time out of range
-        if spike_times:  # in case of empty list do not check
-            if hasattr(spike_times[0], '__iter__'):
-                self._check_spikes_double_list(spike_times)
-            else:
-                self._to_early_spikes_single_list(spike_times)
+        self._check_spikes(spike_times)
         self.send_buffer_times = _send_buffer_times(spike_times, time_step)
         self._spike_times = spike_times
 
@@ -14,53 +14,57 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy
+from spinn_utilities.overrides import overrides
 from .spike_source_array import SpikeSourceArray
+from .spike_source_array_vertex import SpikeSourceArrayVertex
 from spynnaker.pyNN.utilities import utility_calls
 
 
+def _spike_times_by_neuron(spikes):
+    """ Split spikes into the spike times of each neuron
+
+    :param ~numpy.ndarray spikes:
+        (neuron ID, time) pairs, sorted by neuron ID and then by time
+    :return: the spike times of each neuron, indexed by neuron ID
+    :rtype: list(~numpy.ndarray)
+    """
+    if not len(spikes):
+        return []
+    neuron_ids = spikes[:, 0].astype("int64")
+    bounds = numpy.searchsorted(neuron_ids, numpy.arange(neuron_ids[-1] + 2))
+    return [spikes[lo:hi, 1] for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
 class SpikeSourceFromFile(SpikeSourceArray):
     """ SpikeSourceArray that works from a file
+
+    The file is read by\
+    :py:func:`~spynnaker.pyNN.utilities.utility_calls.read_spikes_from_file`,\
+    so it can be text or numpy data; neuron N of the source spikes at the\
+    times given for neuron ID N in the file.
     """
 
     def __init__(
             self, spike_time_file, min_atom=None, max_atom=None, min_time=None,
             max_time=None, split_value="\t"):
         # pylint: disable=too-many-arguments, too-many-locals
-        spike_times = utility_calls.read_spikes_from_file(
+        spikes = utility_calls.read_spikes_from_file(
             spike_time_file, min_atom, max_atom, min_time, max_time,
             split_value)
-        super().__init__(spike_times)
+        super().__init__(_spike_times_by_neuron(spikes))
 
-    @staticmethod
-    def _subsample_spikes_by_time(spike_array, start, stop, step):
-        sub_sampled_array = {}
-        for neuron in spike_array:
-            times = [t for t in spike_array[neuron] if start <= t < stop]
-            interval = step // 2
-            t_start = times[0]
-            t_last = len(times)
-            t_index = 0
-            spikes_in_interval = 0
-            subsampled_times = []
-            while t_index < t_last:
-                spikes_in_interval = 0
-                while (t_index < t_last and
-                        times[t_index] <= t_start + interval):
-                    spikes_in_interval += 1
-                    if spikes_in_interval >= interval:
-                        t_start = times[t_index] + interval
-                        subsampled_times.append(times[t_index])
-                        try:
-                            t_index = next(i for i in range(t_index, t_last)
-                                           if times[i] >= t_start)
-                        except StopIteration:
-                            t_index = t_last
-                            break
-                        t_index += 1
-                    else:
-                        t_start = t_index
-            sub_sampled_array[neuron] = subsampled_times
-        return sub_sampled_array
+    @overrides(SpikeSourceArray.create_vertex,
+               additional_arguments=(
+                   SpikeSourceArray.default_population_parameters.keys()))
+    def create_vertex(self, n_neurons, label, constraints, splitter):
+        # pylint: disable=arguments-differ
+        # Neurons after the last to spike in the file don't spike at all
+        spike_times = list(self._spike_times)
+        spike_times.extend(
+            numpy.zeros(0) for _ in range(n_neurons - len(spike_times)))
+        return SpikeSourceArrayVertex(
+            n_neurons, spike_times, constraints, label,
+            self.get_max_atoms_per_core(), self, splitter)
 
     @staticmethod
     def _convert_spike_list_to_timed_spikes(
@@ -49,32 +49,48 @@ from spynnaker.pyNN.models.abstract_models import (
 from spynnaker.pyNN.utilities import constants
 from spynnaker.pyNN.utilities.constants import (
     LIVE_POISSON_CONTROL_PARTITION_ID)
-from spynnaker.pyNN.utilities.struct import Struct
 from spynnaker.pyNN.models.abstract_models import (
     SendsSynapticInputsOverSDRAM, ReceivesSynapticInputsOverSDRAM)
 from spynnaker.pyNN.exceptions import SynapticConfigurationException
 
 
-def _flatten(alist):
-    for item in alist:
-        if hasattr(item, "__iter__"):
-            yield from _flatten(item)
-        else:
-            yield item
-
-
-def get_rates_bytes(vertex_slice, rate_data):
+def get_rates_bytes(vertex_slice, rate_offsets):
     """ Gets the size of the Poisson rates in bytes
 
     :param ~pacman.model.graphs.common.Slice vertex_slice:
+    :param ~numpy.ndarray rate_offsets:
+        The offset of the first rate of each neuron, followed by the total
+        number of rates
     :rtype: int
     """
-    n_rates = sum(len(rate_data[i]) for i in range(
-        vertex_slice.lo_atom, vertex_slice.hi_atom + 1))
+    n_rates = int(rate_offsets[vertex_slice.hi_atom + 1] -
+                  rate_offsets[vertex_slice.lo_atom])
     return ((vertex_slice.n_atoms * PARAMS_WORDS_PER_NEURON) +
             (n_rates * PARAMS_WORDS_PER_RATE)) * BYTES_PER_WORD
 
 
+def _get_rate_word_indices(n_rates):
+    """ Get where the data of each neuron and each rate go in the rates\
+        region; each neuron has a header of PARAMS_WORDS_PER_NEURON words\
+        followed by PARAMS_WORDS_PER_RATE words for each of its rates
+
+    :param ~numpy.ndarray n_rates: The number of rates of each neuron
+    :return: The index of the first word of each neuron's header, and the
+        index of the first word of each rate, in neuron order
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+    """
+    n_neurons = len(n_rates)
+    rate_starts = numpy.cumsum(n_rates) - n_rates
+    header_words = (
+        (numpy.arange(n_neurons) * PARAMS_WORDS_PER_NEURON) +
+        (rate_starts * PARAMS_WORDS_PER_RATE))
+    neuron_of_rate = numpy.repeat(numpy.arange(n_neurons), n_rates)
+    rate_words = (
+        ((neuron_of_rate + 1) * PARAMS_WORDS_PER_NEURON) +
+        (numpy.arange(numpy.sum(n_rates)) * PARAMS_WORDS_PER_RATE))
+    return header_words, rate_words
+
+
 def get_sdram_edge_params_bytes(vertex_slice):
     """ Gets the size of the Poisson SDRAM region in bytes
     :param ~pacman.model.graphs.common.Slice vertex_slice:
@@ -99,7 +115,6 @@ SDRAM_EDGE_PARAMS_BYTES_PER_WEIGHT = BYTES_PER_SHORT
 # 3. offset to start writing, 4. VLA of weights (not counted here)
 SDRAM_EDGE_PARAMS_BASE_BYTES = 3 * BYTES_PER_WORD
 
-_ONE_WORD = struct.Struct("<I")
 _FOUR_WORDS = struct.Struct("<4I")
 
 
@@ -133,16 +148,6 @@ class SpikeSourcePoissonMachineVertex(
         0: "TIMER",
         1: "PROB_FUNC"}
 
-    _PoissonStruct = Struct([
-        DataType.UINT32,  # Start Scaled
-        DataType.UINT32,  # End Scaled
-        DataType.UINT32,  # Next Scaled
-        DataType.UINT32,  # is_fast_source
-        DataType.U032,  # exp^(-spikes_per_tick)
-        DataType.S1615,  # sqrt(spikes_per_tick)
-        DataType.UINT32,  # inter-spike-interval
-        DataType.UINT32])  # timesteps to next spike
-
     class EXTRA_PROVENANCE_DATA_ENTRIES(Enum):
         """ Entries for the provenance data generated by standard neuron \
             models.
@@ -423,20 +428,13 @@ class SpikeSourcePoissonMachineVertex(
             self.POISSON_SPIKE_SOURCE_REGIONS.RATES_REGION.value)
 
         # Extract the data on which to work and convert to appropriate form
-        starts = numpy.array(list(_flatten(
-            self._app_vertex.start[self.vertex_slice.as_slice]))).astype(
-                "float")
-        durations = numpy.array(list(_flatten(
-            self._app_vertex.duration[self.vertex_slice.as_slice]))).astype(
-                "float")
-        local_rates = self._app_vertex.rates[self.vertex_slice.as_slice]
-        n_rates = numpy.array([len(r) for r in local_rates])
-        splits = numpy.cumsum(n_rates)
-        rates = numpy.array(list(_flatten(local_rates)))
-        time_to_spike = numpy.array(list(_flatten(
-            self._app_vertex.time_to_spike[
-                self.vertex_slice.as_slice]))).astype("u4")
+        n_rates, starts, durations, rates, time_to_spike = \
+            self._app_vertex.get_rate_data(self.vertex_slice)
         rate_change = self._app_vertex.rate_change[self.vertex_slice.as_slice]
+        n_neurons = self.vertex_slice.n_atoms
+        rate_starts = numpy.cumsum(n_rates) - n_rates
+        has_rates = n_rates > 0
+        last_rates = (rate_starts + n_rates - 1)[has_rates]
 
         # Convert start times to start time steps
         starts_scaled = self._convert_ms_to_n_timesteps(starts)
@@ -452,10 +450,9 @@ class SpikeSourcePoissonMachineVertex(
 
         # Work out the timestep at which the next rate activates, using
         # the maximum value at the end (meaning there is no "next")
-        starts_split = numpy.array_split(starts_scaled, splits)
-        next_scaled = numpy.concatenate(
-            [numpy.append(s[1:], self._MAX_TIMESTEP)
-             for s in starts_split[:-1]])
+        next_scaled = numpy.empty_like(starts_scaled)
+        next_scaled[:-1] = starts_scaled[1:]
+        next_scaled[last_rates] = self._MAX_TIMESTEP
 
         # Compute the spikes per tick for each rate for each atom
         spikes_per_tick = rates * (
@@ -487,32 +484,37 @@ class SpikeSourcePoissonMachineVertex(
 
         # Reuse the time-to-spike read from the machine (if has been run)
         # or don't if the rate has since been changed
-        time_to_spike_split = numpy.array_split(time_to_spike, splits)
-        time_to_spike = numpy.concatenate(
-            [t if rate_change[i] else numpy.repeat(0, len(t))
-             for i, t in enumerate(time_to_spike_split[:-1])])
-
-        # Turn the fast source booleans into uint32
-        is_fast_source = is_fast_source.astype("uint32")
-
-        # Group together the rate data for the core by rate
-        core_data = numpy.dstack((
-            starts_scaled, ends_scaled, next_scaled, is_fast_source,
-            exp_minus_lambda, sqrt_lambda, isi_val, time_to_spike))[0]
-
-        # Group data by neuron id
-        core_data_split = numpy.array_split(core_data, splits)
+        time_to_spike = numpy.where(
+            numpy.repeat(numpy.asarray(rate_change) != 0, n_rates),
+            time_to_spike, 0)
 
         # Work out the index where the core should start based on the given
-        # first timestep
-        ends_scaled_split = numpy.array_split(ends_scaled, splits)
-        indices = [numpy.argmax(e > first_machine_time_step)
-                   for e in ends_scaled_split[:-1]]
-
-        # Build the final data for this core, and write it
-        final_data = numpy.concatenate([
-            numpy.concatenate(([len(d), indices[i]], numpy.concatenate(d)))
-            for i, d in enumerate(core_data_split[:-1])])
+        # first timestep; this is the first rate of each neuron that ends
+        # after that timestep, or the first rate if there is none
+        n_total_rates = len(rates)
+        ends_after = numpy.where(
+            ends_scaled > first_machine_time_step,
+            numpy.arange(n_total_rates), n_total_rates)
+        indices = numpy.zeros(n_neurons, dtype="uint32")
+        if len(last_rates):
+            first_after = numpy.minimum.reduceat(
+                ends_after, rate_starts[has_rates])
+            indices[has_rates] = numpy.where(
+                first_after <= last_rates,
+                first_after - rate_starts[has_rates], 0)
+
+        # Build the final data for this core, with the header of each neuron
+        # followed by the rate data of each of its rates, and write it
+        header_words, rate_words = _get_rate_word_indices(n_rates)
+        final_data = numpy.empty(
+            (n_neurons * PARAMS_WORDS_PER_NEURON) +
+            (n_total_rates * PARAMS_WORDS_PER_RATE), dtype="uint32")
+        final_data[header_words] = n_rates
+        final_data[header_words + 1] = indices
+        for i, values in enumerate((
+                starts_scaled, ends_scaled, next_scaled, is_fast_source,
+                exp_minus_lambda, sqrt_lambda, isi_val, time_to_spike)):
+            final_data[rate_words + i] = values
         spec.write_array(final_data)
 
     def _write_poisson_parameters(self, spec, graph, placement, routing_info):
@@ -644,7 +646,7 @@ class SpikeSourcePoissonMachineVertex(
         spec.reserve_memory_region(
             region=self.POISSON_SPIKE_SOURCE_REGIONS.RATES_REGION.value,
             size=get_rates_bytes(
-                placement.vertex.vertex_slice, self._app_vertex.rates),
+                placement.vertex.vertex_slice, self._app_vertex.rate_offsets),
             label='PoissonRates')
 
     @staticmethod
@@ -665,10 +667,8 @@ class SpikeSourcePoissonMachineVertex(
             self.POISSON_SPIKE_SOURCE_REGIONS.RATES_REGION.value,
             transceiver)
 
-    @overrides(
-        AbstractReadParametersBeforeSet.read_parameters_from_machine)
-    def read_parameters_from_machine(
-            self, transceiver, placement, vertex_slice):
+    @overrides(AbstractReadParametersBeforeSet.read_parameter_data)
+    def read_parameter_data(self, transceiver, placement, vertex_slice):
 
         # locate SDRAM address where parameters are stored
         poisson_params = self.poisson_param_region_address(
@@ -676,60 +676,59 @@ class SpikeSourcePoissonMachineVertex(
         seed_array = _FOUR_WORDS.unpack_from(transceiver.read_memory(
             placement.x, placement.y, poisson_params + self.SEED_OFFSET_BYTES,
             self.SEED_SIZE_BYTES))
-        self._app_vertex.update_kiss_seed(vertex_slice, seed_array)
 
         # locate SDRAM address where the rates are stored
         poisson_rate_region_sdram_address = (
             self.poisson_rate_region_address(placement, transceiver))
 
         # get size of poisson params
-        size_of_region = get_rates_bytes(vertex_slice, self._app_vertex.rates)
+        size_of_region = get_rates_bytes(
+            vertex_slice, self._app_vertex.rate_offsets)
 
         # get data from the machine
         byte_array = transceiver.read_memory(
             placement.x, placement.y,
             poisson_rate_region_sdram_address, size_of_region)
+        return seed_array, byte_array
+
+    @overrides(AbstractReadParametersBeforeSet.update_parameters_from_data)
+    def update_parameters_from_data(self, data, vertex_slice):
+        seed_array, byte_array = data
+        self._app_vertex.update_kiss_seed(vertex_slice, seed_array)
 
-        # For each atom, read the number of rates and the rate parameters
-        offset = 0
-        for i in range(vertex_slice.lo_atom, vertex_slice.hi_atom + 1):
-            n_values, = _ONE_WORD.unpack_from(byte_array, offset)
-            offset += 4
-
-            # Skip reading the index, as it will be recalculated on data write
-            offset += 4
-
-            (_start, _end, _next, is_fast_source, exp_minus_lambda,
-             sqrt_lambda, isi, time_to_next_spike) = (
-                 self._PoissonStruct.read_data(byte_array, offset, n_values))
-            offset += (
-                self._PoissonStruct.get_size_in_whole_words(
-                    n_values) * BYTES_PER_WORD)
-
-            # Work out the spikes per tick depending on if the source is
-            # slow (isi), fast (exp) or faster (sqrt)
-            is_fast_source = is_fast_source == 1.0
-            spikes_per_tick = numpy.zeros(len(is_fast_source), dtype="float")
-            spikes_per_tick[is_fast_source] = numpy.log(
-                exp_minus_lambda[is_fast_source]) * -1.0
-            is_faster_source = sqrt_lambda > 0
-            # pylint: disable=assignment-from-no-return
-            spikes_per_tick[is_faster_source] = numpy.square(
-                sqrt_lambda[is_faster_source])
-            slow_elements = isi > 0
-            spikes_per_tick[slow_elements] = 1.0 / isi[slow_elements]
-
-            # Convert spikes per tick to rates
-            self._app_vertex.rates.set_value_by_id(
-                i,
-                spikes_per_tick *
-                (MICRO_TO_SECOND_CONVERSION /
-                 machine_time_step()))
-
-            # Store the updated time until next spike so that it can be
-            # rewritten when the parameters are loaded
-            self._app_vertex.time_to_spike.set_value_by_id(
-                i, time_to_next_spike)
+        # Get the rate parameters of all rates of all atoms at once, skipping
+        # the headers (the index will be recalculated on data write)
+        n_rates = self._app_vertex.get_rate_data(vertex_slice)[0]
+        _, rate_words = _get_rate_word_indices(n_rates)
+        rate_data = numpy.frombuffer(byte_array, dtype="<u4")[
+            rate_words[:, None] + numpy.arange(PARAMS_WORDS_PER_RATE)]
+        (_start, _end, _next, is_fast_source, exp_minus_lambda,
+         sqrt_lambda, isi, time_to_next_spike) = rate_data.T
+        exp_minus_lambda = exp_minus_lambda / float(DataType.U032.scale)
+        sqrt_lambda = (
+            sqrt_lambda.astype("int32") / float(DataType.S1615.scale))
+
+        # Work out the spikes per tick depending on if the source is
+        # slow (isi), fast (exp) or faster (sqrt)
+        is_fast_source = is_fast_source == 1
+        spikes_per_tick = numpy.zeros(len(is_fast_source), dtype="float")
+        spikes_per_tick[is_fast_source] = numpy.log(
+            exp_minus_lambda[is_fast_source]) * -1.0
+        is_faster_source = sqrt_lambda > 0
+        # pylint: disable=assignment-from-no-return
+        spikes_per_tick[is_faster_source] = numpy.square(
+            sqrt_lambda[is_faster_source])
+        slow_elements = isi > 0
+        spikes_per_tick[slow_elements] = 1.0 / isi[slow_elements]
+
+        # Convert spikes per tick to rates, and store the updated time until
+        # next spike so that it can be rewritten when the parameters are
+        # loaded
+        self._app_vertex.update_rates_from_machine(
+            vertex_slice,
+            spikes_per_tick * (MICRO_TO_SECOND_CONVERSION /
+                               machine_time_step()),
+            time_to_next_spike)
 
     @overrides(SendsSynapticInputsOverSDRAM.sdram_requirement)
     def sdram_requirement(self, sdram_machine_edge):
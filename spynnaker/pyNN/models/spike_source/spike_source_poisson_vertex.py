@@ -40,11 +40,9 @@ from spinn_front_end_common.utilities.globals_variables import (
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, MultiSpikeRecorder, SimplePopulationSettable)
 from .spike_source_poisson_machine_vertex import (
-    SpikeSourcePoissonMachineVertex, _flatten, get_rates_bytes,
+    SpikeSourcePoissonMachineVertex, get_rates_bytes,
     get_sdram_edge_params_bytes)
 from spynnaker.pyNN.utilities.utility_calls import create_mars_kiss_seeds
-from spynnaker.pyNN.utilities.ranged.spynnaker_ranged_dict \
-    import SpynnakerRangeDictionary
 from spynnaker.pyNN.utilities.ranged.spynnaker_ranged_list \
     import SpynnakerRangedList
 
@@ -66,6 +64,26 @@ OVERFLOW_TIMESTEPS_FOR_SDRAM = 5
 _MAX_OFFSET_DENOMINATOR = 10
 
 
+def _flatten_per_neuron(values, n_neurons):
+    """ Flatten a parameter given either as one list for all neurons or as\
+        one list per neuron into the number of values of each neuron and a\
+        single array of all the values in neuron order
+
+    :param values: The normalised parameter values
+    :type values: ~numpy.ndarray or list(~numpy.ndarray)
+    :param int n_neurons: The number of neurons
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+    """
+    if hasattr(values[0], "__len__"):
+        lengths = numpy.array([len(v) for v in values], dtype="int64")
+        flat = numpy.concatenate(values) if len(values) else []
+    else:
+        lengths = numpy.full(n_neurons, len(values), dtype="int64")
+        flat = numpy.tile(values, n_neurons)
+    # Note that a duration of None becomes NaN here
+    return lengths, numpy.asarray(flat, dtype="float64")
+
+
 class SpikeSourcePoissonVertex(
         TDMAAwareApplicationVertex, AbstractSpikeRecordable,
         AbstractProvidesOutgoingPartitionConstraints,
@@ -91,8 +109,8 @@ class SpikeSourcePoissonVertex(
         "__n_data_specs",
         "__max_rate",
         "__rate_change",
+        "__rate_offsets",
         "__n_profile_samples",
-        "__data",
         "__is_variable_rate",
         "__max_spikes",
         "__outgoing_projections"]
@@ -232,26 +250,13 @@ class SpikeSourcePoissonVertex(
                 if len(duration_set) != len(rate_set):
                     raise Exception("Each rate must have its own duration")
 
-        if hasattr(rates[0], "__len__"):
-            time_to_spike = [
-                numpy.array([0 for _ in range(len(rates[i]))])
-                for i in range(len(rates))]
-        else:
-            time_to_spike = numpy.array([0 for _ in range(len(rates))])
-
-        self.__data = SpynnakerRangeDictionary(n_neurons)
-        self.__data["rates"] = SpynnakerRangedList(
-            n_neurons, rates,
-            use_list_as_value=not hasattr(rates[0], "__len__"))
-        self.__data["starts"] = SpynnakerRangedList(
-            n_neurons, starts,
-            use_list_as_value=not hasattr(starts[0], "__len__"))
-        self.__data["durations"] = SpynnakerRangedList(
-            n_neurons, durations,
-            use_list_as_value=not hasattr(durations[0], "__len__"))
-        self.__data["time_to_spike"] = SpynnakerRangedList(
-            n_neurons, time_to_spike,
-            use_list_as_value=not hasattr(time_to_spike[0], "__len__"))
+        # Store the rate data in compressed sparse row form; the values of
+        # neuron i are at [offsets[i]:offsets[i + 1]] of each array
+        n_rates, self.__rate = _flatten_per_neuron(rates, n_neurons)
+        _, self.__start = _flatten_per_neuron(starts, n_neurons)
+        _, self.__duration = _flatten_per_neuron(durations, n_neurons)
+        self.__time_to_spike = numpy.zeros(len(self.__rate), dtype="uint32")
+        self.__rate_offsets = numpy.concatenate(([0], numpy.cumsum(n_rates)))
         self.__rng = numpy.random.RandomState(seed)
         self.__rate_change = numpy.zeros(n_neurons)
 
@@ -261,19 +266,18 @@ class SpikeSourcePoissonVertex(
         # Prepare for recording, and to get spikes
         self.__spike_recorder = MultiSpikeRecorder()
 
-        all_rates = list(_flatten(self.__data["rates"]))
         self.__max_rate = max_rate
-        if max_rate is None and len(all_rates):
-            self.__max_rate = numpy.amax(all_rates)
+        if max_rate is None and len(self.__rate):
+            self.__max_rate = numpy.amax(self.__rate)
         elif max_rate is None:
             self.__max_rate = 0
 
-        total_rate = numpy.sum(all_rates)
+        total_rate = numpy.sum(self.__rate)
         self.__max_spikes = 0
         if total_rate > 0:
-            # Note we have to do this per rate, as the whole array is not numpy
-            max_rates = numpy.array(
-                [numpy.max(r) for r in self.__data["rates"]])
+            # The maximum rate of each neuron that has any rates
+            max_rates = numpy.maximum.reduceat(
+                self.__rate, self.__rate_offsets[:-1][n_rates > 0])
             self.__max_spikes = numpy.sum(scipy.stats.poisson.ppf(
                 1.0 - (1.0 / max_rates), max_rates))
 
@@ -299,30 +303,42 @@ class SpikeSourcePoissonVertex(
     def n_profile_samples(self):
         return self.__n_profile_samples
 
+    def __per_neuron(self, values):
+        """ Get a flat array of values as a list of values per neuron
+
+        :param ~numpy.ndarray values:
+        :rtype: SpynnakerRangedList
+        """
+        return SpynnakerRangedList(
+            self.__n_atoms, numpy.split(values, self.__rate_offsets[1:-1]))
+
+    def __one_per_neuron(self, value):
+        """ Get a value given either for all neurons or per neuron as one\
+            value per neuron
+
+        :param value:
+        :type value: float or list(float) or None
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.array(numpy.broadcast_to(
+            numpy.asarray(value, dtype="float64"), (self.__n_atoms, )))
+
     @property
     def rate(self):
         if self.__is_variable_rate:
             raise Exception("Get variable rate poisson rates with .rates")
-        return list(_flatten(self.__data["rates"]))
+        return list(self.__rate)
 
     @rate.setter
     def rate(self, rate):
         if self.__is_variable_rate:
             raise Exception("Cannot set rate of a variable rate poisson")
-        self.__rate_change = rate - numpy.array(
-            list(_flatten(self.__data["rates"])))
-        # Normalise parameter
-        if hasattr(rate, "__len__"):
-            # Single rate per neuron for whole simulation
-            self.__data["rates"].set_value([numpy.array([r]) for r in rate])
-        else:
-            # Single rate for all neurons for whole simulation
-            self.__data["rates"].set_value(
-                numpy.array([rate]), use_list_as_value=True)
-        all_rates = list(_flatten(self.__data["rates"]))
+        self.__rate_change = rate - self.__rate
+        # A non-variable source has exactly one rate per neuron
+        self.__rate = self.__one_per_neuron(rate)
         new_max = 0
-        if len(all_rates):
-            new_max = numpy.amax(all_rates)
+        if len(self.__rate):
+            new_max = numpy.amax(self.__rate)
         if self.__max_rate is None:
             self.__max_rate = new_max
         # Setting record forces reset so OK to go over if not recording
@@ -335,42 +351,28 @@ class SpikeSourcePoissonVertex(
 
     @property
     def start(self):
-        return self.__data["starts"]
+        return self.starts
 
     @start.setter
     def start(self, start):
         if self.__is_variable_rate:
             raise Exception("Cannot set start of a variable rate poisson")
-        # Normalise parameter
-        if hasattr(start, "__len__"):
-            # Single start per neuron for whole simulation
-            self.__data["starts"].set_value([numpy.array([s]) for s in start])
-        else:
-            # Single start for all neurons for whole simulation
-            self.__data["starts"].set_value(
-                numpy.array([start]), use_list_as_value=True)
+        self.__start = self.__one_per_neuron(start)
 
     @property
     def duration(self):
-        return self.__data["durations"]
+        return self.durations
 
     @duration.setter
     def duration(self, duration):
         if self.__is_variable_rate:
             raise Exception("Cannot set duration of a variable rate poisson")
-        # Normalise parameter
-        if hasattr(duration, "__len__"):
-            # Single duration per neuron for whole simulation
-            self.__data["durations"].set_value(
-                [numpy.array([d]) for d in duration])
-        else:
-            # Single duration for all neurons for whole simulation
-            self.__data["durations"].set_value(
-                numpy.array([duration]), use_list_as_value=True)
+        # Note that a duration of None becomes NaN here
+        self.__duration = self.__one_per_neuron(duration)
 
     @property
     def rates(self):
-        return self.__data["rates"]
+        return self.__per_neuron(self.__rate)
 
     @rates.setter
     def rates(self, _rates):
@@ -380,7 +382,7 @@ class SpikeSourcePoissonVertex(
 
     @property
     def starts(self):
-        return self.__data["starts"]
+        return self.__per_neuron(self.__start)
 
     @starts.setter
     def starts(self, _starts):
@@ -390,7 +392,9 @@ class SpikeSourcePoissonVertex(
 
     @property
     def durations(self):
-        return self.__data["durations"]
+        durations = self.__duration.astype(object)
+        durations[numpy.isnan(self.__duration)] = None
+        return self.__per_neuron(durations)
 
     @durations.setter
     def durations(self, _durations):
@@ -400,12 +404,54 @@ class SpikeSourcePoissonVertex(
 
     @property
     def time_to_spike(self):
-        return self.__data["time_to_spike"]
+        return self.__per_neuron(self.__time_to_spike)
 
     @property
     def rate_change(self):
         return self.__rate_change
 
+    @property
+    def rate_offsets(self):
+        """ The offset of the first rate of each neuron in the rate data,\
+            followed by the total number of rates
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__rate_offsets
+
+    def get_rate_data(self, vertex_slice):
+        """ Get the rate data of the neurons of a slice.  The value arrays\
+            are views of the stored data, not copies.
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+        :return: the number of rates of each neuron, and the start, duration\
+            (NaN meaning "until the end"), rate and time to spike of each\
+            rate, in neuron order
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray, \
+            ~numpy.ndarray, ~numpy.ndarray)
+        """
+        offsets = self.__rate_offsets[
+            vertex_slice.lo_atom:vertex_slice.hi_atom + 2]
+        rates = slice(offsets[0], offsets[-1])
+        return (numpy.diff(offsets), self.__start[rates],
+                self.__duration[rates], self.__rate[rates],
+                self.__time_to_spike[rates])
+
+    def update_rates_from_machine(self, vertex_slice, rates, time_to_spike):
+        """ Update the rates and times to spike of the neurons of a slice\
+            with those read from the machine
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+        :param ~numpy.ndarray rates: The rates in neuron order
+        :param ~numpy.ndarray time_to_spike:
+            The times to the next spike in neuron order
+        """
+        rate_slice = slice(
+            self.__rate_offsets[vertex_slice.lo_atom],
+            self.__rate_offsets[vertex_slice.hi_atom + 1])
+        self.__rate[rate_slice] = rates
+        self.__time_to_spike[rate_slice] = time_to_spike
+
     @property
     @overrides(AbstractChangableAfterRun.requires_mapping)
     def requires_mapping(self):
@@ -452,7 +498,7 @@ class SpikeSourcePoissonVertex(
         :param ~pacman.model.graphs.common.Slice vertex_slice:
         """
         # pylint: disable=arguments-differ
-        poisson_params_sz = get_rates_bytes(vertex_slice, self.__data["rates"])
+        poisson_params_sz = get_rates_bytes(vertex_slice, self.__rate_offsets)
         sdram_sz = get_sdram_edge_params_bytes(vertex_slice)
         other = ConstantSDRAM(
             SYSTEM_BYTES_REQUIREMENT +
@@ -45,6 +45,22 @@ class DelayBlock(object):
         word_id, bit_id = divmod(source_id, 32)
         self.__delay_block[int(stage - 1)][word_id] |= (1 << bit_id)
 
+    def add_delays(self, source_ids, stages):
+        """ Add many delays at once
+
+        :param ~numpy.ndarray source_ids:
+        :param ~numpy.ndarray stages:
+        """
+        source_ids = numpy.asarray(source_ids, dtype="uint32")
+        if not source_ids.size:
+            return
+        stages = numpy.asarray(stages, dtype="uint32")
+        # Several connections may set bits in the same word, so the OR must
+        # be unbuffered
+        numpy.bitwise_or.at(
+            self.__delay_block, (stages - 1, source_ids >> 5),
+            numpy.left_shift(1, source_ids & 31, dtype="uint32"))
+
     @property
     def delay_block(self):
         """
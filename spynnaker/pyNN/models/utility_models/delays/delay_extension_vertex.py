@@ -139,14 +139,13 @@ class DelayExtensionVertex(
         """ Add delayed connections for a given vertex slice
 
         :param ~pacman.model.graphs.common.Slice vertex_slice:
-        :param list(int) source_ids:
-        :param list(int) stages:
+        :param ~numpy.ndarray source_ids:
+        :param ~numpy.ndarray stages:
         """
         if vertex_slice not in self.__delay_blocks:
             self.__delay_blocks[vertex_slice] = DelayBlock(
                 self.__n_delay_stages, self.__delay_per_stage, vertex_slice)
-        for (source_id, stage) in zip(source_ids, stages):
-            self.__delay_blocks[vertex_slice].add_delay(source_id, stage)
+        self.__delay_blocks[vertex_slice].add_delays(source_ids, stages)
 
     def delay_blocks_for(self, vertex_slice):
         if vertex_slice in self.__delay_blocks:
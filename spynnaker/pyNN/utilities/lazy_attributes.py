@@ -0,0 +1,62 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import importlib
+import sys
+
+
+def lazy_attributes(module_globals, attributes):
+    """ Make attributes of a module that are only imported the first time\
+        that they are used.  This is done with a module level\
+        ``__getattr__``, so on Python 3.6 (which doesn't support these) the\
+        attributes are imported straight away instead.
+
+    Usage, at the end of a module::
+
+        __getattr__, __dir__ = lazy_attributes(globals(), {
+            "IF_curr_exp": (".if_curr_exp_base", "IFCurrExpBase")})
+
+    :param dict(str,object) module_globals: The globals of the module
+    :param attributes:
+        The name of each attribute, mapped to the module to import it from
+        (which can be relative to the package of the module) and the name
+        of the attribute in that module, or None for the module itself
+    :type attributes: dict(str, tuple(str, str or None))
+    :return: The ``__getattr__`` and ``__dir__`` functions of the module
+    :rtype: tuple(callable, callable)
+    """
+    module_name = module_globals["__name__"]
+    package = module_globals["__package__"]
+
+    def __getattr__(name):
+        if name not in attributes:
+            raise AttributeError("module {!r} has no attribute {!r}".format(
+                module_name, name))
+        source, attribute = attributes[name]
+        value = importlib.import_module(source, package)
+        if attribute is not None:
+            value = getattr(value, attribute)
+        # Remember it so that this is not called again for the same name
+        module_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(module_globals) | set(attributes))
+
+    if sys.version_info < (3, 7):
+        for name in attributes:
+            __getattr__(name)
+
+    return __getattr__, __dir__
@@ -0,0 +1,335 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+""" Benchmarks of the host side hot paths of the meanfield model.
+
+Each benchmark times a path for a growing number of meanfield units (or
+error function samples, or substeps) and fits a straight line to the
+times, giving a fixed cost and a cost per unit.  The results are
+machine-readable so that runs can be compared to spot regressions::
+
+    python -m spynnaker.pyNN.utilities.meanfield_benchmark -o results.json
+
+The virtual board benchmarks need a ``spynnaker.cfg`` in the working
+directory with ``virtual_board = True`` in the ``[Machine]`` section.
+"""
+import argparse
+import json
+import sys
+import time
+import numpy
+from data_specification.enums import DataType
+from pacman.model.graphs.common import Slice
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import ResourceContainer
+from spinn_utilities.config_holder import set_config
+from spinn_front_end_common.utilities.globals_variables import get_simulator
+from spynnaker.pyNN.models.common import NeuronRecorder
+from spynnaker.pyNN.models.neuron.builds import MeanfieldBase
+from spynnaker.pyNN.models.neuron.neuron_models import MeanfieldReference
+
+#: The version of the results format
+VERSION = 1
+
+#: The default numbers of units to benchmark
+DEFAULT_N_UNITS = (16, 64, 256, 1024)
+
+#: The default numbers of error function samples to benchmark
+DEFAULT_SAMPLES = (250, 500, 1000, 2000)
+
+#: The default numbers of substeps per timestep to benchmark
+DEFAULT_SUBSTEPS = (1, 2, 4, 8)
+
+# The bytes of timestamp at the start of each recorded row
+_N_BYTES_FOR_TIMESTAMP = 4
+
+
+def time_call(function, repeats=3):
+    """ Time a call, keeping the best of several repeats to reduce the noise\
+        from whatever else the host is doing.
+
+    :param callable function: The function to call, with no arguments
+    :param int repeats: The number of times to call it
+    :return: The shortest time taken, in seconds
+    :rtype: float
+    """
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        taken = time.perf_counter() - start
+        if best is None or taken < best:
+            best = taken
+    return best
+
+
+def fit_cost_curve(sizes, seconds):
+    """ Fit a straight line to times measured at several sizes.
+
+    :param list(int) sizes: The sizes measured
+    :param list(float) seconds: The time taken at each size
+    :return: The sizes and times, and the fitted fixed cost and cost per\
+        unit of size, in seconds
+    :rtype: dict
+    """
+    sizes = [int(size) for size in sizes]
+    seconds = [float(taken) for taken in seconds]
+    if len(sizes) > 1:
+        per_unit, fixed = numpy.polyfit(sizes, seconds, 1)
+    else:
+        per_unit, fixed = seconds[0] / max(sizes[0], 1), 0.0
+    return {"sizes": sizes, "seconds": seconds,
+            "fixed": float(fixed), "per_unit": float(per_unit)}
+
+
+def _parameters(**overrides):
+    """ The default parameters and initial values of a meanfield
+
+    :rtype: dict(str,float)
+    """
+    parameters = dict(MeanfieldBase.default_parameters,
+                      **MeanfieldBase.default_initial_values)
+    parameters.update(overrides)
+    return parameters
+
+
+def _run_units(n_units, n_timesteps, n_steps_per_timestep=1, **overrides):
+    units = [MeanfieldReference(_parameters(**overrides))
+             for _ in range(n_units)]
+    for _ in range(n_timesteps):
+        for unit in units:
+            unit.step(n_steps_per_timestep=n_steps_per_timestep)
+
+
+def benchmark_host_model(
+        n_units=DEFAULT_N_UNITS, samples=DEFAULT_SAMPLES,
+        substeps=DEFAULT_SUBSTEPS, n_timesteps=10, repeats=3):
+    """ Time the host model of the meanfield update, giving the cost per\
+        unit, per error function sample and per substep.
+
+    :param list(int) n_units: The numbers of units to time
+    :param list(int) samples: The numbers of error function samples to time
+    :param list(int) substeps: The numbers of substeps per timestep to time
+    :param int n_timesteps: The number of timesteps to run each time
+    :param int repeats: The number of times to repeat each timing
+    :rtype: dict(str,dict)
+    """
+    # pylint: disable=too-many-arguments
+    return {
+        "units": fit_cost_curve(n_units, [
+            time_call(lambda n=n: _run_units(n, n_timesteps), repeats)
+            for n in n_units]),
+        "samples": fit_cost_curve(samples, [
+            time_call(lambda s=s: _run_units(1, n_timesteps, sample=s),
+                      repeats)
+            for s in samples]),
+        "substeps": fit_cost_curve(substeps, [
+            time_call(lambda s=s: _run_units(1, n_timesteps, s), repeats)
+            for s in substeps])}
+
+
+def benchmark_parameter_encoding(vertex, repeats=3):
+    """ Time the encoding of the parameters of a meanfield population into\
+        the data written to the machine, and the decoding of that data back.
+
+    :param AbstractPopulationVertex vertex:
+        The vertex of the population, which must be in a simulation that has
+        been set up
+    :param int repeats: The number of times to repeat each timing
+    :return: The time to encode and to decode, in seconds
+    :rtype: tuple(float, float)
+    """
+    impl = vertex.neuron_impl
+    vertex_slice = Slice(0, vertex.n_atoms - 1)
+    data = impl.get_data(
+        vertex.parameters, vertex.state_variables, vertex_slice)
+    raw = data.tobytes()
+    encode = time_call(lambda: impl.get_data(
+        vertex.parameters, vertex.state_variables, vertex_slice), repeats)
+    decode = time_call(lambda: impl.read_data(
+        raw, 0, vertex_slice, vertex.parameters, vertex.state_variables),
+        repeats)
+    return encode, decode
+
+
+class _RecordedData(object):
+    """ Stands in for the buffer manager, handing out recorded data
+    """
+
+    __slots__ = ["__data"]
+
+    def __init__(self, data):
+        self.__data = data
+
+    def get_data_by_placement(self, placement, region):
+        # pylint: disable=unused-argument
+        return self.__data, False
+
+
+def benchmark_recording_decode(
+        n_units=DEFAULT_N_UNITS, n_timesteps=1000, repeats=3):
+    """ Time the decoding of recorded meanfield data as read from the\
+        machine, giving the cost per unit.
+
+    :param list(int) n_units: The numbers of units to time
+    :param int n_timesteps: The number of timesteps recorded
+    :param int repeats: The number of times to repeat each timing
+    :rtype: dict
+    """
+    data_type = DataType.S1615
+    times = []
+    for n in n_units:
+        recorder = NeuronRecorder(
+            ["Ve"], {"Ve": data_type}, [], n, [], {}, [], {})
+        vertex = SimpleMachineVertex(ResourceContainer())
+        placements = Placements([Placement(vertex, 0, 0, 1)])
+        rows = numpy.zeros(
+            (n_timesteps, _N_BYTES_FOR_TIMESTAMP + n * data_type.size),
+            dtype="uint8")
+        rows[:, :_N_BYTES_FOR_TIMESTAMP] = numpy.arange(
+            n_timesteps, dtype="<i4").view("uint8").reshape(n_timesteps, -1)
+        buffers = _RecordedData(bytearray(rows.tobytes()))
+        # pylint: disable=protected-access
+        times.append(time_call(
+            lambda r=recorder, p=placements, v=vertex, b=buffers, n=n:
+            r._get_placement_matrix_data(
+                p, v, 0, b, n_timesteps, "", 1, "benchmark", data_type, n),
+            repeats))
+    return fit_cost_curve(n_units, times)
+
+
+def benchmark_virtual_board(
+        n_units=DEFAULT_N_UNITS, n_timesteps=10, repeats=3, n_dsg_threads=1):
+    """ Run meanfield populations on a virtual board, timing the mapping,\
+        the data specification generation and the parameter encoding.
+
+    :param list(int) n_units: The numbers of units to time
+    :param int n_timesteps: The number of timesteps to run for
+    :param int repeats:
+        The number of times to repeat the parameter encoding timings
+    :param int n_dsg_threads:
+        The number of threads to generate data specifications with
+    :rtype: dict(str,dict)
+    """
+    # pylint: disable=import-outside-toplevel
+    import spynnaker8 as sim
+    mapping, dsg, encode, decode = [], [], [], []
+    for n in n_units:
+        sim.setup(timestep=1.0)
+        set_config("Mapping", "n_dsg_threads", n_dsg_threads)
+        population = sim.Population(
+            n, sim.extra_models.Meanfield(), label="meanfield")
+        population.record("Ve")
+        # pylint: disable=protected-access
+        encode_time, decode_time = benchmark_parameter_encoding(
+            population._vertex, repeats)
+        encode.append(encode_time)
+        decode.append(decode_time)
+        sim.run(n_timesteps)
+        simulator = get_simulator()
+        mapping.append(simulator._mapping_time / 1000.0)
+        dsg.append(simulator._dsg_time / 1000.0)
+        sim.end()
+    return {
+        "mapping": fit_cost_curve(n_units, mapping),
+        "data_generation": fit_cost_curve(n_units, dsg),
+        "parameter_encoding": fit_cost_curve(n_units, encode),
+        "parameter_decoding": fit_cost_curve(n_units, decode)}
+
+
+def run_benchmarks(
+        n_units=DEFAULT_N_UNITS, samples=DEFAULT_SAMPLES,
+        substeps=DEFAULT_SUBSTEPS, virtual_board=True, repeats=3,
+        dsg_threads=(1,)):
+    """ Run all the meanfield benchmarks.
+
+    :param list(int) n_units: The numbers of units to time
+    :param list(int) samples: The numbers of error function samples to time
+    :param list(int) substeps: The numbers of substeps per timestep to time
+    :param bool virtual_board: Whether to run the virtual board benchmarks
+    :param int repeats: The number of times to repeat each timing
+    :param list(int) dsg_threads:
+        The numbers of threads to generate data specifications with on the
+        virtual board; the first is used for the main results, and each is
+        timed separately to show the speed-up
+    :return: The results, which can be written as JSON
+    :rtype: dict
+    """
+    # pylint: disable=too-many-arguments
+    results = {
+        "version": VERSION,
+        "host_model": benchmark_host_model(
+            n_units, samples, substeps, repeats=repeats),
+        "recording_decode": benchmark_recording_decode(
+            n_units, repeats=repeats)}
+    if virtual_board:
+        results["virtual_board"] = benchmark_virtual_board(
+            n_units, repeats=repeats, n_dsg_threads=dsg_threads[0])
+        results["data_generation_by_threads"] = {
+            str(n_threads): benchmark_virtual_board(
+                n_units, repeats=1, n_dsg_threads=n_threads)[
+                    "data_generation"]
+            for n_threads in dsg_threads[1:]}
+    return results
+
+
+def _int_list(text):
+    return [int(item) for item in text.split(",")]
+
+
+def main(args=None):
+    """ Run the benchmarks from the command line and write the results as\
+        JSON.
+
+    :param list(str) args: The command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the host side of the meanfield model")
+    parser.add_argument(
+        "-o", "--output", help="The file to write the results to; the "
+        "results are printed if not given")
+    parser.add_argument(
+        "--units", type=_int_list, default=list(DEFAULT_N_UNITS),
+        help="Comma separated numbers of units")
+    parser.add_argument(
+        "--samples", type=_int_list, default=list(DEFAULT_SAMPLES),
+        help="Comma separated numbers of error function samples")
+    parser.add_argument(
+        "--substeps", type=_int_list, default=list(DEFAULT_SUBSTEPS),
+        help="Comma separated numbers of substeps per timestep")
+    parser.add_argument(
+        "--repeats", type=int, default=3,
+        help="The number of times to repeat each timing")
+    parser.add_argument(
+        "--dsg-threads", type=_int_list, default=[1],
+        help="Comma separated numbers of threads to generate data "
+        "specifications with on the virtual board")
+    parser.add_argument(
+        "--no-virtual-board", action="store_true",
+        help="Only run the benchmarks that do not need a simulation")
+    options = parser.parse_args(args)
+    results = run_benchmarks(
+        options.units, options.samples, options.substeps,
+        not options.no_virtual_board, options.repeats, options.dsg_threads)
+    if options.output is None:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(options.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,127 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+_PARAMETER_PREFIX = "parameters."
+_STATE_VARIABLE_PREFIX = "state_variables."
+
+
+class StateSnapshot(object):
+    """ The values of every parameter and state variable of a population at\
+        some point in a simulation, which can be saved to a file and restored\
+        into a fresh population of the same model to carry on from there.
+    """
+
+    __slots__ = [
+        "__model_name",
+        "__n_neurons",
+        "__parameters",
+        "__state_variables"]
+
+    #: The version of the snapshot format; a snapshot of another version
+    #: cannot be loaded
+    VERSION = 1
+
+    def __init__(self, model_name, n_neurons, parameters, state_variables):
+        """
+        :param str model_name: The name of the model of the population
+        :param int n_neurons: The number of neurons in the population
+        :param dict(str,~numpy.ndarray) parameters:
+            The value of each parameter for each neuron
+        :param dict(str,~numpy.ndarray) state_variables:
+            The value of each state variable for each neuron
+        """
+        self.__model_name = model_name
+        self.__n_neurons = n_neurons
+        self.__parameters = parameters
+        self.__state_variables = state_variables
+
+    @property
+    def model_name(self):
+        """ The name of the model of the population
+
+        :rtype: str
+        """
+        return self.__model_name
+
+    @property
+    def n_neurons(self):
+        """ The number of neurons in the population
+
+        :rtype: int
+        """
+        return self.__n_neurons
+
+    @property
+    def parameters(self):
+        """ The value of each parameter for each neuron
+
+        :rtype: dict(str,~numpy.ndarray)
+        """
+        return self.__parameters
+
+    @property
+    def state_variables(self):
+        """ The value of each state variable for each neuron
+
+        :rtype: dict(str,~numpy.ndarray)
+        """
+        return self.__state_variables
+
+    def save(self, filename):
+        """ Save the snapshot to a file
+
+        :param str filename: The name of the file to save to
+        """
+        arrays = {
+            "version": numpy.array(self.VERSION),
+            "model_name": numpy.array(self.__model_name),
+            "n_neurons": numpy.array(self.__n_neurons)}
+        for name, values in self.__parameters.items():
+            arrays[_PARAMETER_PREFIX + name] = numpy.asarray(values)
+        for name, values in self.__state_variables.items():
+            arrays[_STATE_VARIABLE_PREFIX + name] = numpy.asarray(values)
+        # Write to an open file so that numpy doesn't add an extension
+        with open(filename, "wb") as f:
+            numpy.savez_compressed(f, **arrays)
+
+    @classmethod
+    def load(cls, filename):
+        """ Load a snapshot from a file
+
+        :param str filename: The name of the file to load from
+        :rtype: StateSnapshot
+        :raises ConfigurationException:
+            If the file holds a snapshot of a different version
+        """
+        with numpy.load(filename, allow_pickle=False) as arrays:
+            version = int(arrays["version"])
+            if version != cls.VERSION:
+                raise ConfigurationException(
+                    "State snapshot {} is version {}; only version {} can "
+                    "be loaded".format(filename, version, cls.VERSION))
+            parameters = dict()
+            state_variables = dict()
+            for name in arrays.files:
+                if name.startswith(_PARAMETER_PREFIX):
+                    parameters[name[len(_PARAMETER_PREFIX):]] = arrays[name]
+                elif name.startswith(_STATE_VARIABLE_PREFIX):
+                    state_variables[name[len(_STATE_VARIABLE_PREFIX):]] = \
+                        arrays[name]
+            return cls(
+                str(arrays["model_name"]), int(arrays["n_neurons"]),
+                parameters, state_variables)
@@ -18,7 +18,8 @@ from pyNN.random import RandomDistribution
 from spinn_utilities.helpful_functions import is_singleton
 from spinn_utilities.ranged.ranged_list import RangedList
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
-from spynnaker.pyNN.utilities.utility_calls import convert_to
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_array_to, convert_to)
 
 
 class Struct(object):
@@ -80,27 +81,20 @@ class Struct(object):
         # Create an array to store values in
         data = numpy.zeros(array_size, dtype=self.numpy_dtype)
 
-        # Go through and get the values and put them in the array
+        # Go through and get the values and put them in the array; constant
+        # ranges are converted once and broadcast into the field
+        end_offset = offset + array_size
         for i, (values, data_type) in enumerate(zip(values, self.field_types)):
-
+            field = data["f" + str(i)]
             if is_singleton(values):
-                data_value = convert_to(values, data_type)
-                data["f" + str(i)] = data_value
+                field[:] = convert_to(values, data_type)
             elif not isinstance(values, RangedList):
-                data_value = [convert_to(v, data_type)
-                              for v in values[offset:(offset + array_size)]]
-                data["f" + str(i)] = data_value
+                field[:] = convert_array_to(
+                    values[offset:end_offset], data_type)
             else:
-                for start, end, value in values.iter_ranges_by_slice(
-                        offset, offset + array_size):
-                    # Get the values and get them into the correct data type
-                    if isinstance(value, RandomDistribution):
-                        values = value.next(end - start)
-                        data_value = [convert_to(v, data_type) for v in values]
-                    else:
-                        data_value = convert_to(value, data_type)
-                    data["f" + str(i)][
-                        start - offset:end - offset] = data_value
+                self.__convert_ranges(
+                    values.iter_ranges_by_slice(offset, end_offset),
+                    data_type, field, offset)
 
         # Pad to whole number of uint32s
         overflow = (array_size * self.numpy_dtype.itemsize) % BYTES_PER_WORD
@@ -110,6 +104,37 @@ class Struct(object):
 
         return data.view("uint32")
 
+    @staticmethod
+    def __convert_ranges(ranges, data_type, field, offset):
+        """ Convert ranges of values from a ranged list into a field
+
+        :param iterable(tuple(int,int,object)) ranges:
+            The start, end and value of each range
+        :param ~data_specification.enums.DataType data_type:
+            The type of the field
+        :param ~numpy.ndarray field: Where to put the converted values
+        :param int offset: The index of the first item of the field
+        """
+        ranges = list(ranges)
+        if not ranges:
+            return
+        if any(isinstance(value, RandomDistribution)
+               for _, _, value in ranges):
+            for start, end, value in ranges:
+                if isinstance(value, RandomDistribution):
+                    field[start - offset:end - offset] = convert_array_to(
+                        value.next(end - start), data_type)
+                else:
+                    field[start - offset:end - offset] = convert_to(
+                        value, data_type)
+            return
+
+        # Convert each distinct range once and repeat it over its length
+        starts, ends, range_values = zip(*ranges)
+        field[starts[0] - offset:ends[-1] - offset] = numpy.repeat(
+            convert_array_to(range_values, data_type),
+            numpy.subtract(ends, starts))
+
     def read_data(self, data, offset=0, array_size=1):
         """ Read a bytearray of data and convert to struct values
 
@@ -19,6 +19,8 @@ utility class containing simple helper methods
 import logging
 import os
 import math
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import numpy
 from pyNN.random import RandomDistribution
 from scipy.stats import binom
@@ -31,7 +33,7 @@ from spynnaker.pyNN.utilities.random_stats import (
     RandomStatsPoissonImpl, RandomStatsRandIntImpl, RandomStatsUniformImpl,
     RandomStatsVonmisesImpl, RandomStatsBinomialImpl)
 from spinn_front_end_common.utilities.constants import (
-    MICRO_TO_SECOND_CONVERSION)
+    BYTES_PER_WORD, MICRO_TO_SECOND_CONVERSION)
 from spynnaker.pyNN.utilities.constants import WRITE_BANDWIDTH_BYTES_PER_SECOND
 
 logger = FormatAdapter(logging.getLogger(__name__))
@@ -45,6 +47,9 @@ N_RANDOM_NUMBERS = 4
 ARBITRARY_Y = 13031301
 MARS_C_MAX = 698769068
 
+#: The most threads to use to read data from the machine at the same time
+MAX_READ_THREADS = 16
+
 STATS_BY_NAME = {
     'binomial': RandomStatsBinomialImpl(),
     'gamma': RandomStatsGammaImpl(),
@@ -117,6 +122,124 @@ def convert_to(value, data_type):
         data_type.struct_encoding)
 
 
+def convert_array_to(values, data_type):
+    """ Convert an array of values to a given data type all at once,\
+        in the same way as :py:func:`convert_to` does for each value
+
+    :param values: The values to convert
+    :type values: list(float) or ~numpy.ndarray
+    :param ~data_specification.enums.DataType data_type:
+        The data type to convert to
+    :return: The converted data
+    :rtype: ~numpy.ndarray
+    :raises ValueError: If a fixed point value is out of range
+    """
+    if data_type.size > BYTES_PER_WORD:
+        # 64-bit values need more precision than a float can hold
+        return numpy.array([convert_to(v, data_type) for v in values],
+                           dtype=data_type.struct_encoding)
+    values = numpy.asarray(values, dtype="float64")
+    if data_type.scale == 1:
+        # Integer types truncate and float types pass straight through
+        if data_type.struct_encoding in "fd":
+            return numpy.round(values).astype(data_type.struct_encoding)
+        return numpy.trunc(values).astype("int64").astype(
+            data_type.struct_encoding)
+    # Fixed point types; note that written this way round, NaN is out of range
+    out_of_range = ~((float(data_type.min) <= values) &
+                     (values <= float(data_type.max)))
+    if out_of_range.any():
+        raise ValueError(
+            "value {:f} cannot be converted to {:s}: out of range".format(
+                values[out_of_range][0], data_type.__doc__))
+    # All fixed point scales are powers of 2, so the multiply is exact;
+    # saturate anything that the float range check let round just over
+    limits = numpy.iinfo(data_type.struct_encoding)
+    return numpy.clip(
+        numpy.round(values * float(data_type.scale)),
+        limits.min, limits.max).astype(data_type.struct_encoding)
+
+
+def _eval_columns(file_path, n_columns, split_value):
+    """ Read the first few columns of a text file line by line, evaluating\
+        each value as an expression
+
+    :param str file_path: absolute path to the file
+    :param int n_columns: the number of columns to read
+    :param str split_value: the pattern to split by
+    :rtype: ~numpy.ndarray(float)
+    :raises ConfigurationException:
+        if a line doesn't have enough columns or a value can't be evaluated
+    """
+    evaluator = SafeEval()
+    rows = list()
+    with open(file_path, 'r') as f:
+        for line_number, line in enumerate(f, start=1):
+            if line.startswith('#') or not line.strip():
+                continue
+            values = line.split(split_value)[:n_columns]
+            if len(values) < n_columns:
+                raise ConfigurationException(
+                    "Line {} of {} does not have {} columns of data".format(
+                        line_number, file_path, n_columns))
+            try:
+                rows.append([float(evaluator.eval(value)) for value in values])
+            except (ArithmeticError, NameError, SyntaxError, TypeError,
+                    ValueError) as e:
+                raise ConfigurationException(
+                    "Line {} of {} has a value that is not a number".format(
+                        line_number, file_path)) from e
+    return numpy.array(rows, dtype="float64").reshape(-1, n_columns)
+
+
+def read_columns_from_file(file_path, n_columns, split_value="\t"):
+    """ Read the first few columns of numbers from a file of data.
+
+    Files ending in ``.npy`` or ``.npz`` are loaded with numpy (the first\
+    array in an ``.npz`` file is used), files ending in ``.bin`` are read as\
+    rows of native-endian 64-bit floats, and anything else is read as text\
+    with one row per line.  Text is parsed in bulk; only if that fails (for\
+    example, if a value is an expression) is each value evaluated in turn.
+
+    :param str file_path: absolute path to the file
+    :param int n_columns: the number of columns to read
+    :param str split_value: the pattern to split text by
+    :return: the values, with a row for each line of the file
+    :rtype: ~numpy.ndarray(float)
+    :raises ConfigurationException:
+        if the file doesn't have enough columns or a value isn't a number
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".npy":
+        data = numpy.load(file_path)
+    elif extension == ".npz":
+        with numpy.load(file_path) as archive:
+            data = archive[archive.files[0]]
+    elif extension == ".bin":
+        data = numpy.fromfile(file_path, dtype="float64")
+        if data.size % n_columns:
+            raise ConfigurationException(
+                "{} does not hold rows of {} values".format(
+                    file_path, n_columns))
+        data = data.reshape(-1, n_columns)
+    else:
+        try:
+            data = numpy.loadtxt(
+                file_path, dtype="float64", comments="#",
+                delimiter=split_value, usecols=range(n_columns), ndmin=2)
+        except ValueError:
+            data = _eval_columns(file_path, n_columns, split_value)
+
+    data = numpy.asarray(data, dtype="float64")
+    if data.size == 0:
+        return numpy.zeros((0, n_columns))
+    if data.ndim != 2 or data.shape[1] < n_columns:
+        raise ConfigurationException(
+            "{} does not have {} columns of data".format(
+                file_path, n_columns))
+    return data[:, :n_columns]
+
+
 def read_in_data_from_file(
         file_path, min_atom, max_atom, min_time, max_time, extra=False):
     """ Read in a file of data values where the values are in a format of:
@@ -125,7 +248,7 @@ def read_in_data_from_file(
     :param str file_path: absolute path to a file containing the data
     :param int min_atom: min neuron ID to which neurons to read in
     :param int max_atom: max neuron ID to which neurons to read in
-    :param extra:
+    :param extra: Ignored; any further columns are always ignored
     :param min_time: min time slot to read neurons values of.
     :type min_time: float or int
     :param max_time: max time slot to read neurons values of.
@@ -133,31 +256,19 @@ def read_in_data_from_file(
     :return: a numpy array of (time stamp, atom ID, data value)
     :rtype: ~numpy.ndarray(tuple(float, int, float))
     """
-    times = list()
-    atom_ids = list()
-    data_items = list()
-    evaluator = SafeEval()
-    with open(file_path, 'r') as f:
-        for line in f.readlines():
-            if line.startswith('#'):
-                continue
-            if extra:
-                time, neuron_id, data_value, extra = line.split("\t")
-            else:
-                time, neuron_id, data_value = line.split("\t")
-            time = float(evaluator.eval(time))
-            neuron_id = int(evaluator.eval(neuron_id))
-            data_value = float(evaluator.eval(data_value))
-            if (min_atom <= neuron_id < max_atom and
-                    min_time <= time < max_time):
-                times.append(time)
-                atom_ids.append(neuron_id)
-                data_items.append(data_value)
-            else:
-                print("failed to enter {}:{}".format(neuron_id, time))
-
-    result = numpy.dstack((atom_ids, times, data_items))[0]
-    return result[numpy.lexsort((times, atom_ids))]
+    # pylint: disable=unused-argument
+    # Note the file has time first, but the result has the atom first
+    data = read_columns_from_file(file_path, 3)[:, [1, 0, 2]]
+    atom_ids, times = data[:, 0], data[:, 1]
+    in_range = ((min_atom <= atom_ids) & (atom_ids < max_atom) &
+                (min_time <= times) & (times < max_time))
+    n_ignored = len(data) - numpy.count_nonzero(in_range)
+    if n_ignored:
+        logger.info(
+            "Ignored {} values in {} that are outside of the atoms and times "
+            "requested", n_ignored, file_path)
+    data = data[in_range]
+    return data[numpy.lexsort((data[:, 1], data[:, 0]))]
 
 
 def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
@@ -165,6 +276,9 @@ def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
     """ Read spikes from a file formatted as:
         <time>\t<neuron ID>
 
+    The file can also be a ``.npy``, ``.npz`` or ``.bin`` file of rows of\
+    (time, neuron ID); see :py:func:`read_columns_from_file`.
+
     :param str file_path: absolute path to a file containing spike values
     :param min_atom: min neuron ID to which neurons to read in
     :type min_atom: int or float
@@ -176,9 +290,9 @@ def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
     :type max_time: float or int
     :param str split_value: the pattern to split by
     :return:
-        a numpy array with max_atom elements each of which is a list of\
-        spike times.
-    :rtype: numpy.ndarray(int, int)
+        a numpy array of (neuron ID, spike time), sorted by neuron ID and\
+        then by time
+    :rtype: numpy.ndarray(float, float)
     """
     # pylint: disable=too-many-arguments
 
@@ -193,22 +307,12 @@ def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
     if max_time is None:
         max_time = float('inf')
 
-    data = []
-    with open(file_path, 'r') as f_source:
-        read_data = f_source.readlines()
-
-    evaluator = SafeEval()
-    for line in read_data:
-        if line.startswith('#'):
-            continue
-        values = line.split(split_value)
-        time = float(evaluator.eval(values[0]))
-        neuron_id = float(evaluator.eval(values[1]))
-        if (min_atom <= neuron_id < max_atom and
-                min_time <= time < max_time):
-            data.append([neuron_id, time])
-    data.sort()
-    return numpy.array(data)
+    # Note the file has time first, but the result has the neuron first
+    data = read_columns_from_file(file_path, 2, split_value)[:, ::-1]
+    neuron_ids, times = data[:, 0], data[:, 1]
+    data = data[(min_atom <= neuron_ids) & (neuron_ids < max_atom) &
+                (min_time <= times) & (times < max_time)]
+    return data[numpy.lexsort((data[:, 1], data[:, 0]))]
 
 
 def get_probable_maximum_selected(
@@ -370,3 +474,44 @@ def get_time_to_write_us(n_bytes, n_cores):
     bandwidth_per_core = WRITE_BANDWIDTH_BYTES_PER_SECOND / n_cores
     seconds = n_bytes / bandwidth_per_core
     return int(math.ceil(seconds * MICRO_TO_SECOND_CONVERSION))
+
+
+def read_parameters_before_set(vertices, transceiver, placements, machine):
+    """ Read the parameters of several machine vertices from the machine.\
+        The vertices on each board are read in turn, but different boards\
+        (which are reached through different connections) are read at the\
+        same time.  The data is then decoded once all the reads are done.
+
+    :param iterable(AbstractReadParametersBeforeSet) vertices:
+        The vertices to read the parameters of
+    :param ~spinnman.transceiver.Transceiver transceiver:
+        How to read the data
+    :param ~pacman.model.placements.Placements placements:
+        Where the vertices are
+    :param ~spinn_machine.Machine machine:
+        The machine, used to find the board of each chip
+    """
+    by_board = defaultdict(list)
+    for vertex in vertices:
+        placement = placements.get_placement_of_vertex(vertex)
+        chip = machine.get_chip_at(placement.x, placement.y)
+        by_board[chip.nearest_ethernet_x, chip.nearest_ethernet_y].append(
+            (vertex, placement))
+
+    def read_board(vertices_and_placements):
+        return [
+            (vertex, vertex.read_parameter_data(
+                transceiver, placement, vertex.vertex_slice))
+            for vertex, placement in vertices_and_placements]
+
+    boards = list(by_board.values())
+    if len(boards) <= 1:
+        results = [read_board(board) for board in boards]
+    else:
+        with ThreadPoolExecutor(min(len(boards), MAX_READ_THREADS)) as pool:
+            results = list(pool.map(read_board, boards))
+
+    # Decode in this thread, as the host-side parameters are shared
+    for board_results in results:
+        for vertex, data in board_results:
+            vertex.update_parameters_from_data(data, vertex.vertex_slice)
@@ -36,66 +36,7 @@ from spinn_front_end_common.utilities.exceptions import (
     SimulatorShutdownException)
 from spinn_front_end_common.utilities import globals_variables
 from spynnaker.pyNN.models.abstract_pynn_model import AbstractPyNNModel
-
-# connections
-# noinspection PyUnresolvedReferences
-from spynnaker.pyNN.models.neural_projections.connectors import (
-    AllToAllConnector, ArrayConnector, CSAConnector,
-    DistanceDependentProbabilityConnector, FixedNumberPostConnector,
-    FixedNumberPreConnector, FixedProbabilityConnector,
-    FromFileConnector, FromListConnector, IndexBasedProbabilityConnector,
-    KernelConnector, MultapseConnector as FixedTotalNumberConnector,
-    OneToOneConnector, SmallWorldConnector)
-
-# synapse structures
-from spynnaker.pyNN.models.neuron.synapse_dynamics import (
-    SynapseDynamicsStatic as StaticSynapse)
-
-# plastic stuff
-from spynnaker.pyNN.models.neuron.synapse_dynamics import (
-    SynapseDynamicsSTDP as
-    STDPMechanism, SynapseDynamicsStructuralStatic as
-    StructuralMechanismStatic, SynapseDynamicsStructuralSTDP as
-    StructuralMechanismSTDP)
-from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
-    WeightDependenceAdditive as
-    AdditiveWeightDependence, WeightDependenceMultiplicative as
-    MultiplicativeWeightDependence)
-from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
-    TimingDependenceSpikePair as
-    SpikePairRule)
-from spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis\
-    .partner_selection import (
-        LastNeuronSelection, RandomSelection)
-from spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis\
-    .formation import (
-        DistanceDependentFormation)
-from spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis\
-    .elimination import (
-        RandomByWeightElimination)
-
-# neuron stuff
-# noinspection PyUnresolvedReferences
-from spynnaker.pyNN.models.neuron.builds.if_cond_exp_base import (
-    IFCondExpBase as IF_cond_exp)
-# noinspection PyUnresolvedReferences
-from spynnaker.pyNN.models.neuron.builds.if_curr_exp_base import (
-    IFCurrExpBase as IF_curr_exp)
-# noinspection PyUnresolvedReferences
-from spynnaker.pyNN.models.neuron.builds.if_curr_alpha import (
-    IFCurrAlpha as IF_curr_alpha)
-# noinspection PyUnresolvedReferences
-from spynnaker.pyNN.models.neuron.builds.if_curr_delta import (
-    IFCurrDelta as IF_curr_delta)
-# noinspection PyUnresolvedReferences
-from spynnaker.pyNN.models.neuron.builds.izk_curr_exp_base import (
-    IzkCurrExpBase as Izhikevich)
-# noinspection PyUnresolvedReferences
-from spynnaker.pyNN.models.spike_source.spike_source_array import (
-    SpikeSourceArray)
-# noinspection PyUnresolvedReferences
-from spynnaker.pyNN.models.spike_source.spike_source_poisson import (
-    SpikeSourcePoisson)
+from spynnaker.pyNN.utilities.lazy_attributes import lazy_attributes
 
 # pops
 # noinspection PyUnresolvedReferences
@@ -106,9 +47,6 @@ from spynnaker.pyNN.models.populations import (
 # noinspection PyUnresolvedReferences
 from spynnaker.pyNN.models.projection import Projection as SpiNNakerProjection
 
-from spynnaker8 import external_devices
-from spynnaker8 import extra_models
-
 # big stuff
 from spynnaker8.spinnaker import SpiNNaker
 
@@ -155,6 +93,71 @@ __all__ = [
     'get_max_delay', 'initialize', 'list_standard_models', 'name',
     'record', 'record_v', 'record_gsyn']
 
+_CONNECTORS = "spynnaker.pyNN.models.neural_projections.connectors"
+_SYNAPSE_DYNAMICS = "spynnaker.pyNN.models.neuron.synapse_dynamics"
+_STDP = "spynnaker.pyNN.models.neuron.plasticity.stdp"
+_SYNAPTOGENESIS = \
+    "spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis"
+_BUILDS = "spynnaker.pyNN.models.neuron.builds"
+
+# The models, connectors and devices are only imported when first used, as
+# most scripts only use a few of them
+__getattr__, __dir__ = lazy_attributes(globals(), {
+    # connections
+    "AllToAllConnector": (_CONNECTORS, "AllToAllConnector"),
+    "ArrayConnector": (_CONNECTORS, "ArrayConnector"),
+    "CSAConnector": (_CONNECTORS, "CSAConnector"),
+    "DistanceDependentProbabilityConnector": (
+        _CONNECTORS, "DistanceDependentProbabilityConnector"),
+    "FixedNumberPostConnector": (_CONNECTORS, "FixedNumberPostConnector"),
+    "FixedNumberPreConnector": (_CONNECTORS, "FixedNumberPreConnector"),
+    "FixedProbabilityConnector": (_CONNECTORS, "FixedProbabilityConnector"),
+    "FromFileConnector": (_CONNECTORS, "FromFileConnector"),
+    "FromListConnector": (_CONNECTORS, "FromListConnector"),
+    "IndexBasedProbabilityConnector": (
+        _CONNECTORS, "IndexBasedProbabilityConnector"),
+    "KernelConnector": (_CONNECTORS, "KernelConnector"),
+    "FixedTotalNumberConnector": (_CONNECTORS, "MultapseConnector"),
+    "OneToOneConnector": (_CONNECTORS, "OneToOneConnector"),
+    "SmallWorldConnector": (_CONNECTORS, "SmallWorldConnector"),
+    # synapse structures
+    "StaticSynapse": (_SYNAPSE_DYNAMICS, "SynapseDynamicsStatic"),
+    # plastic stuff
+    "STDPMechanism": (_SYNAPSE_DYNAMICS, "SynapseDynamicsSTDP"),
+    "StructuralMechanismStatic": (
+        _SYNAPSE_DYNAMICS, "SynapseDynamicsStructuralStatic"),
+    "StructuralMechanismSTDP": (
+        _SYNAPSE_DYNAMICS, "SynapseDynamicsStructuralSTDP"),
+    "AdditiveWeightDependence": (
+        _STDP + ".weight_dependence", "WeightDependenceAdditive"),
+    "MultiplicativeWeightDependence": (
+        _STDP + ".weight_dependence", "WeightDependenceMultiplicative"),
+    "SpikePairRule": (
+        _STDP + ".timing_dependence", "TimingDependenceSpikePair"),
+    "LastNeuronSelection": (
+        _SYNAPTOGENESIS + ".partner_selection", "LastNeuronSelection"),
+    "RandomSelection": (
+        _SYNAPTOGENESIS + ".partner_selection", "RandomSelection"),
+    "DistanceDependentFormation": (
+        _SYNAPTOGENESIS + ".formation", "DistanceDependentFormation"),
+    "RandomByWeightElimination": (
+        _SYNAPTOGENESIS + ".elimination", "RandomByWeightElimination"),
+    # neuron stuff
+    "IF_cond_exp": (_BUILDS + ".if_cond_exp_base", "IFCondExpBase"),
+    "IF_curr_exp": (_BUILDS + ".if_curr_exp_base", "IFCurrExpBase"),
+    "IF_curr_alpha": (_BUILDS + ".if_curr_alpha", "IFCurrAlpha"),
+    "IF_curr_delta": (_BUILDS + ".if_curr_delta", "IFCurrDelta"),
+    "Izhikevich": (_BUILDS + ".izk_curr_exp_base", "IzkCurrExpBase"),
+    "SpikeSourceArray": (
+        "spynnaker.pyNN.models.spike_source.spike_source_array",
+        "SpikeSourceArray"),
+    "SpikeSourcePoisson": (
+        "spynnaker.pyNN.models.spike_source.spike_source_poisson",
+        "SpikeSourcePoisson"),
+    # External devices and extra models
+    "external_devices": ("spynnaker8.external_devices", None),
+    "extra_models": ("spynnaker8.extra_models", None)})
+
 # Dynamically-extracted operations from PyNN
 __pynn = {}
 
@@ -440,7 +443,8 @@ def _create_overloaded_functions(spinnaker_simulator):
     __pynn["create"] = pynn_common.build_create(Population)
 
     __pynn["connect"] = pynn_common.build_connect(
-        Projection, FixedProbabilityConnector, StaticSynapse)
+        Projection, __getattr__("FixedProbabilityConnector"),
+        __getattr__("StaticSynapse"))
 
     __pynn["record"] = pynn_common.build_record(spinnaker_simulator)
 
@@ -508,7 +512,8 @@ def list_standard_models():
     :rtype: list(str)
     """
     results = list()
-    for (key, obj) in globals().items():
+    for key in __dir__():
+        obj = globals()[key] if key in globals() else __getattr__(key)
         if isinstance(obj, type) and issubclass(obj, AbstractPyNNModel):
             results.append(key)
     return results
@@ -13,30 +13,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
-    TimingDependenceRecurrent as
-    RecurrentRule,
-    TimingDependenceSpikeNearestPair as
-    SpikeNearestPairRule,
-    TimingDependenceVogels2011 as
-    Vogels2011Rule,
-    TimingDependencePfisterSpikeTriplet as
-    PfisterSpikeTriplet)
-from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
-    WeightDependenceAdditiveTriplet)
-from spynnaker.pyNN.models.neuron.builds import (
-    IFCondExpStoc, IFCurrDelta as
-    IFCurDelta, IFCurrExpCa2Adaptive, IFCurrDualExpBase as
-    IF_curr_dual_exp, IzkCondExpBase as
-    Izhikevich_cond, IFCurrExpSEMDBase as
-    IF_curr_exp_sEMD, MeanfieldBase as Meanfield)
-from spynnaker.pyNN.models.spike_source import SpikeSourcePoissonVariable
+from spynnaker.pyNN.utilities.lazy_attributes import lazy_attributes
 
 __all__ = [
     # sPyNNaker 8 models
     'IFCurDelta', 'IFCurrExpCa2Adaptive', 'IFCondExpStoc',
     'Izhikevich_cond', 'IF_curr_dual_exp', 'IF_curr_exp_sEMD',
-    'Meanfield',
+    'Meanfield', 'RateProjection',
 
     # sPyNNaker 8 plastic stuff
     'WeightDependenceAdditiveTriplet',
@@ -46,3 +29,27 @@ __all__ = [
 
     # Variable rate Poisson
     'SpikeSourcePoissonVariable']
+
+_BUILDS = "spynnaker.pyNN.models.neuron.builds"
+_TIMING = "spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence"
+
+# The models are only imported when first used
+__getattr__, __dir__ = lazy_attributes(globals(), {
+    "IFCurDelta": (_BUILDS, "IFCurrDelta"),
+    "IFCurrExpCa2Adaptive": (_BUILDS, "IFCurrExpCa2Adaptive"),
+    "IFCondExpStoc": (_BUILDS, "IFCondExpStoc"),
+    "Izhikevich_cond": (_BUILDS, "IzkCondExpBase"),
+    "IF_curr_dual_exp": (_BUILDS, "IFCurrDualExpBase"),
+    "IF_curr_exp_sEMD": (_BUILDS, "IFCurrExpSEMDBase"),
+    "Meanfield": (_BUILDS, "MeanfieldBase"),
+    "RateProjection": (
+        "spynnaker.pyNN.models.rate_projection", "RateProjection"),
+    "WeightDependenceAdditiveTriplet": (
+        "spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence",
+        "WeightDependenceAdditiveTriplet"),
+    "PfisterSpikeTriplet": (_TIMING, "TimingDependencePfisterSpikeTriplet"),
+    "SpikeNearestPairRule": (_TIMING, "TimingDependenceSpikeNearestPair"),
+    "RecurrentRule": (_TIMING, "TimingDependenceRecurrent"),
+    "Vogels2011Rule": (_TIMING, "TimingDependenceVogels2011"),
+    "SpikeSourcePoissonVariable": (
+        "spynnaker.pyNN.models.spike_source", "SpikeSourcePoissonVariable")})
@@ -0,0 +1,100 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from spinnman.constants import SCP_SCAMP_PORT
+from spinnman.connections.udp_packet_connections import UDPConnection
+from spinnman.exceptions import SpinnmanIOException, SpinnmanTimeoutException
+from spinnman.messages.eieio import read_eieio_data_message
+from spinnman.messages.sdp import SDPHeader
+
+# Two bytes of padding come before the SDP header
+_SDP_OFFSET = 2
+# The SDP header comes before the EIEIO message
+_EIEIO_OFFSET = 10
+
+
+class MockDatabaseReader(object):
+    """ Just enough of a database reader to set up a live event connection\
+        to send to cores on the local host
+    """
+
+    def __init__(self, atom_id_to_key_mappings):
+        self._mappings = atom_id_to_key_mappings
+        self._placements = {
+            label: (0, 0, i + 1)
+            for i, label in enumerate(atom_id_to_key_mappings)}
+
+    def get_configuration_parameter_value(self, name):
+        return 1000.0
+
+    def get_placements(self, label):
+        return [self._placements[label]]
+
+    def get_ip_address(self, x, y):
+        return "127.0.0.1"
+
+    def get_atom_id_to_key_mapping(self, label):
+        return dict(self._mappings[label])
+
+
+def read_database(connection, reader):
+    """ Set up a connection as if the database had been written
+    """
+    # pylint: disable=protected-access
+    connection._LiveEventConnection__read_database_callback(reader)
+
+
+class LoopbackReceiver(object):
+    """ Receives what a live event connection sends to SpiNNaker, in place\
+        of the machine
+    """
+
+    def __init__(self):
+        try:
+            self._connection = UDPConnection(
+                local_host="127.0.0.1", local_port=SCP_SCAMP_PORT)
+        except SpinnmanIOException:
+            pytest.skip("Port {} is in use".format(SCP_SCAMP_PORT))
+
+    def receive_messages(self):
+        """ Get the messages sent so far
+
+        :return: the destination core and EIEIO message of each
+        :rtype: list(tuple(int, EIEIODataMessage))
+        """
+        messages = list()
+        while True:
+            try:
+                data = self._connection.receive(0.1)
+            except SpinnmanTimeoutException:
+                return messages
+            header = SDPHeader.from_bytestring(data, _SDP_OFFSET)
+            messages.append((header.destination_cpu, read_eieio_data_message(
+                data, _EIEIO_OFFSET)))
+
+    def close(self):
+        self._connection.close()
+
+
+def elements(message):
+    """ Get the elements of an EIEIO data message
+
+    :rtype: list(AbstractDataElement)
+    """
+    result = list()
+    while message.is_next_element:
+        result.append(message.next_element)
+    return result
@@ -0,0 +1,104 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" How fast events can be sent to the local host, compared with the\
+    sending of the base live event connection.  Run by hand with
+    ``python -m unittests.connection_tests.test_loopback_benchmark``
+"""
+
+import time
+import numpy
+import pytest
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities.connections import LiveEventConnection
+from spynnaker.pyNN.connections import (
+    SpynnakerLiveSpikesConnection, SpynnakerPoissonControlConnection)
+from unittests.connection_tests.loopback import (
+    LoopbackReceiver, MockDatabaseReader, read_database)
+
+_N_NEURONS = 1000
+_N_EVENTS = 200000
+_BASE_KEY = 0x10000
+
+
+def _rate(send, n_events):
+    """ The number of events per second sent by a function, best of three
+    """
+    best = None
+    for _ in range(3):
+        start_time = time.perf_counter()
+        send()
+        taken = time.perf_counter() - start_time
+        best = taken if best is None else min(best, taken)
+    return n_events / best
+
+
+def _setup(connection, label):
+    read_database(connection, MockDatabaseReader({
+        label: {i: _BASE_KEY + i for i in range(_N_NEURONS)}}))
+
+
+@pytest.mark.skip(reason="A benchmark to run by hand")
+def test_spikes_per_second():
+    receiver = LoopbackReceiver()
+    connection = SpynnakerLiveSpikesConnection(
+        send_labels=["pop"], local_host="127.0.0.1", local_port=None)
+    _setup(connection, "pop")
+    try:
+        neuron_ids = numpy.random.default_rng(1).integers(
+            0, _N_NEURONS, _N_EVENTS)
+        id_list = neuron_ids.tolist()
+        batch = _rate(lambda: connection.send_spike_batch(
+            "pop", neuron_ids, send_full_keys=True), _N_EVENTS)
+        events = _rate(lambda: LiveEventConnection.send_events(
+            connection, "pop", id_list, send_full_keys=True), _N_EVENTS)
+        print("send_spike_batch: {:.0f} spikes/s, send_events: {:.0f} "
+              "spikes/s".format(batch, events))
+    finally:
+        connection.close()
+        receiver.close()
+
+
+@pytest.mark.skip(reason="A benchmark to run by hand")
+def test_rate_updates_per_second():
+    receiver = LoopbackReceiver()
+    connection = SpynnakerPoissonControlConnection(
+        poisson_labels=["poisson"], local_host="127.0.0.1", local_port=None)
+    _setup(connection, "poisson_control")
+    try:
+        rng = numpy.random.default_rng(1)
+        neuron_ids = rng.integers(0, _N_NEURONS, _N_EVENTS)
+        rates = rng.uniform(0, 100, _N_EVENTS)
+        id_rates = list(zip(neuron_ids.tolist(), rates.tolist()))
+
+        def send_events():
+            # What set_rates did before it packed the messages itself
+            connection.send_events_with_payloads("poisson_control", [
+                (nid, DataType.S1615.encode_as_int(rate))
+                for nid, rate in id_rates])
+
+        batch = _rate(lambda: connection.set_rates(
+            "poisson", neuron_ids, rates), _N_EVENTS)
+        events = _rate(send_events, _N_EVENTS)
+        print("set_rates: {:.0f} updates/s, send_events_with_payloads: "
+              "{:.0f} updates/s".format(batch, events))
+    finally:
+        connection.close()
+        receiver.close()
+
+
+if __name__ == "__main__":
+    test_spikes_per_second()
+    test_rate_updates_per_second()
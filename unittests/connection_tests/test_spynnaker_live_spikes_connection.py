@@ -0,0 +1,89 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spynnaker.pyNN.connections import SpynnakerLiveSpikesConnection
+from unittests.connection_tests.loopback import (
+    LoopbackReceiver, MockDatabaseReader, elements, read_database)
+
+_BASE_KEYS = {"pop_a": 0x10000, "pop_b": 0x20000}
+_N_NEURONS = 1000
+
+
+def _connection():
+    connection = SpynnakerLiveSpikesConnection(
+        send_labels=list(_BASE_KEYS), local_host="127.0.0.1",
+        local_port=None)
+    read_database(connection, MockDatabaseReader({
+        label: {i: base + i for i in range(_N_NEURONS)}
+        for label, base in _BASE_KEYS.items()}))
+    return connection
+
+
+def test_send_spike_batch():
+    receiver = LoopbackReceiver()
+    connection = _connection()
+    try:
+        rng = numpy.random.default_rng(1)
+        labels = rng.choice(list(_BASE_KEYS), 500)
+        neuron_ids = rng.integers(0, _N_NEURONS, 500)
+        n_messages = connection.send_spike_batch(
+            labels, neuron_ids, send_full_keys=True)
+        messages = receiver.receive_messages()
+        assert len(messages) == n_messages
+
+        # Each population gets its spikes as full keys in order, in as few
+        # messages as possible
+        for core, label in enumerate(_BASE_KEYS, start=1):
+            is_label = labels == label
+            keys = [element.key for dest, message in messages
+                    if dest == core for element in elements(message)]
+            assert keys == list(_BASE_KEYS[label] + neuron_ids[is_label])
+            assert (sum(dest == core for dest, _ in messages) ==
+                    -(-numpy.count_nonzero(is_label) // 63))
+
+        # Neuron IDs are sent directly when full keys aren't used
+        connection.send_spikes("pop_b", range(200))
+        messages = receiver.receive_messages()
+        assert [message.eieio_header.count for _, message in messages] == [
+            127, 73]
+        assert [element.key for _, message in messages
+                for element in elements(message)] == list(range(200))
+
+        # Only spikes that have somewhere to go are sent and counted
+        # pylint: disable=protected-access
+        connection._LiveEventConnection__send_address_details["pop_b"] = None
+        n_messages = connection.send_spike_batch(
+            labels, neuron_ids, send_full_keys=True)
+        messages = receiver.receive_messages()
+        assert len(messages) == n_messages
+        assert {dest for dest, _ in messages} == {1}
+
+        with pytest.raises(SpinnmanInvalidParameterException):
+            connection.send_spike("pop_a", 0x10000)
+        with pytest.raises(SpinnmanInvalidParameterException):
+            connection.send_spike_batch(
+                ["pop_a", "pop_b"], [1, -1], send_full_keys=True)
+        with pytest.raises(SpinnmanInvalidParameterException):
+            connection.send_spike_batch(
+                ["pop_a"], [_N_NEURONS], send_full_keys=True)
+        assert receiver.receive_messages() == []
+        with pytest.raises(ValueError):
+            connection.send_spike_batch(["pop_a"], [1, 2])
+    finally:
+        connection.close()
+        receiver.close()
@@ -0,0 +1,80 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from data_specification.enums import DataType
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spynnaker.pyNN.connections import SpynnakerPoissonControlConnection
+from unittests.connection_tests.loopback import (
+    LoopbackReceiver, MockDatabaseReader, elements, read_database)
+
+_BASE_KEY = 0x30000
+_N_NEURONS = 1000
+
+
+def _received(receiver):
+    return [(element.key, element.payload)
+            for _, message in receiver.receive_messages()
+            for element in elements(message)]
+
+
+def test_set_rates():
+    receiver = LoopbackReceiver()
+    connection = SpynnakerPoissonControlConnection(
+        poisson_labels=["poisson"], local_host="127.0.0.1", local_port=None)
+    read_database(connection, MockDatabaseReader({
+        "poisson_control": {i: _BASE_KEY + i for i in range(_N_NEURONS)}}))
+    try:
+        rng = numpy.random.default_rng(1)
+        neuron_ids = rng.integers(0, _N_NEURONS, 200)
+        rates = rng.uniform(0, 100, 200)
+        assert connection.set_rates("poisson", neuron_ids, rates) == 7
+        expected = [
+            (_BASE_KEY + nid, DataType.S1615.encode_as_int(rate))
+            for nid, rate in zip(neuron_ids, rates)]
+        assert _received(receiver) == expected
+
+        # Only the last rate of each neuron is sent when coalescing
+        connection.set_rates(
+            "poisson", [1, 2, 1, 3, 2], [5, 6, 7, 8, 9], coalesce=True)
+        assert _received(receiver) == [
+            (_BASE_KEY + nid, DataType.S1615.encode_as_int(rate))
+            for nid, rate in [(1, 7), (3, 8), (2, 9)]]
+
+        # The list of tuples form still works
+        connection.set_rate("poisson", 4, 2.5)
+        assert _received(receiver) == [
+            (_BASE_KEY + 4, DataType.S1615.encode_as_int(2.5))]
+
+        with pytest.raises(ValueError):
+            connection.set_rates("poisson", [1, 2], [1.0])
+        with pytest.raises(ValueError):
+            connection.set_rates("poisson", [1], [-1.0])
+        with pytest.raises(SpinnmanInvalidParameterException):
+            connection.set_rates("poisson", [-1], [5.0])
+        with pytest.raises(SpinnmanInvalidParameterException):
+            connection.set_rates("poisson", [1, _N_NEURONS], [5.0, 6.0])
+        assert _received(receiver) == []
+
+        # Nothing is sent or counted when there is nowhere to send to
+        # pylint: disable=protected-access
+        connection._LiveEventConnection__send_address_details[
+            "poisson_control"] = None
+        assert connection.set_rates("poisson", [1], [5.0]) == 0
+        assert _received(receiver) == []
+    finally:
+        connection.close()
+        receiver.close()
@@ -0,0 +1,57 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from scipy import sparse
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    ArrayConnector)
+from unittests.mocks import MockPopulation
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.config_setup import unittest_setup
+
+_ARRAY = (numpy.random.RandomState(7).uniform(size=(20, 15)) < 0.3).astype(
+    "uint8")
+
+
+@pytest.mark.parametrize(
+    "array", [_ARRAY, sparse.csr_matrix(_ARRAY), sparse.coo_matrix(_ARRAY)])
+def test_array_connector(array):
+    unittest_setup()
+    connector = ArrayConnector(array)
+    synapse_info = SynapseInformation(
+            connector=None, pre_population=MockPopulation(20, "Pre"),
+            post_population=MockPopulation(15, "Post"), prepop_is_view=False,
+            postpop_is_view=False, rng=None, synapse_dynamics=None,
+            synapse_type=None, is_virtual_machine=False, weights=1.0,
+            delays=2.0)
+    connector.set_projection_information(synapse_info)
+
+    post_vertex_slice = Slice(5, 9)
+    assert (connector.get_n_connections_from_pre_vertex_maximum(
+        post_vertex_slice, synapse_info) == _ARRAY[:, 5:10].sum(1).max())
+    assert (connector.get_n_connections_to_post_vertex_maximum(
+        synapse_info) == _ARRAY.sum(0).max())
+
+    pre_vertex_slice = Slice(10, 19)
+    block = connector.create_synaptic_block(
+        [Slice(0, 9), pre_vertex_slice], [Slice(0, 4), post_vertex_slice],
+        pre_vertex_slice, post_vertex_slice, 0, synapse_info)
+    sources, targets = numpy.nonzero(_ARRAY[10:20, 5:10])
+    assert list(block["source"]) == list(sources + 10)
+    assert list(block["target"]) == list(targets + 5)
+    assert all(item["weight"] == 1.0 for item in block)
+    assert all(item["delay"] == 2.0 for item in block)
@@ -73,6 +73,31 @@ def test_csa_from_list_connector():
     assert(all(item["delay"] == 2.0 for item in block))
 
 
+def test_csa_slices():
+    unittest_setup()
+    conn_list = [(i, (i * 3) % 20) for i in range(20)] + [(4, 2), (4, 3)]
+    connector = CSAConnector(conn_list)
+    synapse_info = SynapseInformation(
+            connector=None, pre_population=MockPopulation(20, "Pre"),
+            post_population=MockPopulation(20, "Post"), prepop_is_view=False,
+            postpop_is_view=False, rng=None, synapse_dynamics=None,
+            synapse_type=None, is_virtual_machine=False, weights=1.0,
+            delays=2.0)
+    connector.set_projection_information(synapse_info)
+    pre_vertex_slice = Slice(0, 9)
+    post_vertex_slice = Slice(0, 9)
+    assert connector.get_n_connections_from_pre_vertex_maximum(
+        post_vertex_slice, synapse_info) == 2
+    assert connector.get_n_connections_to_post_vertex_maximum(
+        synapse_info) == 2
+    block = connector.create_synaptic_block(
+        [pre_vertex_slice, Slice(10, 19)], [post_vertex_slice, Slice(10, 19)],
+        pre_vertex_slice, post_vertex_slice, 0, synapse_info)
+    expected = sorted(
+        (i, j) for i, j in conn_list if i <= 9 and j <= 9)
+    assert list(zip(block["source"], block["target"])) == expected
+
+
 def test_csa_random_connector():
     unittest_setup()
     connector = CSAConnector(csa.random(0.05))
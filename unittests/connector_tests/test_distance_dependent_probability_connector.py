@@ -0,0 +1,136 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import math
+import numpy
+from pyNN.random import NumpyRNG
+from pyNN.space import Cuboid, Grid2D, RandomStructure, Space
+from spinn_utilities.config_holder import set_config
+from pacman.model.graphs.common.slice import Slice
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    DistanceDependentProbabilityConnector, FixedProbabilityConnector)
+from spynnaker.pyNN.models.neural_projections.connectors.\
+    abstract_generate_connector_on_machine import (
+        PARAM_TYPE_DISTANCE_DEPENDENT)
+from spynnaker.pyNN.models.neural_projections.connectors.\
+    distance_dependence import (
+        N_DISTANCE_DEPENDENCE_WORDS, evaluate_distance_dependence)
+from unittests.mocks import MockPopulation
+
+_N_NEURONS = 100
+
+
+class _PlacedPopulation(MockPopulation):
+    def __init__(self, size, label, structure):
+        super().__init__(size, label)
+        self.positions = structure.generate_positions(size).T
+
+
+def _synapse_info(connector, space, weights=1.0, structure=None):
+    structure = structure or Grid2D(dx=1.0, dy=1.0)
+    synapse_info = SynapseInformation(
+            connector=None,
+            pre_population=_PlacedPopulation(_N_NEURONS, "Pre", structure),
+            post_population=_PlacedPopulation(_N_NEURONS, "Post", structure),
+            prepop_is_view=False, postpop_is_view=False, rng=None,
+            synapse_dynamics=None, synapse_type=None,
+            is_virtual_machine=False, weights=weights, delays=2.0)
+    connector.set_space(space)
+    connector.set_projection_information(synapse_info)
+    return synapse_info
+
+
+def _setup():
+    unittest_setup()
+    set_config("Simulation", "generate_distance_dependence_on_machine", True)
+
+
+def test_off_by_default():
+    unittest_setup()
+    connector = DistanceDependentProbabilityConnector("exp(-d)")
+    _synapse_info(connector, Space())
+    assert not connector.generate_on_machine(1.0, 2.0)
+
+    connector = FixedProbabilityConnector(0.5)
+    _synapse_info(connector, Space(), weights="1.0 + 0.5 * d")
+    assert not connector.generate_on_machine("1.0 + 0.5 * d", 2.0)
+
+
+def test_probability_statistics():
+    _setup()
+    space = Space(axes="xy")
+    connector = DistanceDependentProbabilityConnector(
+        "exp(-(d ** 2) / 8.0)", rng=NumpyRNG(seed=1))
+    synapse_info = _synapse_info(connector, space)
+    assert connector.generate_on_machine(1.0, 2.0)
+
+    vertex_slice = Slice(0, _N_NEURONS - 1)
+    params = connector.gen_connector_params(
+        [vertex_slice], [vertex_slice], vertex_slice, vertex_slice, 0,
+        synapse_info)
+    assert (len(params) * BYTES_PER_WORD ==
+            connector.gen_connector_params_size_in_bytes)
+
+    # The reference of what the machine does matches the expression
+    probs = evaluate_distance_dependence(
+        params[5:5 + N_DISTANCE_DEPENDENCE_WORDS],
+        numpy.arange(_N_NEURONS), numpy.arange(_N_NEURONS))
+    positions = synapse_info.pre_population.positions
+    d = space.distances(positions, positions).reshape(probs.shape)
+    assert numpy.allclose(probs, numpy.exp(-(d ** 2) / 8.0), atol=1e-4)
+
+    # The host makes as many connections as the machine would be expected to
+    block = connector.create_synaptic_block(
+        [vertex_slice], [vertex_slice], vertex_slice, vertex_slice, 0,
+        synapse_info)
+    mean = numpy.sum(probs)
+    std_dev = math.sqrt(numpy.sum(probs * (1.0 - probs)))
+    assert abs(len(block) - mean) < 5 * std_dev
+
+
+def test_distance_dependent_weights():
+    _setup()
+    connector = FixedProbabilityConnector(0.5, rng=NumpyRNG(seed=1))
+    weights = "1.0 + 0.5 * d"
+    _synapse_info(connector, Space(), weights=weights)
+    assert connector.generate_on_machine(weights, 2.0)
+    assert connector.gen_weights_id(weights) == PARAM_TYPE_DISTANCE_DEPENDENT
+
+    post_slice = Slice(50, 99)
+    params = connector.gen_weights_params(
+        weights, Slice(0, _N_NEURONS - 1), post_slice)
+    assert (len(params) * BYTES_PER_WORD ==
+            connector.gen_weight_params_size_in_bytes(weights))
+    assert params[0] == post_slice.lo_atom
+    values = evaluate_distance_dependence(params[1:], [0], [99])
+    assert math.isclose(
+        values[0, 0], 1.0 + 0.5 * math.hypot(9, 9), abs_tol=1e-4)
+
+
+def test_not_on_machine():
+    _setup()
+    # Positions that aren't on a grid are not supported
+    connector = DistanceDependentProbabilityConnector("d < 3")
+    _synapse_info(connector, Space(), structure=RandomStructure(
+        Cuboid(10, 10, 10), rng=NumpyRNG(seed=1)))
+    assert not connector.generate_on_machine(1.0, 2.0)
+
+    # Nor are expressions that aren't in the supported forms
+    connector = DistanceDependentProbabilityConnector("1 / (1 + d)")
+    _synapse_info(connector, Space())
+    assert not connector.generate_on_machine(1.0, 2.0)
@@ -0,0 +1,53 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    IndexBasedProbabilityConnector)
+from unittests.mocks import MockPopulation
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.config_setup import unittest_setup
+
+
+def test_index_based_blocks():
+    unittest_setup()
+    # Connect each neuron to the one with the same index, but never to itself
+    connector = IndexBasedProbabilityConnector(
+        "(i == j) * 1.0", allow_self_connections=False)
+    synapse_info = SynapseInformation(
+            connector=None, pre_population=MockPopulation(20, "Pre"),
+            post_population=MockPopulation(20, "Post"), prepop_is_view=False,
+            postpop_is_view=False, rng=None, synapse_dynamics=None,
+            synapse_type=None, is_virtual_machine=False, weights=1.0,
+            delays=2.0)
+    connector.set_projection_information(synapse_info)
+    assert connector.get_n_connections_to_post_vertex_maximum(
+        synapse_info) > 0
+
+    pre_vertex_slice = Slice(5, 14)
+    post_vertex_slice = Slice(10, 19)
+    block = connector.create_synaptic_block(
+        [Slice(0, 4), pre_vertex_slice, Slice(15, 19)],
+        [Slice(0, 9), post_vertex_slice], pre_vertex_slice,
+        post_vertex_slice, 0, synapse_info)
+    assert len(block) == 0
+
+    connector.allow_self_connections = True
+    block = connector.create_synaptic_block(
+        [Slice(0, 4), pre_vertex_slice, Slice(15, 19)],
+        [Slice(0, 9), post_vertex_slice], pre_vertex_slice,
+        post_vertex_slice, 0, synapse_info)
+    assert list(block["source"]) == [10, 11, 12, 13, 14]
+    assert list(block["target"]) == [10, 11, 12, 13, 14]
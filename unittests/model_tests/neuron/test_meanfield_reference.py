@@ -0,0 +1,106 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.builds import MeanfieldBase
+from spynnaker.pyNN.models.neuron.neuron_models import (
+    MeanfieldReference, run_coupled)
+
+
+def _parameters():
+    parameters = dict(MeanfieldBase.default_parameters,
+                      **MeanfieldBase.default_initial_values)
+    parameters["Timescale_inv"] = 0.2
+    return parameters
+
+
+def test_fixed_step():
+    unittest_setup()
+    coarse = MeanfieldReference(_parameters())
+    fine = MeanfieldReference(_parameters())
+    coarse_run = coarse.run(200, timestep=1.0)
+    fine_run = fine.run(2000, timestep=0.1)
+    assert numpy.allclose(coarse_run[:, -1], fine_run[:, -1], rtol=1e-3)
+    assert coarse.n_accepted == 200
+    assert coarse.n_rejected == 0
+
+
+def test_adaptive_step():
+    unittest_setup()
+    fixed = MeanfieldReference(_parameters())
+    adaptive = MeanfieldReference(
+        _parameters(), integrator="heun_euler", tolerance=0.01, h_min=0.01)
+    fixed_run = fixed.run(2000, timestep=0.1)
+    adaptive_run = adaptive.run(200, timestep=1.0)
+    assert numpy.allclose(fixed_run[:, -1], adaptive_run[:, -1], rtol=1e-3)
+    # The step had to be cut down at first, then grew again
+    assert adaptive.n_rejected > 0
+    assert adaptive.n_accepted > 200
+
+
+def test_steps_per_timestep_transient():
+    unittest_setup()
+    fine_run = MeanfieldReference(_parameters()).run(5000, timestep=0.01)
+    for integrator in ("rk2", "heun_euler"):
+        # Each update covers its share of the timestep, so splitting the
+        # timestep follows the trajectory of a shorter timestep exactly
+        split_run = MeanfieldReference(
+            _parameters(), integrator=integrator).run(
+                50, timestep=1.0, n_steps_per_timestep=10)
+        short_run = MeanfieldReference(
+            _parameters(), integrator=integrator).run(500, timestep=0.1)
+        assert numpy.allclose(split_run, short_run[:, ::10])
+
+    # The whole transient, not just where it settles, is close to that of a
+    # much shorter timestep
+    split_run = MeanfieldReference(_parameters()).run(
+        50, timestep=1.0, n_steps_per_timestep=10)
+    assert numpy.ptp(fine_run[2]) > 100.0
+    assert numpy.allclose(split_run, fine_run[:, ::100], rtol=1e-2, atol=1e-2)
+
+
+def test_unknown_integrator():
+    unittest_setup()
+    with pytest.raises(ValueError):
+        MeanfieldReference(_parameters(), integrator="rk45")
+
+
+def test_coupled():
+    unittest_setup()
+    alone = MeanfieldReference(_parameters())
+    alone_run = alone.run(100)
+
+    # Zero weights leave the meanfields as they would be alone
+    pre = [MeanfieldReference(_parameters()) for _ in range(2)]
+    post = [MeanfieldReference(_parameters()) for _ in range(3)]
+    pre_run, post_run = run_coupled(
+        [pre, post], [(0, 1, numpy.zeros((2, 3)), "Ve", "excitatory")], 100)
+    assert numpy.allclose(pre_run[:, 0, :], alone_run)
+    assert numpy.allclose(post_run[:, 2, :], alone_run)
+
+    # Coupling only changes the post-population, and only after the rates
+    # of the first timestep have been sent
+    pre = [MeanfieldReference(_parameters()) for _ in range(2)]
+    post = [MeanfieldReference(_parameters()) for _ in range(3)]
+    weights = numpy.array([[1.0, 0.5, 0.0], [1.0, 0.5, 0.0]])
+    pre_run, post_run = run_coupled(
+        [pre, post], [(0, 1, weights, "Ve", "excitatory")], 100)
+    assert numpy.allclose(pre_run[:, 0, :], alone_run)
+    assert numpy.allclose(post_run[:, :, :2], alone_run[:, None, :2])
+    assert numpy.allclose(post_run[:, 2, :], alone_run)
+    assert not numpy.allclose(post_run[:, 0, :], alone_run)
+    assert not numpy.allclose(post_run[:, 0, :], post_run[:, 1, :])
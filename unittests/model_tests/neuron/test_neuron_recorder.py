@@ -12,7 +12,11 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import numpy
+import pytest
 from data_specification.enums import DataType
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spynnaker.pyNN.config_setup import unittest_setup
 from spynnaker.pyNN.models.common import NeuronRecorder
 
@@ -51,3 +55,39 @@ def test_recording_variables():
     nr.set_recording("gsyn_inh", True)
     assert(["v", "gsyn_inh"] == nr.recording_variables)
     assert([0, 2] == nr.recorded_region_ids)
+
+
+def test_recording_modes():
+    unittest_setup()
+    recordables = ["Ve", "w"]
+    data_types = {"Ve": DataType.S1615, "w": DataType.S1615}
+
+    plain = NeuronRecorder(recordables, data_types, [], 10, [], [], [], [])
+    with pytest.raises(ConfigurationException):
+        plain.set_recording_mode("Ve", "mean")
+
+    nr = NeuronRecorder(
+        recordables, data_types, [], 10, [], [], [], [], True)
+    with pytest.raises(ConfigurationException):
+        nr.set_recording_mode("Ve", "median")
+    nr.set_recording("Ve", True)
+    nr.set_recording("w", True, indexes=[1, 3])
+    nr.set_recording_mode("Ve", "mean", population=True)
+    nr.set_recording_mode("w", "max")
+    vertex_slice = Slice(0, 4)
+
+    # The whole population of the slice records into a single column
+    assert nr._count_recording_per_slice("Ve", vertex_slice) == 1
+    assert nr._count_recording_per_slice("w", vertex_slice) == 2
+    assert (nr.get_buffered_sdram_per_record("Ve", vertex_slice) ==
+            2 * DataType.S1615.size)
+
+    data = nr._get_data(vertex_slice)
+    assert len(data) * 4 == (
+        nr.get_metadata_sdram_usage_in_bytes(vertex_slice) - 8)
+    # rate, n_recording, element size, mode, then 8 byte indices per variable
+    assert list(data[:4]) == [1, 1, 4, 1 | 0x100]
+    assert list(data[4:6].view("uint8")[:5]) == [0, 0, 0, 0, 0]
+    assert list(data[6:10]) == [1, 2, 4, 3]
+    assert list(data[10:12].view("uint8")[:5]) == [2, 0, 2, 1, 2]
+    assert numpy.all(data[10:12].view("uint8")[5:] == 2)
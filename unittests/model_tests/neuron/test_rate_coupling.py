@@ -0,0 +1,110 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest.mock import Mock
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from data_specification.enums import DataType
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+from spynnaker.pyNN.models.neuron.population_machine_neurons import (
+    NeuronRegions, PopulationMachineNeurons)
+from spynnaker.pyNN.utilities.utility_calls import get_n_bits
+
+_REGION = 2
+_MASK = 0xFFFFFFF0
+_N_PRE = 5
+_N_POST = 3
+
+
+class _Spec(object):
+    """ Records the words written to a region
+    """
+
+    def __init__(self):
+        self.size = None
+        self.words = list()
+
+    def reserve_memory_region(self, region, size, label=None):
+        assert region == _REGION
+        self.size = size
+
+    def switch_write_focus(self, region):
+        assert region == _REGION
+
+    def write_value(self, data):
+        self.words.append(int(data))
+
+    def write_array(self, array_values):
+        self.words.extend(int(value) for value in numpy.asarray(
+            array_values, dtype="uint32"))
+
+
+class _MachineVertex(object):
+    """ Just enough of a machine vertex to write the rate coupling region
+    """
+
+    def __init__(self, app_vertex, vertex_slice):
+        self._app_vertex = app_vertex
+        self._vertex_slice = vertex_slice
+        self._neuron_regions = NeuronRegions(0, 1, _REGION)
+
+
+def _projection(weights, pre_slices, post_vertex):
+    pre_vertex = Mock(n_atoms=_N_PRE)
+    pre_vertex.get_max_atoms_per_core.return_value = _N_PRE
+    machine_edges = [
+        Mock(pre_vertex=Mock(vertex_slice=pre_slice), post_vertex=post_vertex)
+        for pre_slice in pre_slices]
+    # An edge to another core, which should be left out
+    machine_edges.append(Mock(pre_vertex=Mock(vertex_slice=pre_slices[0])))
+    return Mock(weights=weights, source_is_vi=True, receptor=1, edge=Mock(
+        pre_vertex=pre_vertex, machine_edges=machine_edges))
+
+
+def test_write_rate_coupling():
+    unittest_setup()
+    app_vertex = Mock(sends_rates=False)
+    post_slice = Slice(0, _N_POST - 1)
+    machine_vertex = _MachineVertex(app_vertex, post_slice)
+
+    # The source is split more finely than its atoms per core allows
+    pre_slices = [Slice(i, i) for i in range(_N_PRE)]
+    weights = numpy.arange(_N_PRE * _N_POST).reshape(_N_PRE, _N_POST) / 4.0
+    projection = _projection(weights, pre_slices, machine_vertex)
+    app_vertex.incoming_rate_projections = [projection]
+    # pylint: disable=protected-access
+    app_vertex._AbstractPopulationVertex__incoming_rate_projections = [
+        projection]
+    app_vertex.get_rate_coupling_size.side_effect = (
+        lambda vertex_slice: AbstractPopulationVertex.get_rate_coupling_size(
+            app_vertex, vertex_slice))
+    keys = {pre_slice: (i + 1) << 4 for i, pre_slice in enumerate(pre_slices)}
+    routing_info = Mock()
+    routing_info.get_routing_info_from_pre_vertex.side_effect = (
+        lambda vertex, _partition: Mock(
+            first_key=keys[vertex.vertex_slice], first_mask=_MASK))
+
+    spec = _Spec()
+    PopulationMachineNeurons._write_rate_coupling(
+        machine_vertex, spec, routing_info)
+
+    expected = [0, 2**get_n_bits(_N_POST), _N_PRE]
+    for i, pre_slice in enumerate(pre_slices):
+        expected.extend([keys[pre_slice], _MASK, 1, 2**get_n_bits(1), 1, 1])
+        expected.extend(DataType.S1615.encode_as_int(weight)
+                        for weight in weights[i])
+    assert spec.words == expected
+    assert len(spec.words) * 4 <= spec.size
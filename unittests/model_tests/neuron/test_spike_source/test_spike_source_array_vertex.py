@@ -15,6 +15,8 @@
 
 import unittest
 from spynnaker.pyNN.models.spike_source import SpikeSourceArrayVertex
+from spynnaker.pyNN.models.spike_source.compressed_spike_times import (
+    CompressedSpikeTimes)
 import spynnaker8
 
 
@@ -42,3 +44,15 @@ class TestSpikeSourceArrayVertex(unittest.TestCase):
         SpikeSourceArrayVertex(
             n_neurons=3, spike_times=[[1], [11], [22]], constraints=None,
             label="test", max_atoms_per_core=None, model=None, splitter=None)
+
+    def test_compressed_times(self):
+        v = SpikeSourceArrayVertex(
+            n_neurons=3, spike_times=[[1, 2], [], [3.5]], constraints=None,
+            label="test", max_atoms_per_core=None, model=None, splitter=None)
+        ticks = v.send_buffer_times
+        self.assertIsInstance(ticks, CompressedSpikeTimes)
+        self.assertListEqual([[1, 2], [], [4]], ticks.tolist())
+        # Slices share the times of the whole
+        self.assertListEqual([[], [4]], ticks[1:3].tolist())
+        self.assertIs(ticks.times, ticks[1:3].times)
+        self.assertListEqual([[1.0, 2.0], [], [3.5]], v.spike_times)
@@ -0,0 +1,45 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+from spynnaker.pyNN.models.spike_source import SpikeSourceFromFile
+import spynnaker8
+
+
+class TestSpikeSourceFromFile(unittest.TestCase):
+
+    def setUp(cls):
+        spynnaker8.setup()
+
+    def _vertex(self, lines, n_neurons):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spike_file = os.path.join(tmpdir, "spikes.txt")
+            with open(spike_file, "w") as f:
+                f.writelines(lines)
+            model = SpikeSourceFromFile(spike_file)
+        return model.create_vertex(n_neurons, "test", None, None)
+
+    def test_padded_to_population(self):
+        # Neurons 3 and 4 have no spikes in the file
+        v = self._vertex(["4.0\t2\n", "1.0\t0\n", "2.0\t2\n"], 5)
+        self.assertListEqual(
+            [[1.0], [], [2.0, 4.0], [], []], v.spike_times)
+        self.assertEqual(5, len(v.send_buffer_times))
+
+    def test_empty_file(self):
+        v = self._vertex([], 3)
+        self.assertListEqual([[], [], []], v.spike_times)
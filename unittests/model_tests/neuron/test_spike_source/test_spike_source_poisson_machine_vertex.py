@@ -0,0 +1,170 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest.mock import Mock
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities.constants import (
+    MICRO_TO_SECOND_CONVERSION)
+from spinn_front_end_common.utilities.globals_variables import (
+    machine_time_step)
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_machine_vertex \
+    import SpikeSourcePoissonMachineVertex, get_rates_bytes
+
+# The rates of each neuron, with their starts and durations; NaN is "until
+# the end".  The rates cover zero, slow, fast and faster sources.
+_RATES = [[10.0], [0.5, 50.0, 0.0], [20000.0, 5.0], [100.0],
+          [1.0, 2.0, 3.0], [0.0, 40.0]]
+_STARTS = [[0.0], [0.0, 100.0, 200.0], [0.0, 50.0], [10.0],
+           [0.0, 100.0, 300.0], [0.0, 500.0]]
+_DURATIONS = [[numpy.nan], [100.0, 100.0, numpy.nan], [50.0, numpy.nan],
+              [numpy.nan], [100.0, 200.0, numpy.nan], [500.0, 100.0]]
+_TIME_TO_SPIKE = [[3], [1, 2, 3], [4, 5], [6], [7, 8, 9], [10, 11]]
+_RATE_CHANGE = numpy.array([True, False, True, False, True, True])
+
+
+class _Spec(object):
+    def __init__(self):
+        self.written = list()
+
+    def comment(self, comment):
+        pass
+
+    def switch_write_focus(self, region):
+        pass
+
+    def write_array(self, array_values):
+        self.written.extend(numpy.asarray(array_values).tolist())
+
+
+class _MachineVertex(object):
+    """ Just what writing the rates uses; everything else comes from\
+        the real machine vertex class
+    """
+
+    def __init__(self, app_vertex, vertex_slice):
+        self._app_vertex = app_vertex
+        self.vertex_slice = vertex_slice
+
+    def __getattr__(self, name):
+        return getattr(SpikeSourcePoissonMachineVertex, name)
+
+
+def _flatten(values):
+    return [value for per_neuron in values for value in per_neuron]
+
+
+def _old_write_poisson_rates(self, spec, first_machine_time_step):
+    """ How the rates were written, from per-neuron lists """
+    # pylint: disable=protected-access
+    starts = numpy.array(_flatten(
+        self._app_vertex.start[self.vertex_slice.as_slice])).astype("float")
+    durations = numpy.array(_flatten(
+        self._app_vertex.duration[self.vertex_slice.as_slice])).astype(
+            "float")
+    local_rates = self._app_vertex.rates[self.vertex_slice.as_slice]
+    n_rates = numpy.array([len(r) for r in local_rates])
+    splits = numpy.cumsum(n_rates)
+    rates = numpy.array(_flatten(local_rates))
+    time_to_spike = numpy.array(_flatten(self._app_vertex.time_to_spike[
+        self.vertex_slice.as_slice])).astype("u4")
+    rate_change = self._app_vertex.rate_change[self.vertex_slice.as_slice]
+
+    starts_scaled = self._convert_ms_to_n_timesteps(starts)
+    no_duration = numpy.isnan(durations)
+    durations_filtered = numpy.where(no_duration, 0, durations)
+    ends_scaled = self._convert_ms_to_n_timesteps(
+        durations_filtered) + starts_scaled
+    ends_scaled = numpy.where(no_duration, self._MAX_TIMESTEP, ends_scaled)
+    starts_split = numpy.array_split(starts_scaled, splits)
+    next_scaled = numpy.concatenate(
+        [numpy.append(s[1:], self._MAX_TIMESTEP) for s in starts_split[:-1]])
+
+    spikes_per_tick = rates * (
+        machine_time_step() / MICRO_TO_SECOND_CONVERSION)
+    is_fast_source = spikes_per_tick >= self.SLOW_RATE_PER_TICK_CUTOFF
+    is_faster_source = spikes_per_tick >= self.FAST_RATE_PER_TICK_CUTOFF
+    not_zero = spikes_per_tick > 0
+    is_slow_source = numpy.logical_not(is_fast_source)
+    exp_minus_lambda = DataType.U032.encode_as_numpy_int_array(
+        numpy.where(is_fast_source, numpy.exp(-1.0 * spikes_per_tick), 0))
+    sqrt_lambda = DataType.S1615.encode_as_numpy_int_array(
+        numpy.where(is_faster_source, numpy.sqrt(spikes_per_tick), 0))
+    isi_val = numpy.where(
+        not_zero & is_slow_source,
+        (1.0 / spikes_per_tick).astype(int), 0).astype("uint32")
+
+    time_to_spike_split = numpy.array_split(time_to_spike, splits)
+    time_to_spike = numpy.concatenate(
+        [t if rate_change[i] else numpy.repeat(0, len(t))
+         for i, t in enumerate(time_to_spike_split[:-1])])
+    is_fast_source = is_fast_source.astype("uint32")
+    core_data = numpy.dstack((
+        starts_scaled, ends_scaled, next_scaled, is_fast_source,
+        exp_minus_lambda, sqrt_lambda, isi_val, time_to_spike))[0]
+    core_data_split = numpy.array_split(core_data, splits)
+    ends_scaled_split = numpy.array_split(ends_scaled, splits)
+    indices = [numpy.argmax(e > first_machine_time_step)
+               for e in ends_scaled_split[:-1]]
+    final_data = numpy.concatenate([
+        numpy.concatenate(([len(d), indices[i]], numpy.concatenate(d)))
+        for i, d in enumerate(core_data_split[:-1])])
+    spec.write_array(final_data)
+
+
+def _app_vertex():
+    """ An application vertex that gives its rates both per neuron and in\
+        compressed sparse row form
+    """
+    app_vertex = Mock()
+    app_vertex.rates = [numpy.array(r) for r in _RATES]
+    app_vertex.start = [numpy.array(s) for s in _STARTS]
+    app_vertex.duration = [numpy.array(d) for d in _DURATIONS]
+    app_vertex.time_to_spike = [numpy.array(t) for t in _TIME_TO_SPIKE]
+    app_vertex.rate_change = _RATE_CHANGE
+    offsets = numpy.concatenate(
+        ([0], numpy.cumsum([len(r) for r in _RATES])))
+    app_vertex.rate_offsets = offsets
+
+    def get_rate_data(vertex_slice):
+        lo, hi = vertex_slice.lo_atom, vertex_slice.hi_atom + 1
+        return (numpy.diff(offsets[lo:hi + 1]),
+                numpy.array(_flatten(_STARTS[lo:hi])),
+                numpy.array(_flatten(_DURATIONS[lo:hi])),
+                numpy.array(_flatten(_RATES[lo:hi])),
+                numpy.array(_flatten(_TIME_TO_SPIKE[lo:hi]), dtype="uint32"))
+
+    app_vertex.get_rate_data.side_effect = get_rate_data
+    return app_vertex
+
+
+def test_write_poisson_rates():
+    unittest_setup()
+    app_vertex = _app_vertex()
+    for vertex_slice in (Slice(0, 5), Slice(1, 4)):
+        for first_machine_time_step in (0, 150, 1000):
+            machine_vertex = _MachineVertex(app_vertex, vertex_slice)
+            expected = _Spec()
+            _old_write_poisson_rates(
+                machine_vertex, expected, first_machine_time_step)
+            spec = _Spec()
+            # pylint: disable=protected-access
+            SpikeSourcePoissonMachineVertex._write_poisson_rates(
+                machine_vertex, spec, first_machine_time_step)
+            assert spec.written == expected.written
+            assert len(spec.written) * 4 == get_rates_bytes(
+                vertex_slice, app_vertex.rate_offsets)
@@ -0,0 +1,98 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest.mock import Mock
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    AbstractSynapseDynamics, SynapseDynamicsStructuralCommon)
+
+_S_MAX = 4
+
+
+class _Spec(object):
+    def __init__(self):
+        self.written = list()
+
+    def comment(self, comment):
+        pass
+
+    def write_array(self, array_values):
+        self.written.extend(numpy.asarray(array_values, dtype="uint32"))
+
+
+class _Structural(object):
+    """ Just the state that writing the post-to-pre table uses
+    """
+
+    def __init__(self, connections):
+        self.connections = connections
+        self.s_max = _S_MAX
+
+
+def _old_post_to_pre_table(
+        pop_indices, subpop_indices, sources, targets, n_atoms):
+    """ How the table was made a row at a time """
+    conn_data = numpy.dstack((pop_indices, subpop_indices, sources))[0]
+    rows = [conn_data[targets == i] for i in range(0, n_atoms)]
+    padded_rows = [numpy.pad(row, [(_S_MAX - len(row), 0), (0, 0)],
+                             "constant", constant_values=0xFFFF)
+                   for row in rows]
+    return numpy.core.records.fromarrays(
+        numpy.concatenate(padded_rows).T, formats="u1, u1, u2").view("u4")
+
+
+def test_post_to_pre_table():
+    unittest_setup()
+    rng = numpy.random.default_rng(1)
+    post_slice = Slice(10, 19)
+    app_vertex = Mock()
+    pop_index = dict()
+    slice_conns = list()
+    pop_indices = list()
+    subpop_indices = list()
+    sources = list()
+    for pop, (n_conns, pre_lo) in enumerate([(12, 0), (9, 20), (0, 40)]):
+        a_edge = Mock()
+        s_info = Mock()
+        pop_index[a_edge.pre_vertex, s_info] = pop
+        m_edge = Mock()
+        m_edge.pre_vertex.index = pop + 2
+        m_edge.pre_vertex.vertex_slice = Slice(pre_lo, pre_lo + 9)
+        conns = numpy.zeros(
+            n_conns, dtype=AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+        conns["source"] = pre_lo + rng.integers(0, 10, n_conns)
+        # At most s_max connections per target overall
+        conns["target"] = post_slice.lo_atom + rng.permutation(
+            numpy.repeat(numpy.arange(10), 2))[:n_conns]
+        slice_conns.append((conns, a_edge, m_edge, s_info))
+        pop_indices.extend([pop] * n_conns)
+        subpop_indices.extend([pop + 2] * n_conns)
+        sources.extend(conns["source"] - pre_lo)
+    targets = numpy.concatenate(
+        [conns["target"] for conns, _, _, _ in slice_conns])
+    expected = _old_post_to_pre_table(
+        pop_indices, subpop_indices, sources,
+        targets - post_slice.lo_atom, post_slice.n_atoms)
+
+    structural = _Structural(
+        {(app_vertex, post_slice.lo_atom): slice_conns})
+    spec = _Spec()
+    # pylint: disable=protected-access
+    SynapseDynamicsStructuralCommon.\
+        _SynapseDynamicsStructuralCommon__write_post_to_pre_table(
+            structural, spec, pop_index, app_vertex, post_slice)
+    assert numpy.array_equal(expected, spec.written)
@@ -0,0 +1,97 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from data_specification.enums.data_type import DataType
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.synapse_expander_replay import (
+    MarsKiss64, can_replay, replay_expansion)
+
+_SEED = [1, 2, 3, 4]
+_NO_MATRIX = 0xFFFFFFFF
+
+
+def _s1615(*values):
+    return numpy.array(
+        [DataType.S1615.encode_as_int(v) for v in values], dtype="uint32")
+
+
+def _gen_data(connector_id, connector_params, weights, delays):
+    """ Make generator data for 10 pre-neurons onto 10 post-neurons with
+        a constant weight of 1.5 and the given delays
+    """
+    if numpy.isscalar(delays):
+        delay_id, delay_params = 0, _s1615(delays)
+    else:
+        delay_id = 1
+        delay_params = numpy.concatenate((_s1615(*delays), _SEED))
+    header = numpy.array([
+        0, _NO_MATRIX, 10, 0, 10, 0, 0, 10, 1, 16,
+        DataType.S1615.encode_as_int(1.0), 0, 0, connector_id, 0, delay_id],
+        dtype="uint32")
+    return [header, numpy.zeros(0, dtype="uint32"),
+            numpy.array(connector_params + _SEED, dtype="uint32"),
+            _s1615(weights), delay_params.astype("uint32")]
+
+
+def test_mars_kiss():
+    # Values from the C implementation with the same seed
+    rng = MarsKiss64([123456789, 987654321, 43219876, 6543217])
+    assert [rng.next() for _ in range(5)] == [
+        560241513, 2602615593, 2542353780, 3322652092, 2306311670]
+
+
+def test_fixed_probability():
+    unittest_setup()
+    certain = replay_expansion(
+        _gen_data(2, [0, 9, 0, 9, 1, 0xFFFFFFFF], 1.5, (1, 5)), 0, 10, 256.0)
+    assert len(certain) == 100
+    assert numpy.all(certain["weight"] == 384)
+    assert numpy.all((certain["delay"] >= 1) & (certain["delay"] < 5))
+
+    no_self = replay_expansion(
+        _gen_data(2, [0, 9, 0, 9, 0, 0xFFFFFFFF], 1.5, 1), 0, 10, 256.0)
+    assert len(no_self) == 90
+    assert not numpy.any(no_self["source"] == no_self["target"])
+
+    # The same data gives the same connections
+    data = _gen_data(2, [0, 9, 0, 9, 1, 0x7FFFFFFF], 1.5, (1, 5))
+    first = replay_expansion(data, 0, 10, 256.0)
+    assert 0 < len(first) < 100
+    assert numpy.array_equal(first, replay_expansion(data, 0, 10, 256.0))
+
+
+def test_fixed_numbers():
+    unittest_setup()
+    post = replay_expansion(
+        _gen_data(5, [0, 9, 0, 9, 1, 0, 3, 10], 1.5, 2), 0, 10, 256.0)
+    assert list(numpy.bincount(post["source"])) == [3] * 10
+    pre = replay_expansion(
+        _gen_data(4, [0, 9, 0, 9, 0, 0, 3, 10], 1.5, 2), 0, 10, 256.0)
+    assert list(numpy.bincount(pre["target"])) == [3] * 10
+    assert not numpy.any(pre["source"] == pre["target"])
+    total = replay_expansion(
+        _gen_data(3, [0, 9, 0, 9, 1, 0, 25, 100], 1.5, 2), 0, 10, 256.0)
+    assert len(total) == 25
+
+
+def test_cannot_replay():
+    unittest_setup()
+    # The kernel connector can't be replayed
+    data = _gen_data(6, [], 1.5, 1)
+    assert not can_replay(data)
+    with pytest.raises(ValueError):
+        replay_expansion(data, 0, 10, 256.0)
@@ -0,0 +1,39 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.utility_models.delays import DelayBlock
+
+
+def test_add_delays():
+    unittest_setup()
+    rng = numpy.random.default_rng(1)
+    vertex_slice = Slice(0, 69)
+    n_delay_stages = 5
+    # Plenty of repeats, so that bits are set more than once and many
+    # connections set bits in the same word
+    source_ids = rng.integers(0, vertex_slice.n_atoms, 200)
+    stages = rng.integers(1, n_delay_stages + 1, 200)
+
+    expected = DelayBlock(n_delay_stages, 16, vertex_slice)
+    for source_id, stage in zip(source_ids, stages):
+        expected.add_delay(source_id, stage)
+    block = DelayBlock(n_delay_stages, 16, vertex_slice)
+    block.add_delays(source_ids, stages)
+    block.add_delays([], [])
+    assert numpy.array_equal(expected.delay_block, block.delay_block)
+    assert block.delay_block.dtype == numpy.uint32
@@ -0,0 +1,63 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import subprocess
+import sys
+import unittest
+
+# Imports spynnaker8, lists the modules imported, then uses things that are
+# only imported when used and lists the modules again
+_SCRIPT = """
+import sys
+import spynnaker8
+print(" ".join(sorted(sys.modules)))
+spynnaker8.external_devices, spynnaker8.extra_models.IF_curr_exp_sEMD
+spynnaker8.CSAConnector
+print(" ".join(sorted(sys.modules)))
+"""
+
+_LAZY_MODULES = [
+    "spynnaker8.external_devices",
+    "spynnaker8.extra_models",
+    "spynnaker.pyNN.models.neuron.builds.if_curr_exp_semd_base",
+    "spynnaker.pyNN.models.neural_projections.connectors.csa_connector"]
+
+
+class TestImportTime(unittest.TestCase):
+
+    # no unittest_setup as this runs in a new interpreter
+
+    @unittest.skipIf(
+        sys.version_info < (3, 7),
+        "Module __getattr__ is needed to import things when used")
+    def test_lazy_imports(self):
+        output = subprocess.check_output(
+            [sys.executable, "-c", _SCRIPT], universal_newlines=True)
+        before, after = (
+            set(line.split()) for line in output.strip().split("\n")[-2:])
+
+        # Things that are only imported when used
+        for module in _LAZY_MODULES:
+            self.assertNotIn(module, before)
+            self.assertIn(module, after)
+
+    def test_lazy_names(self):
+        import spynnaker8 as sim
+        self.assertEqual("IFCurrExpBase", sim.IF_curr_exp.__name__)
+        self.assertEqual(
+            "MultapseConnector", sim.FixedTotalNumberConnector.__name__)
+        self.assertIn("Meanfield", dir(sim.extra_models))
+        with self.assertRaises(AttributeError):
+            sim.NotAModel  # pylint: disable=pointless-statement
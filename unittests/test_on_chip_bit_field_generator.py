@@ -0,0 +1,108 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import struct
+from unittest.mock import Mock
+import numpy
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.extra_algorithms.on_chip_bit_field_generator import (
+    OnChipBitFieldGenerator, _bits_for_neurons)
+
+_BASE_ADDRESS = 0x1000
+_MERGED_FLAG = 0x80000000
+
+
+class _Transceiver(object):
+    """ Reads from a block of memory """
+
+    def __init__(self, memory):
+        self.__memory = memory
+        self.n_reads = 0
+
+    def read_memory(self, x, y, address, n_bytes):
+        self.n_reads += 1
+        start = address - _BASE_ADDRESS
+        return bytes(self.__memory[start:start + n_bytes])
+
+
+def _bitfield_region(bitfields):
+    """ Lay out a bitfield region as the expander does; the header, the\
+        filter_info_t of each bitfield, then the words of the bitfields
+    """
+    n_filters = len(bitfields)
+    pointer = _BASE_ADDRESS + (3 + 3 * n_filters) * 4
+    header = [0, 0, n_filters]
+    filters = list()
+    words = list()
+    for key, n_words_and_flags, field_words in bitfields:
+        filters.extend([key, n_words_and_flags, pointer])
+        words.extend(field_words)
+        pointer += len(field_words) * 4
+    return struct.pack("<{}I".format(len(header + filters + words)),
+                       *(header + filters + words))
+
+
+def _old_bitfields(transceiver):
+    """ How the bitfields were read, two reads per bitfield """
+    _, _, total = struct.unpack(
+        "<III", transceiver.read_memory(0, 0, _BASE_ADDRESS, 12))
+    address = _BASE_ADDRESS + 12
+    for _ in range(total):
+        key, n_words, read_pointer = struct.unpack(
+            "<III", transceiver.read_memory(0, 0, address, 12))
+        address += 12
+        n_words &= 0x3FFFFFFF
+        bitfield = []
+        if n_words:
+            bitfield = struct.unpack("<{}I".format(n_words),
+                                     transceiver.read_memory(
+                                         0, 0, read_pointer, n_words * 4))
+        yield key, n_words * 32, bitfield
+
+
+def _old_bit_for_neuron_id(bitfield, neuron_id):
+    word_id, bit_in_word = divmod(neuron_id, 32)
+    return (bitfield[word_id] >> bit_in_word) & 1
+
+
+def test_read_bitfields():
+    unittest_setup()
+    rng = numpy.random.default_rng(1)
+    memory = _bitfield_region([
+        (0x10000, 2, rng.integers(0, 2**32, 2).tolist()),
+        (0x20000, 0, []),
+        (0x30000, 3 | _MERGED_FLAG, rng.integers(0, 2**32, 3).tolist()),
+        (0x40000, 1, [0xFFFFFFFF])])
+    placement = Mock()
+    placement.vertex.bit_field_base_address.return_value = _BASE_ADDRESS
+
+    generator = OnChipBitFieldGenerator()
+    transceiver = _Transceiver(memory)
+    # pylint: disable=protected-access
+    generator._OnChipBitFieldGenerator__txrx = transceiver
+    bitfields = list(
+        generator._OnChipBitFieldGenerator__bitfields(placement))
+    assert transceiver.n_reads == 3
+
+    expected = list(_old_bitfields(_Transceiver(memory)))
+    assert len(expected) == len(bitfields)
+    for (key, n_bits, bitfield), (old_key, old_n_bits, old_bitfield) in zip(
+            bitfields, expected):
+        assert (key, n_bits) == (old_key, old_n_bits)
+        assert list(bitfield) == list(old_bitfield)
+        for n_neurons in (n_bits, max(n_bits - 5, 0)):
+            assert _bits_for_neurons(bitfield, n_neurons).tolist() == [
+                _old_bit_for_neuron_id(old_bitfield, neuron_id)
+                for neuron_id in range(n_neurons)]
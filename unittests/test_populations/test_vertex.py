@@ -13,16 +13,24 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from unittest.mock import Mock
 import pytest
 import numpy
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.abstract_models import (
+    AbstractRewritesDataSpecification)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.abstract_models import AbstractMaxSpikes
 from spynnaker.pyNN.models.neuron import (
-    AbstractPopulationVertex, AbstractPyNNNeuronModelStandard)
+    AbstractPopulationVertex, AbstractPyNNNeuronModelStandard,
+    abstract_population_vertex)
 from spynnaker.pyNN.models.neuron.synapse_types import AbstractSynapseType
 from spynnaker.pyNN.models.neuron.neuron_models import AbstractNeuronModel
 from spynnaker.pyNN.models.defaults import default_initial_values, defaults
 from spynnaker.pyNN.models.neuron.implementations import (
     AbstractStandardNeuronComponent)
+from spynnaker.pyNN.utilities.state_snapshot import StateSnapshot
 
 
 class EmptyNeuronComponent(AbstractStandardNeuronComponent):
@@ -154,3 +162,115 @@ def test_initial_values():
     assert "bar" in initial_values
     initial_values = neuron.get_initial_values(selector=3)
     assert {"foo": [1], "bar": [11]} == initial_values
+
+
+class _MockRewriter(AbstractRewritesDataSpecification):
+    def __init__(self, vertex_slice):
+        self.vertex_slice = vertex_slice
+        self._reload = False
+
+    def regenerate_data_specification(self, spec, placement):
+        pass
+
+    def reload_required(self):
+        return self._reload
+
+    def set_reload_required(self, new_value):
+        self._reload = new_value
+
+
+def test_reload_only_changed_slices():
+    unittest_setup()
+    neuron = MockNeuron()
+    low = _MockRewriter(Slice(0, 2))
+    high = _MockRewriter(Slice(3, 4))
+    neuron.remember_machine_vertex(low)
+    neuron.remember_machine_vertex(high)
+    neuron.initialize(variable="foo", value=7, selector=4)
+    assert not low.reload_required()
+    assert high.reload_required()
+    high.set_reload_required(False)
+    neuron.initialize(variable="foo", value=7, selector=4)
+    assert not low.reload_required()
+    assert not high.reload_required()
+    neuron.initialize(variable="bar", value=[1, 11, 11, 11, 11])
+    assert low.reload_required()
+    assert not high.reload_required()
+
+
+def test_state_snapshot(tmpdir):
+    unittest_setup()
+    neuron = MockNeuron()
+    neuron.initialize(variable="foo", value=[1, 2, 3, 4, 5])
+    filename = str(tmpdir.join("mock.state"))
+    neuron.get_state_snapshot().save(filename)
+
+    restored = MockNeuron()
+    restored.restore_state_snapshot(StateSnapshot.load(filename))
+    assert [1, 2, 3, 4, 5] == list(restored.get_initial_value("foo"))
+    assert [11, 11, 11, 11, 11] == list(restored.get_initial_value("bar"))
+
+    restored.set_has_run()
+    with pytest.raises(ConfigurationException):
+        restored.restore_state_snapshot(StateSnapshot.load(filename))
+
+
+def test_ring_buffer_upper_bound_arrays():
+    unittest_setup()
+    means = numpy.array([0.5, 1.0, 2.0, 0.1])
+    std_devs = numpy.array([0.0, 0.5, 1.0, 0.05])
+    rates = numpy.array([10.0, 50.0, 100.0, 0.0])
+    n_synapses = numpy.array([100, 1000, 10, 500])
+    bounds = AbstractPopulationVertex._ring_buffer_expected_upper_bound(
+        means, std_devs, rates, n_synapses, 5.0)
+    for i, bound in enumerate(bounds):
+        assert bound == pytest.approx(
+            AbstractPopulationVertex._ring_buffer_expected_upper_bound(
+                means[i], std_devs[i], rates[i], n_synapses[i], 5.0))
+    # No input gives no bound
+    assert bounds[3] == 0.0
+    # The spread of the weights adds to the bound
+    no_spread = AbstractPopulationVertex._ring_buffer_expected_upper_bound(
+        means[1], 0.0, rates[1], n_synapses[1], 5.0)
+    assert bounds[1] > no_spread
+
+
+class _MaxSpikesVertex(AbstractMaxSpikes):
+    def __init__(self):
+        self.rate = 10.0
+
+    def max_spikes_per_second(self):
+        return self.rate
+
+    def max_spikes_per_ts(self):
+        return 1
+
+
+class _MockProjection(object):
+    def __init__(self, pre_vertex):
+        self._projection_edge = Mock(pre_vertex=pre_vertex)
+
+
+def test_ring_buffer_shifts_follow_input_rates(monkeypatch):
+    unittest_setup()
+    monkeypatch.setattr(
+        abstract_population_vertex, "machine_time_step", lambda: 1000)
+    rates = list()
+
+    def compute(self, incoming_projections):
+        rates.append(incoming_projections[0]._projection_edge.pre_vertex.rate)
+        return [len(rates)]
+
+    monkeypatch.setattr(
+        AbstractPopulationVertex,
+        "_AbstractPopulationVertex__compute_ring_buffer_shifts", compute)
+    neuron = MockNeuron()
+    source = _MaxSpikesVertex()
+    projections = [_MockProjection(source)]
+    assert neuron.get_ring_buffer_shifts(projections) == [1]
+    assert neuron.get_ring_buffer_shifts(projections) == [1]
+
+    # A faster source needs the shifts to be worked out again
+    source.rate = 100.0
+    assert neuron.get_ring_buffer_shifts(projections) == [2]
+    assert rates == [10.0, 100.0]
@@ -0,0 +1,45 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import os
+import tempfile
+from spinnaker_testbase import BaseTestCase
+from spynnaker.pyNN.utilities.meanfield_benchmark import (
+    fit_cost_curve, main, VERSION)
+
+
+class TestMeanfieldBenchmark(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def test_fit_cost_curve(self):
+        fit = fit_cost_curve([1, 2, 4], [1.5, 2.5, 4.5])
+        self.assertAlmostEqual(1.0, fit["per_unit"])
+        self.assertAlmostEqual(0.5, fit["fixed"])
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "meanfield_benchmark.json")
+            main(["-o", filename, "--units", "2,4", "--samples", "10,20",
+                  "--substeps", "1,2", "--repeats", "1"])
+            with open(filename) as f:
+                results = json.load(f)
+        self.assertEqual(VERSION, results["version"])
+        for name in ("units", "samples", "substeps"):
+            self.assertEqual(2, len(results["host_model"][name]["seconds"]))
+        self.assertEqual([2, 4], results["recording_decode"]["sizes"])
+        for name in ("mapping", "data_generation", "parameter_encoding",
+                     "parameter_decoding"):
+            self.assertEqual([2, 4], results["virtual_board"][name]["sizes"])
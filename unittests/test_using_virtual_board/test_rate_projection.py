@@ -0,0 +1,56 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinnaker_testbase import BaseTestCase
+import spynnaker8 as sim
+
+
+class TestRateProjection(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def test_rate_projection(self):
+        sim.setup(timestep=1.0)
+        pre = sim.Population(4, sim.extra_models.Meanfield(), label="pre")
+        post = sim.Population(3, sim.extra_models.Meanfield(), label="post")
+        lif = sim.Population(2, sim.IF_curr_exp(), label="lif")
+
+        projection = sim.extra_models.RateProjection(
+            pre, post, 0.5, source="Vi", receptor_type="inhibitory")
+        self.assertTrue(numpy.array_equal(
+            numpy.full((4, 3), 0.5), projection.weights))
+        self.assertTrue(projection.source_is_vi)
+        self.assertEqual(1, projection.receptor)
+        weights = numpy.arange(12).reshape(4, 3) / 12.0
+        projection = sim.extra_models.RateProjection(pre, post, weights)
+        self.assertTrue(numpy.array_equal(weights, projection.weights))
+        self.assertFalse(projection.source_is_vi)
+        self.assertEqual(0, projection.receptor)
+
+        with self.assertRaises(ConfigurationException):
+            sim.extra_models.RateProjection(pre, post, numpy.ones((3, 4)))
+        with self.assertRaises(ConfigurationException):
+            sim.extra_models.RateProjection(pre, post, 1.0, source="V")
+        with self.assertRaises(ConfigurationException):
+            sim.extra_models.RateProjection(
+                pre, post, 1.0, receptor_type="shunting")
+        with self.assertRaises(ConfigurationException):
+            sim.extra_models.RateProjection(pre, lif, 1.0)
+
+        # The rate coupling regions are written within their sizes
+        sim.run(10)
+        sim.end()
@@ -0,0 +1,79 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from pyNN.random import NumpyRNG, RandomDistribution
+from spinn_utilities.config_holder import set_config
+from spinn_front_end_common.utilities.globals_variables import get_simulator
+import spynnaker8 as sim
+from spinnaker_testbase import BaseTestCase
+
+
+class TestThreadedDSG(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def generate(self, n_dsg_threads):
+        """ Build a network and generate its data specifications with the
+            given number of threads
+
+        :return: The connections of each projection, the data specification
+            of each core, and the region sizes of each core
+        """
+        sim.setup(1.0)
+        set_config("Mapping", "n_dsg_threads", n_dsg_threads)
+        sim.set_number_of_neurons_per_core(sim.IF_curr_exp, 10)
+        rng = NumpyRNG(seed=42)
+        pre = sim.Population(
+            30, sim.SpikeSourceArray(spike_times=[0]), label="pre")
+        projections = list()
+        for i in range(3):
+            post = sim.Population(30, sim.IF_curr_exp(), label=f"post{i}")
+            # Projections that share a random number generator
+            projections.append(sim.Projection(
+                pre, post, sim.FixedProbabilityConnector(0.3, rng=rng),
+                sim.StaticSynapse(
+                    weight=RandomDistribution("uniform", (1, 2), rng=rng),
+                    delay=RandomDistribution("uniform", (1, 30), rng=rng))))
+            # A projection with its own generator
+            projections.append(sim.Projection(
+                post, post, sim.FixedProbabilityConnector(
+                    0.2, rng=NumpyRNG(seed=i)),
+                sim.StaticSynapse(weight=1.0, delay=2.0)))
+        sim.run(0)
+        connections = [
+            list(proj.get(["weight", "delay"], "list"))
+            for proj in projections]
+        # A virtual board doesn't load, so the data specifications are only
+        # in the outputs of the data generation
+        # pylint: disable=protected-access
+        outputs = get_simulator()._mapping_outputs
+        specs = {core: data.read() for core, data in
+                 outputs["DataSpecificationTargets"].items()}
+        region_sizes = dict(outputs["RegionSizes"])
+        sim.end()
+        return connections, specs, region_sizes
+
+    def test_threads_match(self):
+        connections, specs, region_sizes = self.generate(1)
+        threaded_connections, threaded_specs, threaded_region_sizes = \
+            self.generate(4)
+        self.assertEqual(connections, threaded_connections)
+        self.assertEqual(region_sizes, threaded_region_sizes)
+
+        # Each core gets exactly the same bytes, so the regions, pointer
+        # tables and headers are all in the same place
+        self.assertTrue(specs)
+        self.assertEqual(sorted(specs), sorted(threaded_specs))
+        for core, spec in specs.items():
+            self.assertEqual(spec, threaded_specs[core], core)
@@ -15,12 +15,57 @@
 
 import os
 import shutil
+import tempfile
+import threading
+import time
 import unittest
+import numpy
 from pyNN.random import RandomDistribution
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spynnaker.pyNN.config_setup import unittest_setup
+from spinn_machine.virtual_machine import virtual_machine
+from pacman.model.placements import Placement
 from spynnaker.pyNN.utilities import utility_calls
 
 
+class _LatentTransceiver(object):
+    """ Reads take a while and count how many are in flight at once """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__in_flight = 0
+        self.max_in_flight = 0
+
+    def read_memory(self, x, y, address, n_bytes):
+        with self.__lock:
+            self.__in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.__in_flight)
+        time.sleep(0.05)
+        with self.__lock:
+            self.__in_flight -= 1
+        return bytes([x, y, address, n_bytes])
+
+
+class _ReadVertex(object):
+    def __init__(self, x, y, address):
+        self.vertex_slice = address
+        self.placement = Placement(self, x, y, 1)
+        self.data = None
+
+    def read_parameter_data(self, transceiver, placement, vertex_slice):
+        return transceiver.read_memory(
+            placement.x, placement.y, vertex_slice, 4)
+
+    def update_parameters_from_data(self, data, vertex_slice):
+        self.data = data
+
+
+class _Placements(object):
+    def get_placement_of_vertex(self, vertex):
+        return vertex.placement
+
+
 class TestUtilityCalls(unittest.TestCase):
 
     def setUp(self):
@@ -57,6 +102,64 @@ class TestUtilityCalls(unittest.TestCase):
         self.assertTrue(hasattr(multi_value, "__iter__"))
         self.assertEqual(len(multi_value), 10)
 
+    def test_convert_array_to(self):
+        values = [0.0, 0.25, -1.5, 3.75, 100.1, -65536.0]
+        for data_type in (DataType.S1615, DataType.INT32, DataType.UINT16):
+            self.assertTrue(numpy.array_equal(
+                [utility_calls.convert_to(v, data_type) for v in values
+                 if data_type.min <= v],
+                utility_calls.convert_array_to(
+                    [v for v in values if data_type.min <= v], data_type)))
+        with self.assertRaises(ValueError):
+            utility_calls.convert_array_to([0.5, 1.0], DataType.U032)
+
+    def test_read_parameters_before_set(self):
+        # Three chips on each of two boards of the machine
+        machine = virtual_machine(width=12, height=12)
+        vertices = [_ReadVertex(x, y, address)
+                    for x, y in [(0, 0), (1, 1), (2, 3), (8, 4), (9, 5)]
+                    for address in range(3)]
+        transceiver = _LatentTransceiver()
+        utility_calls.read_parameters_before_set(
+            vertices, transceiver, _Placements(), machine)
+        for vertex in vertices:
+            self.assertEqual(
+                bytes([vertex.placement.x, vertex.placement.y,
+                       vertex.vertex_slice, 4]),
+                vertex.data)
+        # One read per board at a time, but boards read at the same time
+        self.assertEqual(2, transceiver.max_in_flight)
+
+    def test_read_spikes_from_file(self):
+        spikes = numpy.array([[5.0, 1], [2.0, 0], [1.0, 1], [7.0, 3]])
+        expected = [[0.0, 2.0], [1.0, 1.0], [1.0, 5.0]]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            text_file = os.path.join(tmpdir, "spikes.txt")
+            with open(text_file, "w") as f:
+                f.write("# time\tneuron\n")
+                f.writelines("{}\t{}\n".format(t, n) for t, n in spikes)
+            numpy_file = os.path.join(tmpdir, "spikes.npy")
+            numpy.save(numpy_file, spikes)
+            binary_file = os.path.join(tmpdir, "spikes.bin")
+            spikes.tofile(binary_file)
+            for path in (text_file, numpy_file, binary_file):
+                self.assertEqual(expected, utility_calls.read_spikes_from_file(
+                    path, max_atom=3, max_time=6).tolist())
+
+            # Expressions are still allowed
+            with open(text_file, "w") as f:
+                f.write("2 * 2\t1\n1.0\t1\n")
+            self.assertEqual(
+                [[1.0, 1.0], [1.0, 4.0]],
+                utility_calls.read_spikes_from_file(text_file).tolist())
+
+            # Malformed lines are reported as configuration errors
+            for text in ("1.0\t1\n2.0\n", "1.0\t1\nnot_a_time\t2\n"):
+                with open(text_file, "w") as f:
+                    f.write(text)
+                with self.assertRaises(ConfigurationException):
+                    utility_calls.read_spikes_from_file(text_file)
+
 
 if __name__ == '__main__':
     unittest.main()